@@ -1,15 +1,58 @@
 'use client'
 
-import { useState } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import Link from 'next/link'
 
+interface ImportProgress {
+  status: 'queued' | 'running' | 'succeeded' | 'failed'
+  total: number
+  changed: number
+  done: number
+  deleted: number
+  unchanged: number
+  skipped: number
+  rowsPerSecond: number
+  message: string | null
+  error: string | null
+}
+
 export default function AdminPage() {
   const [importing, setImporting] = useState(false)
   const [message, setMessage] = useState<string | null>(null)
+  const [progress, setProgress] = useState<ImportProgress | null>(null)
+  const eventSource = useRef<EventSource | null>(null)
+
+  useEffect(() => () => eventSource.current?.close(), [])
+
+  // Follows a background import job over Server-Sent Events until it finishes.
+  // The server ends each stream after a while; EventSource then reconnects.
+  const followJob = (jobId: string) => {
+    eventSource.current?.close()
+    const source = new EventSource(`/api/admin/import/events?job=${jobId}`)
+    eventSource.current = source
+
+    source.onmessage = (event) => {
+      const job: ImportProgress = JSON.parse(event.data)
+      setProgress(job)
+      if (job.status === 'queued' || job.status === 'running') return
+
+      source.close()
+      setImporting(false)
+      setMessage(job.status === 'succeeded' ? `Success! ${job.message}.` : `Error: ${job.error}`)
+    }
+    source.onerror = () => {
+      // Still CONNECTING means EventSource is reconnecting on its own
+      if (source.readyState !== EventSource.CLOSED) return
+      source.close()
+      setImporting(false)
+      setMessage('Error: lost connection to the import job')
+    }
+  }
 
   const handleImport = async () => {
     setImporting(true)
     setMessage(null)
+    setProgress(null)
     
     try {
       const response = await fetch('/api/admin/import', {
@@ -17,14 +60,15 @@ export default function AdminPage() {
       })
       const data = await response.json()
       
-      if (response.ok) {
-        setMessage(`Success! Imported ${data.count} words.`)
+      if (response.ok || data.jobId) {
+        // 409 means an import is already running; follow that one instead
+        followJob(data.jobId)
       } else {
         setMessage(`Error: ${data.error}`)
+        setImporting(false)
       }
     } catch (error: any) {
       setMessage(`Error: ${error.message}`)
-    } finally {
       setImporting(false)
     }
   }
@@ -101,6 +145,20 @@ export default function AdminPage() {
             {importing ? 'Importing...' : 'Import Vocabulary'}
           </button>
 
+          {progress && progress.status === 'queued' && (
+            <div style={{ marginBottom: '16px', color: '#6b7280' }}>
+              Waiting for the import worker to start...
+            </div>
+          )}
+
+          {progress && progress.status === 'running' && (
+            <div style={{ marginBottom: '16px', color: '#6b7280' }}>
+              {progress.done} of {progress.changed} changed words written
+              {progress.rowsPerSecond > 0 && ` (${progress.rowsPerSecond} rows/s)`}, {progress.unchanged} unchanged,{' '}
+              {progress.deleted} to remove, {progress.skipped} skipped
+            </div>
+          )}
+
           {message && (
             <div
               style={{
@@ -121,7 +179,7 @@ export default function AdminPage() {
             <li>
               The vocabulary file at <code>data/sats_vocab.json</code> must exist before importing
             </li>
-            <li>Importing will replace all existing words in the database</li>
+            <li>Importing only updates words that changed; progress on removed words is deleted</li>
             <li>Only words from the official SAT vocabulary list should be used</li>
             <li>The app will not start if the vocabulary file is missing</li>
           </ul>
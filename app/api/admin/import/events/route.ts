@@ -0,0 +1,77 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getImportJob, latestImportJob } from '@/lib/import-jobs'
+
+export const dynamic = 'force-dynamic'
+
+const POLL_INTERVAL_MS = 1000
+// Serverless responses are time-limited, so a stream ends after this long and
+// EventSource reconnects (after the retry delay) to a fresh one
+const STREAM_DURATION_MS = 20 * 1000
+const RETRY_MS = 1000
+
+// Server-Sent Events stream of an import job, read from the ImportJob table: a
+// message with the job state on connect and whenever it changes, closed once
+// the job has finished
+export async function GET(request: NextRequest) {
+  const id = request.nextUrl.searchParams.get('job')
+  const job = id ? await getImportJob(id) : await latestImportJob()
+  if (!job) {
+    return NextResponse.json(
+      { error: 'Import job not found' },
+      { status: 404 }
+    )
+  }
+
+  const encoder = new TextEncoder()
+  let closed = false
+  let timer: ReturnType<typeof setTimeout> | undefined
+
+  const stream = new ReadableStream({
+    start(controller) {
+      const deadline = Date.now() + STREAM_DURATION_MS
+      let last = ''
+
+      const close = () => {
+        if (closed) return
+        closed = true
+        controller.close()
+      }
+
+      const poll = async () => {
+        if (closed) return
+        try {
+          const update = await getImportJob(job.id)
+          if (!update) return close()
+
+          const data = JSON.stringify(update)
+          if (data !== last) {
+            last = data
+            controller.enqueue(encoder.encode(`data: ${data}\n\n`))
+          }
+          if (update.status === 'succeeded' || update.status === 'failed' || Date.now() >= deadline) {
+            return close()
+          }
+        } catch {
+          // The client reconnects and picks up from the current state
+          return close()
+        }
+        timer = setTimeout(poll, POLL_INTERVAL_MS)
+      }
+
+      controller.enqueue(encoder.encode(`retry: ${RETRY_MS}\n\n`))
+      void poll()
+    },
+    cancel() {
+      closed = true
+      clearTimeout(timer)
+    },
+  })
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache, no-transform',
+      Connection: 'keep-alive',
+    },
+  })
+}
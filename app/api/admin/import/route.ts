@@ -1,97 +1,49 @@
-import { NextResponse } from 'next/server'
-import { PrismaClient } from '@prisma/client'
-import { loadVocabFile } from '@/lib/vocab-check'
+import { NextRequest, NextResponse } from 'next/server'
+import {
+  activeImportJob,
+  createImportJob,
+  dispatchImportJob,
+  failImportJob,
+  getImportJob,
+  latestImportJob,
+} from '@/lib/import-jobs'
 
-const prisma = new PrismaClient()
+export const dynamic = 'force-dynamic'
 
-interface VocabEntry {
-  word: string
-  partOfSpeech?: string
-  definition: string
-  synonyms?: string[] | string
-  exampleSentence?: string
-  difficulty?: string
-}
-
-function determineDifficulty(word: string, definition: string): string {
-  const length = word.length
-  const defLength = definition.length
-  
-  if (length <= 5 && defLength <= 50) return 'easy'
-  if (length >= 10 || defLength >= 100) return 'hard'
-  return 'medium'
-}
+// Queues a background import and returns its job id; progress is streamed from
+// /api/admin/import/events?job=<id>
+export async function POST(request: NextRequest) {
+  const job = await createImportJob()
+  if (!job) {
+    const active = await activeImportJob()
+    return NextResponse.json(
+      { error: 'An import is already running', jobId: active?.id },
+      { status: 409 }
+    )
+  }
 
-export async function POST() {
   try {
-    const vocab = loadVocabFile()
-    
-    // Clear existing words
-    await prisma.word.deleteMany({})
-    
-    let imported = 0
-    let skipped = 0
-    
-    for (const entry of vocab) {
-      try {
-        // Skip placeholder entries
-        if (entry._note || entry._source || entry._format) {
-          continue
-        }
-        
-        const vocabEntry = entry as VocabEntry
-        
-        if (!vocabEntry.word || !vocabEntry.definition) {
-          skipped++
-          continue
-        }
-        
-        const synonyms = Array.isArray(vocabEntry.synonyms)
-          ? JSON.stringify(vocabEntry.synonyms)
-          : typeof vocabEntry.synonyms === 'string'
-          ? vocabEntry.synonyms
-          : null
-        
-        const difficulty = vocabEntry.difficulty || determineDifficulty(
-          vocabEntry.word,
-          vocabEntry.definition
-        )
-        
-        await prisma.word.create({
-          data: {
-            word: vocabEntry.word.toLowerCase().trim(),
-            partOfSpeech: vocabEntry.partOfSpeech || null,
-            definition: vocabEntry.definition,
-            synonyms: synonyms,
-            exampleSentence: vocabEntry.exampleSentence || null,
-            difficulty: difficulty,
-          },
-        })
-        
-        imported++
-      } catch (error: any) {
-        if (error.code === 'P2002') {
-          skipped++
-        } else {
-          console.error(`Error importing word ${entry.word}:`, error.message)
-          skipped++
-        }
-      }
-    }
-    
-    return NextResponse.json({
-      success: true,
-      count: imported,
-      skipped,
-      message: `Imported ${imported} words, skipped ${skipped}`,
-    })
+    await dispatchImportJob(job.id, request.nextUrl.origin)
   } catch (error: any) {
+    await failImportJob(job.id, error.message)
     return NextResponse.json(
-      { error: error.message },
-      { status: 500 }
+      { error: error.message, jobId: job.id },
+      { status: 502 }
     )
-  } finally {
-    await prisma.$disconnect()
   }
+
+  return NextResponse.json({ jobId: job.id, job }, { status: 202 })
 }
 
+// Status of one job (?job=<id>), or of the most recent one
+export async function GET(request: NextRequest) {
+  const id = request.nextUrl.searchParams.get('job')
+  const job = id ? await getImportJob(id) : await latestImportJob()
+  if (!job) {
+    return NextResponse.json(
+      { error: 'Import job not found' },
+      { status: 404 }
+    )
+  }
+  return NextResponse.json(job)
+}
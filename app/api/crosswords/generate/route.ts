@@ -1,6 +1,33 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { CrosswordGenerator } from '@/lib/crossword-generator'
+import { claimPooledCrossword, loadCandidateWords, refillPoolIfLow, saveCrossword } from '@/lib/crossword-pool'
+
+type StoredCrossword = NonNullable<Awaited<ReturnType<typeof claimPooledCrossword>>>
+
+function storedCrosswordResponse(crossword: StoredCrossword) {
+  const clues = JSON.parse(crossword.clues)
+  return {
+    id: crossword.id,
+    seed: crossword.seed,
+    grid: JSON.parse(crossword.grid),
+    words: crossword.crosswordWords.map((cw) => ({
+      word: cw.word,
+      position: JSON.parse(cw.position),
+      clue: clues[cw.word.word] || cw.word.definition,
+    })),
+  }
+}
+
+// Starts a pool refill when the claim left the pool low; a refill that could
+// not be started is logged and retried on a later claim, not reported to the caller
+async function refillPool(difficulty: string, wordCount: number, origin: string) {
+  try {
+    await refillPoolIfLow(difficulty, wordCount, origin)
+  } catch (error) {
+    console.error('Crossword pool refill error:', error)
+  }
+}
 
 export async function POST(request: NextRequest) {
   try {
@@ -22,16 +49,7 @@ export async function POST(request: NextRequest) {
       })
       
       if (existing) {
-        return NextResponse.json({
-          id: existing.id,
-          seed: existing.seed,
-          grid: JSON.parse(existing.grid),
-          words: existing.crosswordWords.map((cw) => ({
-            word: cw.word,
-            position: JSON.parse(cw.position),
-            clue: JSON.parse(existing.clues)[cw.word.word] || cw.word.definition,
-          })),
-        })
+        return NextResponse.json(storedCrosswordResponse(existing))
       }
     }
     
@@ -52,16 +70,17 @@ export async function POST(request: NextRequest) {
         )
       }
       
-      // Get words by difficulty
-      words = await prisma.word.findMany({
-        where: { difficulty },
-      })
-      
-      if (words.length < wordCount) {
-        // Fallback to all words if not enough for difficulty
-        const allWords = await prisma.word.findMany({})
-        words.push(...allWords.filter((w) => !words.find((dw) => dw.id === w.id)))
+      // Hand out a pre-generated puzzle when the pool has one
+      if (!seed) {
+        const pooled = await claimPooledCrossword(difficulty, wordCount)
+        await refillPool(difficulty, wordCount, request.nextUrl.origin)
+        if (pooled) {
+          return NextResponse.json(storedCrosswordResponse(pooled))
+        }
       }
+      
+      // Get words by difficulty
+      words = await loadCandidateWords(difficulty, wordCount)
     }
     
     if (words.length === 0) {
@@ -88,36 +107,7 @@ export async function POST(request: NextRequest) {
     }
     
     // Save to database
-    const finalSeed = seed || result.seed
-    const clues: Record<string, string> = {}
-    result.words.forEach((cw) => {
-      clues[cw.word.word] = cw.clue
-    })
-    
-    const crossword = await prisma.crossword.create({
-      data: {
-        seed: finalSeed,
-        wordCount: result.words.length,
-        difficulty,
-        grid: JSON.stringify(result.grid),
-        clues: JSON.stringify(clues),
-        words: JSON.stringify(
-          result.words.map((w) => ({
-            word: w.word.word,
-            position: w.position,
-          }))
-        ),
-        crosswordWords: {
-          create: result.words.map((w) => ({
-            wordId: w.word.id,
-            position: JSON.stringify(w.position),
-          })),
-        },
-      },
-      include: {
-        crosswordWords: { include: { word: true } },
-      },
-    })
+    const crossword = await saveCrossword(result, difficulty, seed || result.seed)
     
     return NextResponse.json({
       id: crossword.id,
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
+import { invalidateMasteryTables } from '@/lib/word-sampling'
 
 export async function POST(request: NextRequest) {
   try {
@@ -50,6 +51,9 @@ export async function POST(request: NextRequest) {
           },
         })
     
+    // Weighted study sets pick up the new mastery level on the next draw
+    invalidateMasteryTables(userId || null)
+    
     return NextResponse.json(progress)
   } catch (error: any) {
     return NextResponse.json(
@@ -1,5 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { prisma } from '@/lib/prisma'
+import { getTermIndex } from '@/lib/vocab-terms'
+import { getWordCache } from '@/lib/word-cache'
+import { getMasteryTable, sampleUniform, sampleWeighted } from '@/lib/word-sampling'
+import { getWordSearchIndex } from '@/lib/word-search'
 
 export async function GET(request: NextRequest) {
   try {
@@ -7,41 +10,76 @@ export async function GET(request: NextRequest) {
     const difficulty = searchParams.get('difficulty')
     const limit = searchParams.get('limit')
     const random = searchParams.get('random') === 'true'
+    const weighted = searchParams.get('weighted') === 'mastery'
+    const userId = searchParams.get('userId')
     const ids = searchParams.get('ids')
+    const meaning = searchParams.get('meaning')
+    const related = searchParams.get('related')
+    const q = searchParams.get('q')
+    
+    // Every query is answered from the in-process copy of the Word table
+    const cache = await getWordCache()
     
     // If IDs are provided (comma-separated), fetch those specific words
     if (ids) {
       const idArray = ids.split(',').filter(id => id.trim())
-      const words = await prisma.word.findMany({
-        where: { id: { in: idArray } },
-      })
+      const words = idArray.map(id => cache.get(id.trim())).filter(word => word !== undefined)
       return NextResponse.json(words)
     }
     
-    const where: any = {}
-    if (difficulty && ['easy', 'medium', 'hard'].includes(difficulty)) {
-      where.difficulty = difficulty
+    const level = difficulty && ['easy', 'medium', 'hard'].includes(difficulty) ? difficulty : null
+    const inLevel = (word: { difficulty: string }) => !level || word.difficulty === level
+    
+    if (limit && !/^\d+$/.test(limit)) {
+      return NextResponse.json(
+        { error: 'limit must be a non-negative integer' },
+        { status: 400 }
+      )
+    }
+    const take = limit ? Number.parseInt(limit, 10) : undefined
+    
+    // Search results are filtered by difficulty inside the index scans, so the
+    // limit counts only words of the requested level
+    const accept = (headword: string) => {
+      const word = cache.getByWord(headword)
+      return word !== undefined && inLevel(word)
     }
     
-    const take = limit ? parseInt(limit) : undefined
+    // Headword search: prefix completions, then close misspellings, from an
+    // in-memory index rather than LIKE scans
+    if (q) {
+      const index = await getWordSearchIndex()
+      const matches = index.search(q, take || 10, accept)
+      return NextResponse.json(matches.map(match => cache.getByWord(match.word)))
+    }
+    
+    // Words by meaning or related to a word, ranked through the prebuilt
+    // definition term index instead of scanning definitions
+    if (meaning || related) {
+      const index = getTermIndex(cache)
+      if (!index) {
+        return NextResponse.json(
+          { error: 'Term index not found. Run python3 scripts/index-vocab.py first.' },
+          { status: 503 }
+        )
+      }
+      const matches = meaning
+        ? index.search(meaning, take || 20, accept)
+        : index.related((related as string).toLowerCase().trim(), take || 10, accept)
+      return NextResponse.json(matches.map(match => cache.getByWord(match.word)))
+    }
     
+    const pool = cache.list(level)
     let words
     if (random) {
-      const count = await prisma.word.count({ where })
-      const skip = Math.floor(Math.random() * Math.max(0, count - (take || count)))
-      words = await prisma.word.findMany({
-        where,
-        take,
-        skip,
-      })
-      // Shuffle the results
-      words = words.sort(() => Math.random() - 0.5)
+      // Sampled across the whole bucket rather than a window of neighbouring rows;
+      // weighted=mastery favours words the learner has not mastered yet
+      const count = take === undefined ? pool.length : take
+      words = weighted
+        ? sampleWeighted(pool, await getMasteryTable(cache, userId, level), count)
+        : sampleUniform(pool, count)
     } else {
-      words = await prisma.word.findMany({
-        where,
-        take,
-        orderBy: { word: 'asc' },
-      })
+      words = take === undefined ? pool : pool.slice(0, take)
     }
     
     return NextResponse.json(words)
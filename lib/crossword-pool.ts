@@ -0,0 +1,165 @@
+import { prisma } from './prisma'
+import { CrosswordGenerator } from './crossword-generator'
+import { runsOnServerless } from './serverless'
+
+// Pre-generated crossword pool. scripts/fill-crossword-pool.ts stores
+// validated puzzles with pooled = true, and POST /api/crosswords/generate
+// claims one instead of generating inside the request. When a claim leaves
+// fewer than POOL_LOW_WATER puzzles, the route starts a refill: the
+// fill-crossword-pool-background Netlify function on serverless deploys, or
+// the server process itself under next start / next dev.
+
+export const POOL_DIFFICULTIES = ['easy', 'medium', 'hard'] as const
+export const POOL_WORD_COUNTS = [10, 15, 20] as const
+export const DEFAULT_POOL_TARGET = 20
+export const POOL_LOW_WATER = 5
+export const POOL_REFILL_PATH = '/.netlify/functions/fill-crossword-pool-background'
+
+// A refill takes a while to show up in the pool, so one instance starts at
+// most one per difficulty and size in this window
+const REFILL_INTERVAL_MS = 60 * 1000
+
+const GRID_SIZE = 15
+const CLAIM_ATTEMPTS = 5
+// Concurrent requests pick among the oldest few puzzles so they rarely race for the same row
+const CLAIM_SPREAD = 5
+
+type GenerationResult = ReturnType<CrosswordGenerator['generate']>
+
+// Words for a difficulty, topped up with the rest of the table when the bucket is too small
+export async function loadCandidateWords(difficulty: string, wordCount: number) {
+  const words = await prisma.word.findMany({
+    where: { difficulty },
+  })
+
+  if (words.length < wordCount) {
+    const allWords = await prisma.word.findMany({})
+    words.push(...allWords.filter((w) => !words.find((dw) => dw.id === w.id)))
+  }
+  return words
+}
+
+export async function saveCrossword(
+  result: GenerationResult,
+  difficulty: string,
+  seed: string,
+  pooled = false
+) {
+  const clues: Record<string, string> = {}
+  result.words.forEach((cw) => {
+    clues[cw.word.word] = cw.clue
+  })
+
+  return prisma.crossword.create({
+    data: {
+      seed,
+      wordCount: result.words.length,
+      difficulty,
+      pooled,
+      grid: JSON.stringify(result.grid),
+      clues: JSON.stringify(clues),
+      words: JSON.stringify(
+        result.words.map((w) => ({
+          word: w.word.word,
+          position: w.position,
+        }))
+      ),
+      crosswordWords: {
+        create: result.words.map((w) => ({
+          wordId: w.word.id,
+          position: JSON.stringify(w.position),
+        })),
+      },
+    },
+  })
+}
+
+// Takes a pooled puzzle out of the pool, or returns null when the pool is empty
+export async function claimPooledCrossword(difficulty: string, wordCount: number) {
+  for (let attempt = 0; attempt < CLAIM_ATTEMPTS; attempt++) {
+    const candidates = await prisma.crossword.findMany({
+      where: { pooled: true, difficulty, wordCount },
+      select: { id: true },
+      orderBy: { createdAt: 'asc' },
+      take: CLAIM_SPREAD,
+    })
+    if (candidates.length === 0) return null
+
+    const { id } = candidates[Math.floor(Math.random() * candidates.length)]
+    // Only one request can flip pooled from true to false
+    const claimed = await prisma.crossword.updateMany({
+      where: { id, pooled: true },
+      data: { pooled: false },
+    })
+    if (claimed.count === 1) {
+      return prisma.crossword.findUnique({
+        where: { id },
+        include: { crosswordWords: { include: { word: true } } },
+      })
+    }
+  }
+  return null
+}
+
+export async function countPooledCrosswords(difficulty: string, wordCount: number) {
+  return prisma.crossword.count({
+    where: { pooled: true, difficulty, wordCount },
+  })
+}
+
+// Generates and stores puzzles until the pool for a difficulty and size holds target puzzles.
+// Only puzzles that place every requested word are kept.
+export async function fillPool(
+  difficulty: string,
+  wordCount: number,
+  target: number = DEFAULT_POOL_TARGET,
+  maxFailures: number = target * 5
+) {
+  const pooled = await countPooledCrosswords(difficulty, wordCount)
+  const words = await loadCandidateWords(difficulty, wordCount)
+  let created = 0
+  let failed = 0
+
+  while (pooled + created < target && failed < maxFailures && words.length >= wordCount) {
+    const generator = new CrosswordGenerator(GRID_SIZE)
+    const result = generator.generate(words, wordCount, difficulty)
+    if (!result.success || result.words.length !== wordCount) {
+      failed++
+      continue
+    }
+    await saveCrossword(result, difficulty, `pool-${result.seed}-${Math.random().toString(36).slice(2, 10)}`, true)
+    created++
+  }
+
+  return { pooled: pooled + created, created, failed }
+}
+
+const lastRefill = new Map<string, number>()
+
+// Tops the pool for a difficulty and size back up to DEFAULT_POOL_TARGET once
+// it holds fewer than POOL_LOW_WATER puzzles. Returns whether a refill was started.
+export async function refillPoolIfLow(difficulty: string, wordCount: number, origin: string) {
+  const key = `${difficulty}/${wordCount}`
+  const now = Date.now()
+  if (now - (lastRefill.get(key) ?? 0) < REFILL_INTERVAL_MS) return false
+  if ((await countPooledCrosswords(difficulty, wordCount)) >= POOL_LOW_WATER) return false
+  lastRefill.set(key, now)
+
+  if (!runsOnServerless()) {
+    void fillPool(difficulty, wordCount).catch((error) => {
+      console.error(`Refilling the crossword pool for ${key} failed:`, error)
+    })
+    return true
+  }
+
+  const response = await fetch(new URL(POOL_REFILL_PATH, origin), {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ difficulty, wordCount }),
+  })
+  if (!response.ok) {
+    lastRefill.delete(key)
+    throw new Error(`Crossword pool worker did not accept the refill (HTTP ${response.status})`)
+  }
+  return true
+}
@@ -0,0 +1,232 @@
+import { Prisma, type ImportJob as ImportJobRow } from '@prisma/client'
+import { prisma } from './prisma'
+import { runsOnServerless } from './serverless'
+import { loadVocabFile } from './vocab-check'
+import { prepareWordRows, syncWords } from './vocab-import'
+import { invalidateWordCache } from './word-cache'
+
+// Background vocabulary imports for the admin page. POST /api/admin/import
+// records a queued job in the ImportJob table and hands it to a worker: the
+// import-vocab-background Netlify function on serverless deploys, where a
+// function instance may be frozen as soon as it has responded, or the server
+// process itself under next start / next dev. The worker claims the job and
+// writes its progress to the row, so GET /api/admin/import?job= and the
+// /api/admin/import/events?job= stream read the same state on any instance.
+
+export type ImportJobStatus = 'queued' | 'running' | 'succeeded' | 'failed'
+
+export interface ImportJob {
+  id: string
+  status: ImportJobStatus
+  total: number // words in the dataset
+  changed: number // new and edited words to write
+  done: number // words written so far
+  deleted: number
+  unchanged: number
+  skipped: number
+  rowsPerSecond: number
+  startedAt: string
+  finishedAt: string | null
+  message: string | null
+  error: string | null
+}
+
+export const IMPORT_WORKER_PATH = '/.netlify/functions/import-vocab-background'
+
+const MAX_FINISHED_JOBS = 20
+const ACTIVE_STATUSES: ImportJobStatus[] = ['queued', 'running']
+
+// A queued job no worker has claimed within a minute was never picked up. A
+// running job's progress writes can wait for the import transaction to commit,
+// so it only counts as lost once a background function would have timed out.
+const QUEUED_TIMEOUT_MS = 60 * 1000
+const RUNNING_TIMEOUT_MS = 15 * 60 * 1000
+
+const STALE_JOB_ERROR = 'The import worker stopped before the job finished'
+
+function isStale(row: ImportJobRow, now: number): boolean {
+  if (row.status === 'queued') return row.heartbeatAt.getTime() < now - QUEUED_TIMEOUT_MS
+  if (row.status === 'running') return row.heartbeatAt.getTime() < now - RUNNING_TIMEOUT_MS
+  return false
+}
+
+// A stale job reads as failed; expireStaleJobs writes that to the table when
+// the next import is created, so status polls stay read-only
+function toJob(row: ImportJobRow): ImportJob {
+  const stale = isStale(row, Date.now())
+  return {
+    id: row.id,
+    status: stale ? 'failed' : (row.status as ImportJobStatus),
+    total: row.total,
+    changed: row.changed,
+    done: row.done,
+    deleted: row.deleted,
+    unchanged: row.unchanged,
+    skipped: row.skipped,
+    rowsPerSecond: row.rowsPerSecond,
+    startedAt: row.startedAt.toISOString(),
+    finishedAt: stale ? row.heartbeatAt.toISOString() : row.finishedAt ? row.finishedAt.toISOString() : null,
+    message: row.message,
+    error: stale ? STALE_JOB_ERROR : row.error,
+  }
+}
+
+// Fails jobs whose worker was killed or never started, so they stop blocking new imports
+async function expireStaleJobs() {
+  const now = Date.now()
+  await prisma.importJob.updateMany({
+    where: {
+      OR: [
+        { status: 'queued', heartbeatAt: { lt: new Date(now - QUEUED_TIMEOUT_MS) } },
+        { status: 'running', heartbeatAt: { lt: new Date(now - RUNNING_TIMEOUT_MS) } },
+      ],
+    },
+    data: {
+      status: 'failed',
+      error: STALE_JOB_ERROR,
+      finishedAt: new Date(),
+    },
+  })
+}
+
+export async function getImportJob(id: string): Promise<ImportJob | null> {
+  const row = await prisma.importJob.findUnique({ where: { id } })
+  return row ? toJob(row) : null
+}
+
+export async function latestImportJob(): Promise<ImportJob | null> {
+  const row = await prisma.importJob.findFirst({ orderBy: { startedAt: 'desc' } })
+  return row ? toJob(row) : null
+}
+
+export async function activeImportJob(): Promise<ImportJob | null> {
+  const row = await prisma.importJob.findFirst({ where: { status: { in: ACTIVE_STATUSES } } })
+  return row && !isStale(row, Date.now()) ? toJob(row) : null
+}
+
+// Records a queued job, or returns null while another one is queued or running
+export async function createImportJob(): Promise<ImportJob | null> {
+  await expireStaleJobs()
+  try {
+    return await prisma.$transaction(
+      async (tx) => {
+        const active = await tx.importJob.findFirst({ where: { status: { in: ACTIVE_STATUSES } } })
+        if (active) return null
+        return toJob(await tx.importJob.create({ data: {} }))
+      },
+      { isolationLevel: Prisma.TransactionIsolationLevel.Serializable }
+    )
+  } catch (error: any) {
+    // Serialization failure: another request created a job at the same moment
+    if (error.code === 'P2034') return null
+    throw error
+  }
+}
+
+export async function failImportJob(id: string, error: string) {
+  await prisma.importJob.updateMany({
+    where: { id, status: { in: ACTIVE_STATUSES } },
+    data: { status: 'failed', error, finishedAt: new Date() },
+  })
+}
+
+async function pruneFinishedJobs() {
+  const old = await prisma.importJob.findMany({
+    where: { status: { notIn: ACTIVE_STATUSES } },
+    orderBy: { startedAt: 'desc' },
+    skip: MAX_FINISHED_JOBS,
+    select: { id: true },
+  })
+  if (old.length > 0) {
+    await prisma.importJob.deleteMany({ where: { id: { in: old.map((job) => job.id) } } })
+  }
+}
+
+// Claims a queued job and runs the import, writing progress to its row.
+// Returns false if the job was not queued (already claimed, finished or expired).
+export async function runImportJob(id: string): Promise<boolean> {
+  const { count } = await prisma.importJob.updateMany({
+    where: { id, status: 'queued' },
+    data: { status: 'running', heartbeatAt: new Date() },
+  })
+  if (count === 0) return false
+
+  const start = Date.now()
+  let done = 0
+
+  // Progress writes are chained rather than awaited in the batch callbacks: the
+  // sync holds a transaction open, and with a connection limit of one they can
+  // only go through once it has committed
+  let writes: Promise<unknown> = Promise.resolve()
+  const save = (data: Prisma.ImportJobUpdateInput) => {
+    writes = writes
+      .then(() => prisma.importJob.update({ where: { id }, data: { ...data, heartbeatAt: new Date() } }))
+      .catch(() => undefined)
+  }
+
+  try {
+    const { rows, skipped } = prepareWordRows(loadVocabFile())
+    save({ total: rows.length, skipped })
+
+    const result = await syncWords(prisma, rows, {
+      onPlan: (plan) => {
+        save({
+          changed: plan.inserts.length + plan.updates.length,
+          deleted: plan.deletes.length,
+          unchanged: plan.unchanged,
+        })
+      },
+      onBatch: (report) => {
+        done += report.rows
+        save({
+          done,
+          rowsPerSecond: Math.round((done * 1000) / Math.max(Date.now() - start, 1)),
+        })
+      },
+    })
+
+    await writes
+    await prisma.importJob.update({
+      where: { id },
+      data: {
+        status: 'succeeded',
+        message: `Synced ${rows.length} words (${result.inserted} new, ${result.updated} updated, ${result.deleted} removed), skipped ${skipped}`,
+        finishedAt: new Date(),
+      },
+    })
+
+    // Every instance's word cache (and with it the headword search and term
+    // indexes) sees the new finishedAt and reloads; this one drops its copy now
+    invalidateWordCache()
+  } catch (error: any) {
+    await writes
+    await prisma.importJob.update({
+      where: { id },
+      data: { status: 'failed', error: error.message, finishedAt: new Date() },
+    })
+  }
+
+  await pruneFinishedJobs()
+  return true
+}
+
+// Hands a queued job to a worker. On serverless deploys that is the background
+// function at origin; a long-lived server runs the job in its own process.
+export async function dispatchImportJob(id: string, origin: string) {
+  if (!runsOnServerless()) {
+    void runImportJob(id).catch(async (error) => {
+      console.error(`Import job ${id} failed:`, error)
+      await failImportJob(id, error.message).catch(() => undefined)
+    })
+    return
+  }
+
+  const response = await fetch(new URL(IMPORT_WORKER_PATH, origin), {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ jobId: id }),
+  })
+  if (!response.ok) {
+    throw new Error(`Import worker did not accept the job (HTTP ${response.status})`)
+  }
+}
@@ -0,0 +1,6 @@
+// Netlify runs the app as AWS Lambda functions. A function instance may be
+// frozen as soon as it has responded, so work that outlives a request is
+// handed to a background function there instead of left running in-process.
+export function runsOnServerless(): boolean {
+  return Boolean(process.env.NETLIFY || process.env.AWS_LAMBDA_FUNCTION_NAME)
+}
@@ -0,0 +1,107 @@
+import fs from 'fs'
+import path from 'path'
+
+// Reader for data/sats_vocab.bin, written by scripts/pack-vocab.py.
+// See scripts/vocab_pipeline/binary.py for the layout. loadVocabFile in
+// lib/vocab-check.ts reads it in place of data/sats_vocab.json when it is at
+// least as new.
+
+const VOCAB_BINARY_PATH = path.join(process.cwd(), 'data', 'sats_vocab.bin')
+
+const MAGIC = 'SATV'
+const VERSION = 2
+const FIELDS = ['word', 'partOfSpeech', 'definition', 'exampleSentence', 'difficulty', 'synonyms'] as const
+const MISSING = 0xffffffff
+const SLOT_SIZE = 8
+const RECORD_SIZE = FIELDS.length * SLOT_SIZE
+
+export interface VocabRecord {
+  word: string
+  partOfSpeech: string | null
+  definition: string
+  exampleSentence: string | null
+  difficulty: string | null
+  synonyms: string | null // JSON array text, as stored in the Word table
+}
+
+export class VocabArtifact {
+  readonly count: number
+  private buffer: Buffer
+  private recordsOffset: number
+  private indexOffset: number
+  private stringsOffset: number
+
+  constructor(buffer: Buffer) {
+    if (
+      buffer.toString('latin1', 0, 4) !== MAGIC ||
+      buffer.readUInt16LE(4) !== VERSION ||
+      buffer.readUInt16LE(6) !== FIELDS.length
+    ) {
+      throw new Error(`Not a version ${VERSION} vocab artifact`)
+    }
+    this.buffer = buffer
+    this.count = buffer.readUInt32LE(8)
+    this.recordsOffset = buffer.readUInt32LE(12)
+    this.indexOffset = buffer.readUInt32LE(16)
+    this.stringsOffset = buffer.readUInt32LE(20)
+  }
+
+  static open(filePath: string = VOCAB_BINARY_PATH): VocabArtifact {
+    return new VocabArtifact(fs.readFileSync(filePath))
+  }
+
+  private fieldBytes(recordNumber: number, fieldNumber: number): Buffer | null {
+    const slot = this.recordsOffset + recordNumber * RECORD_SIZE + fieldNumber * SLOT_SIZE
+    const offset = this.buffer.readUInt32LE(slot)
+    if (offset === MISSING) return null
+    const start = this.stringsOffset + offset
+    return this.buffer.subarray(start, start + this.buffer.readUInt32LE(slot + 4))
+  }
+
+  entry(recordNumber: number): VocabRecord {
+    const values = FIELDS.map((_, i) => {
+      const bytes = this.fieldBytes(recordNumber, i)
+      return bytes ? bytes.toString('utf-8') : null
+    })
+    return {
+      word: values[0] as string,
+      partOfSpeech: values[1],
+      definition: values[2] as string,
+      exampleSentence: values[3],
+      difficulty: values[4],
+      synonyms: values[5],
+    }
+  }
+
+  *entries(): IterableIterator<VocabRecord> {
+    for (let i = 0; i < this.count; i++) {
+      yield this.entry(i)
+    }
+  }
+
+  lookup(word: string): VocabRecord | null {
+    const key = Buffer.from(word, 'utf-8')
+    let low = 0
+    let high = this.count
+    while (low < high) {
+      const mid = (low + high) >>> 1
+      const recordNumber = this.buffer.readUInt32LE(this.indexOffset + mid * 4)
+      const cmp = Buffer.compare(this.fieldBytes(recordNumber, 0) as Buffer, key)
+      if (cmp < 0) low = mid + 1
+      else if (cmp > 0) high = mid
+      else return this.entry(recordNumber)
+    }
+    return null
+  }
+}
+
+export function checkVocabBinary(): { exists: boolean; path: string } {
+  return { exists: fs.existsSync(VOCAB_BINARY_PATH), path: VOCAB_BINARY_PATH }
+}
+
+// True when the artifact exists and is not older than the JSON dataset it was packed from
+export function isVocabBinaryFresh(jsonPath: string): boolean {
+  if (!fs.existsSync(VOCAB_BINARY_PATH)) return false
+  if (!fs.existsSync(jsonPath)) return true
+  return fs.statSync(VOCAB_BINARY_PATH).mtimeMs >= fs.statSync(jsonPath).mtimeMs
+}
@@ -1,14 +1,27 @@
 import fs from 'fs'
 import path from 'path'
+import { VocabArtifact, checkVocabBinary, isVocabBinaryFresh } from './vocab-binary'
 
 const VOCAB_FILE_PATH = path.join(process.cwd(), 'data', 'sats_vocab.json')
 
+// The dataset is available as JSON or as the packed artifact data/sats_vocab.bin
 export function checkVocabFile(): { exists: boolean; path: string } {
-  const exists = fs.existsSync(VOCAB_FILE_PATH)
+  const exists = fs.existsSync(VOCAB_FILE_PATH) || checkVocabBinary().exists
   return { exists, path: VOCAB_FILE_PATH }
 }
 
-export function loadVocabFile(): any[] {
+// Reads the packed artifact when it is at least as new as the JSON file: its
+// entries are decoded one at a time as the caller iterates, so no copy of the
+// whole dataset is built. Otherwise parses the JSON.
+export function loadVocabFile(): Iterable<any> {
+  if (isVocabBinaryFresh(VOCAB_FILE_PATH)) {
+    const artifact = VocabArtifact.open()
+    if (artifact.count === 0) {
+      throw new Error(`SAT vocabulary artifact ${checkVocabBinary().path} contains no words.`)
+    }
+    return artifact.entries()
+  }
+
   const { exists, path: filePath } = checkVocabFile()
   if (!exists) {
     throw new Error(
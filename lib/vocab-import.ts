@@ -0,0 +1,343 @@
+import crypto from 'crypto'
+import { Prisma, PrismaClient } from '@prisma/client'
+
+// Batched Word import shared by scripts/import-vocab.ts and the admin import
+// route. Rows go in with chunked bulk statements inside one transaction: each
+// chunk runs under a savepoint so it is retried or rolled back as a unit, and
+// a chunk that keeps failing rolls back the whole import, leaving the
+// previous words in place.
+//
+// syncWords diffs the dataset against the table by headword and content hash
+// and only inserts, updates or deletes the words that changed, so learner
+// progress on unchanged and edited words survives an import. replaceWords
+// clears Word and everything that references it and inserts from scratch.
+
+export const DEFAULT_CHUNK_SIZE = 500
+export const DEFAULT_BATCH_RETRIES = 2
+const TRANSACTION_TIMEOUT_MS = 5 * 60 * 1000
+
+export interface VocabEntry {
+  word: string
+  partOfSpeech?: string
+  definition: string
+  synonyms?: string[] | string
+  exampleSentence?: string
+  difficulty?: string
+}
+
+export interface WordRow {
+  word: string
+  partOfSpeech: string | null
+  definition: string
+  synonyms: string | null
+  exampleSentence: string | null
+  difficulty: string
+}
+
+export interface ExistingWord extends WordRow {
+  id: string
+}
+
+export interface SyncPlan {
+  inserts: WordRow[]
+  updates: ExistingWord[]
+  deletes: ExistingWord[]
+  unchanged: number
+}
+
+export interface BatchReport {
+  operation: 'insert' | 'update'
+  batch: number
+  batches: number
+  rows: number
+  attempts: number
+  ms: number
+  rowsPerSecond: number
+}
+
+export interface BatchOptions {
+  chunkSize?: number
+  retries?: number
+  onBatch?: (report: BatchReport) => void
+  // Called by syncWords once the diff is known, before anything is written
+  onPlan?: (plan: SyncPlan) => void
+}
+
+export function determineDifficulty(word: string, definition: string): string {
+  const length = word.length
+  const defLength = definition.length
+
+  if (length <= 5 && defLength <= 50) return 'easy'
+  if (length >= 10 || defLength >= 100) return 'hard'
+  return 'medium'
+}
+
+export function toWordRow(entry: VocabEntry): WordRow {
+  const synonyms = Array.isArray(entry.synonyms)
+    ? JSON.stringify(entry.synonyms)
+    : typeof entry.synonyms === 'string'
+    ? entry.synonyms
+    : null
+
+  return {
+    word: entry.word.toLowerCase().trim(),
+    partOfSpeech: entry.partOfSpeech || null,
+    definition: entry.definition,
+    synonyms,
+    exampleSentence: entry.exampleSentence || null,
+    // Precomputed corpus-wide by scripts/score-difficulty.py; the length rule is a fallback
+    difficulty: entry.difficulty || determineDifficulty(entry.word, entry.definition),
+  }
+}
+
+// Turns dataset entries into Word rows. Placeholder entries are dropped;
+// entries without a word or definition and repeated headwords are skipped.
+export function prepareWordRows(vocab: Iterable<any>) {
+  const rows: WordRow[] = []
+  const seen = new Set<string>()
+  let skipped = 0
+  const duplicates: string[] = []
+
+  for (const entry of vocab) {
+    if (entry._note || entry._source || entry._format) continue
+
+    if (!entry.word || !entry.definition) {
+      skipped++
+      continue
+    }
+
+    const row = toWordRow(entry as VocabEntry)
+    if (seen.has(row.word)) {
+      duplicates.push(row.word)
+      skipped++
+      continue
+    }
+    seen.add(row.word)
+    rows.push(row)
+  }
+
+  return { rows, skipped, duplicates }
+}
+
+export function chunk<T>(items: T[], size: number): T[][] {
+  const chunks: T[][] = []
+  for (let i = 0; i < items.length; i += size) {
+    chunks.push(items.slice(i, i + size))
+  }
+  return chunks
+}
+
+// Fields compared by sync; the id and createdAt of an existing word are kept
+export function contentHash(row: WordRow): string {
+  return crypto
+    .createHash('sha1')
+    .update(
+      JSON.stringify([
+        row.partOfSpeech,
+        row.definition,
+        row.synonyms,
+        row.exampleSentence,
+        row.difficulty,
+      ])
+    )
+    .digest('hex')
+}
+
+// Matches dataset rows to existing words by headword and compares content hashes
+export function diffWords(existing: ExistingWord[], rows: WordRow[]): SyncPlan {
+  const current = new Map(existing.map((word) => [word.word, word]))
+  const plan: SyncPlan = { inserts: [], updates: [], deletes: [], unchanged: 0 }
+
+  for (const row of rows) {
+    const word = current.get(row.word)
+    if (!word) {
+      plan.inserts.push(row)
+    } else {
+      current.delete(row.word)
+      if (contentHash(word) === contentHash(row)) plan.unchanged++
+      else plan.updates.push({ ...row, id: word.id })
+    }
+  }
+  plan.deletes = Array.from(current.values())
+  return plan
+}
+
+// Runs write(chunk) for each chunk of items under its own savepoint, retrying a failed chunk
+async function runBatches<T>(
+  tx: Prisma.TransactionClient,
+  operation: BatchReport['operation'],
+  items: T[],
+  write: (batch: T[]) => Promise<number>,
+  { chunkSize = DEFAULT_CHUNK_SIZE, retries = DEFAULT_BATCH_RETRIES, onBatch }: BatchOptions
+) {
+  const batches = chunk(items, Math.max(1, chunkSize))
+  let written = 0
+
+  for (let index = 0; index < batches.length; index++) {
+    const batch = batches[index]
+    for (let attempt = 1; ; attempt++) {
+      const start = Date.now()
+      await tx.$executeRawUnsafe('SAVEPOINT word_batch')
+      try {
+        const count = await write(batch)
+        await tx.$executeRawUnsafe('RELEASE SAVEPOINT word_batch')
+        written += count
+
+        const ms = Date.now() - start
+        onBatch?.({
+          operation,
+          batch: index + 1,
+          batches: batches.length,
+          rows: count,
+          attempts: attempt,
+          ms,
+          rowsPerSecond: Math.round((count * 1000) / Math.max(ms, 1)),
+        })
+        break
+      } catch (error: any) {
+        await tx.$executeRawUnsafe('ROLLBACK TO SAVEPOINT word_batch')
+        if (attempt > retries) {
+          throw new Error(
+            `${operation} batch ${index + 1}/${batches.length} failed after ${attempt} attempts: ${error.message}`
+          )
+        }
+      }
+    }
+  }
+
+  return { written, batches: batches.length }
+}
+
+// Inserts rows in createMany chunks on a transaction client, one savepoint per chunk
+export async function insertWordBatches(
+  tx: Prisma.TransactionClient,
+  rows: WordRow[],
+  options: BatchOptions = {}
+) {
+  const { written, batches } = await runBatches(tx, 'insert', rows, async (batch) => {
+    const { count } = await tx.word.createMany({ data: batch })
+    return count
+  }, options)
+  return { inserted: written, batches }
+}
+
+// Rewrites changed words with one UPDATE ... FROM (VALUES ...) statement per chunk
+export async function updateWordBatches(
+  tx: Prisma.TransactionClient,
+  words: ExistingWord[],
+  options: BatchOptions = {}
+) {
+  const { written } = await runBatches(tx, 'update', words, (batch) => {
+    const values = batch.map(
+      (w) => Prisma.sql`(${w.id}::text, ${w.partOfSpeech}::text, ${w.definition}::text, ${w.synonyms}::text, ${w.exampleSentence}::text, ${w.difficulty}::text)`
+    )
+    return tx.$executeRaw`
+      UPDATE "Word" AS w SET
+        "partOfSpeech" = v."partOfSpeech",
+        "definition" = v."definition",
+        "synonyms" = v."synonyms",
+        "exampleSentence" = v."exampleSentence",
+        "difficulty" = v."difficulty"
+      FROM (VALUES ${Prisma.join(values)})
+        AS v("id", "partOfSpeech", "definition", "synonyms", "exampleSentence", "difficulty")
+      WHERE w."id" = v."id"`
+  }, options)
+  return written
+}
+
+// Deletes words dropped from the dataset together with the rows that reference them.
+// Crosswords built from a deleted word can no longer be played and go with it.
+async function deleteWords(tx: Prisma.TransactionClient, ids: string[]) {
+  if (ids.length === 0) return { deleted: 0, crosswordsRemoved: 0 }
+
+  const crosswordIds = (
+    await tx.crosswordWord.findMany({
+      where: { wordId: { in: ids } },
+      select: { crosswordId: true },
+      distinct: ['crosswordId'],
+    })
+  ).map((cw) => cw.crosswordId)
+
+  await tx.flashcardProgress.deleteMany({ where: { wordId: { in: ids } } })
+  await tx.crosswordWord.deleteMany({
+    where: { OR: [{ wordId: { in: ids } }, { crosswordId: { in: crosswordIds } }] },
+  })
+  await tx.crosswordProgress.deleteMany({ where: { crosswordId: { in: crosswordIds } } })
+  await tx.crossword.deleteMany({ where: { id: { in: crosswordIds } } })
+  const { count } = await tx.word.deleteMany({ where: { id: { in: ids } } })
+  return { deleted: count, crosswordsRemoved: crosswordIds.length }
+}
+
+// Pooled puzzles not yet handed out are dropped when one of their words changes,
+// since their clues were copied from the old definitions
+async function dropStalePooledCrosswords(tx: Prisma.TransactionClient, wordIds: string[]) {
+  if (wordIds.length === 0) return 0
+
+  const stale = await tx.crossword.findMany({
+    where: { pooled: true, crosswordWords: { some: { wordId: { in: wordIds } } } },
+    select: { id: true },
+  })
+  const staleIds = stale.map((crossword) => crossword.id)
+  if (staleIds.length === 0) return 0
+
+  await tx.crosswordWord.deleteMany({ where: { crosswordId: { in: staleIds } } })
+  await tx.crossword.deleteMany({ where: { id: { in: staleIds } } })
+  return staleIds.length
+}
+
+// Brings the Word table in line with rows, touching only words that changed
+export async function syncWords(prisma: PrismaClient, rows: WordRow[], options: BatchOptions = {}) {
+  return prisma.$transaction(
+    async (tx) => {
+      const existing = await tx.word.findMany({
+        select: {
+          id: true,
+          word: true,
+          partOfSpeech: true,
+          definition: true,
+          synonyms: true,
+          exampleSentence: true,
+          difficulty: true,
+        },
+      })
+      const plan = diffWords(existing, rows)
+      options.onPlan?.(plan)
+
+      const poolDropped = await dropStalePooledCrosswords(
+        tx,
+        plan.updates.map((word) => word.id)
+      )
+      const { deleted, crosswordsRemoved } = await deleteWords(
+        tx,
+        plan.deletes.map((word) => word.id)
+      )
+      const updated = await updateWordBatches(tx, plan.updates, options)
+      const { inserted } = await insertWordBatches(tx, plan.inserts, options)
+
+      return {
+        inserted,
+        updated,
+        deleted,
+        unchanged: plan.unchanged,
+        crosswordsRemoved: crosswordsRemoved + poolDropped,
+      }
+    },
+    { maxWait: 10000, timeout: TRANSACTION_TIMEOUT_MS }
+  )
+}
+
+// Clears Word and its dependent tables and inserts rows in a single transaction
+export async function replaceWords(prisma: PrismaClient, rows: WordRow[], options: BatchOptions = {}) {
+  return prisma.$transaction(
+    async (tx) => {
+      // Must delete in order due to foreign keys
+      await tx.flashcardProgress.deleteMany({})
+      await tx.crosswordWord.deleteMany({})
+      await tx.crosswordProgress.deleteMany({})
+      await tx.crossword.deleteMany({})
+      await tx.word.deleteMany({})
+      return insertWordBatches(tx, rows, options)
+    },
+    { maxWait: 10000, timeout: TRANSACTION_TIMEOUT_MS }
+  )
+}
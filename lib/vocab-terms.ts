@@ -0,0 +1,174 @@
+import fs from 'fs'
+import path from 'path'
+import type { WordCache } from './word-cache'
+
+// Reader for data/sats_vocab.terms, the definition term index written by
+// scripts/index-vocab.py. See scripts/vocab_pipeline/terms.py for the layout.
+
+const TERM_INDEX_PATH = path.join(process.cwd(), 'data', 'sats_vocab.terms')
+
+const MAGIC = 'SATI'
+const VERSION = 1
+const ROW_SIZE = 16
+const MIN_TERM_LENGTH = 3
+
+// Keep in sync with INDEX_STOPWORDS in scripts/vocab_pipeline/terms.py
+const STOPWORDS = new Set([
+  'the', 'a', 'an', 'which', 'that', 'when', 'where', 'who', 'what', 'how',
+  'are', 'is', 'was', 'were', 'be', 'not', 'to', 'of', 'in', 'on', 'at',
+  'for', 'with', 'from', 'and', 'or', 'but', 'so', 'if', 'as', 'well',
+  'about', 'any', 'been', 'being', 'by', 'etc', 'had', 'has', 'have', 'having',
+  'her', 'his', 'into', 'its', 'more', 'most', 'one', 'out', 'someone',
+  'something', 'than', 'their', 'them', 'this', 'very',
+])
+
+export interface TermMatch {
+  word: string
+  score: number
+}
+
+export function normalizeTerm(token: string): string {
+  if (token.length > 4 && token.endsWith('ies')) return token.slice(0, -3) + 'y'
+  if (
+    token.length > 3 &&
+    token.endsWith('s') &&
+    !token.endsWith('ss') &&
+    !token.endsWith('us') &&
+    !token.endsWith('is')
+  ) {
+    return token.slice(0, -1)
+  }
+  return token
+}
+
+export function definitionTerms(text: string): string[] {
+  const terms = new Set<string>()
+  for (const token of text.toLowerCase().match(/[a-z]+/g) || []) {
+    if (token.length < MIN_TERM_LENGTH || STOPWORDS.has(token)) continue
+    terms.add(normalizeTerm(token))
+  }
+  return Array.from(terms)
+}
+
+export class TermIndex {
+  readonly wordCount: number
+  readonly termCount: number
+  private buffer: Buffer
+  private wordsOffset: number
+  private termsOffset: number
+  private postingsOffset: number
+  private stringsOffset: number
+
+  constructor(buffer: Buffer) {
+    if (buffer.toString('latin1', 0, 4) !== MAGIC || buffer.readUInt16LE(4) !== VERSION) {
+      throw new Error(`Not a version ${VERSION} term index`)
+    }
+    this.buffer = buffer
+    this.wordCount = buffer.readUInt32LE(8)
+    this.termCount = buffer.readUInt32LE(12)
+    this.wordsOffset = buffer.readUInt32LE(16)
+    this.termsOffset = buffer.readUInt32LE(20)
+    this.postingsOffset = buffer.readUInt32LE(24)
+    this.stringsOffset = buffer.readUInt32LE(28)
+  }
+
+  static open(filePath: string = TERM_INDEX_PATH): TermIndex {
+    return new TermIndex(fs.readFileSync(filePath))
+  }
+
+  private stringBytes(table: number, rowNumber: number): Buffer {
+    const row = table + rowNumber * ROW_SIZE
+    const start = this.stringsOffset + this.buffer.readUInt32LE(row)
+    return this.buffer.subarray(start, start + this.buffer.readUInt32LE(row + 4))
+  }
+
+  private list(table: number, rowNumber: number): number[] {
+    const row = table + rowNumber * ROW_SIZE
+    const start = this.postingsOffset + this.buffer.readUInt32LE(row + 8) * 4
+    const count = this.buffer.readUInt32LE(row + 12)
+    const values = new Array<number>(count)
+    for (let i = 0; i < count; i++) {
+      values[i] = this.buffer.readUInt32LE(start + i * 4)
+    }
+    return values
+  }
+
+  private find(table: number, count: number, value: string): number | null {
+    const key = Buffer.from(value, 'utf-8')
+    let low = 0
+    let high = count
+    while (low < high) {
+      const mid = (low + high) >>> 1
+      const cmp = Buffer.compare(this.stringBytes(table, mid), key)
+      if (cmp < 0) low = mid + 1
+      else if (cmp > 0) high = mid
+      else return mid
+    }
+    return null
+  }
+
+  headword(wordNumber: number): string {
+    return this.stringBytes(this.wordsOffset, wordNumber).toString('utf-8')
+  }
+
+  private rank(
+    termNumbers: number[],
+    limit: number,
+    exclude?: number,
+    accept?: (word: string) => boolean
+  ): TermMatch[] {
+    const matches = new Map<number, { hits: number; score: number }>()
+    for (const termNumber of termNumbers) {
+      const postings = this.list(this.termsOffset, termNumber)
+      const idf = Math.log((this.wordCount + 1) / postings.length)
+      for (const wordNumber of postings) {
+        if (wordNumber === exclude) continue
+        const match = matches.get(wordNumber) || { hits: 0, score: 0 }
+        match.hits += 1
+        match.score += idf
+        matches.set(wordNumber, match)
+      }
+    }
+    const ranked = Array.from(matches.entries())
+      .sort((a, b) => b[1].hits - a[1].hits || b[1].score - a[1].score || a[0] - b[0])
+    const results: TermMatch[] = []
+    for (const [wordNumber, match] of ranked) {
+      if (results.length >= limit) break
+      const word = this.headword(wordNumber)
+      if (!accept || accept(word)) results.push({ word, score: match.score })
+    }
+    return results
+  }
+
+  // Headwords whose definitions match a free-text query, best first. accept
+  // filters headwords before the limit is applied.
+  search(query: string, limit = 20, accept?: (word: string) => boolean): TermMatch[] {
+    const termNumbers = definitionTerms(query)
+      .map(term => this.find(this.termsOffset, this.termCount, term))
+      .filter((termNumber): termNumber is number => termNumber !== null)
+    return this.rank(termNumbers, limit, undefined, accept)
+  }
+
+  // Headwords whose definitions share the most terms with the given word's
+  related(word: string, limit = 10, accept?: (word: string) => boolean): TermMatch[] {
+    const wordNumber = this.find(this.wordsOffset, this.wordCount, word)
+    if (wordNumber === null) return []
+    return this.rank(this.list(this.wordsOffset, wordNumber), limit, wordNumber, accept)
+  }
+}
+
+let cachedIndex: { cache: WordCache; mtimeMs: number; index: TermIndex } | null = null
+
+// Loads data/sats_vocab.terms, again whenever the word cache reloads (after an
+// import or at its max age) or the file has been rewritten by index-vocab.py
+export function getTermIndex(cache: WordCache): TermIndex | null {
+  if (!fs.existsSync(TERM_INDEX_PATH)) {
+    cachedIndex = null
+    return null
+  }
+  const { mtimeMs } = fs.statSync(TERM_INDEX_PATH)
+  if (!cachedIndex || cachedIndex.cache !== cache || cachedIndex.mtimeMs !== mtimeMs) {
+    cachedIndex = { cache, mtimeMs, index: TermIndex.open() }
+  }
+  return cachedIndex.index
+}
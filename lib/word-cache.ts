@@ -0,0 +1,113 @@
+import type { Word } from '@prisma/client'
+import { prisma } from './prisma'
+
+// In-process copy of the Word table for GET /api/words. The table only
+// changes on import, so it is loaded once and indexed by id, headword and
+// difficulty. Before reusing it, getWordCache compares the finish time of the
+// newest succeeded ImportJob with the one it was loaded under, so an admin
+// import run by any instance or background function drops every copy. The
+// instance that ran the import also bumps the local version stamp
+// (invalidateWordCache), and the max age picks up npm run db:import, which
+// records no ImportJob.
+
+export const WORD_CACHE_MAX_AGE_MS = 5 * 60 * 1000
+
+export class WordCache {
+  readonly version: number
+  readonly importStamp: number
+  readonly loadedAt: number
+  // All words in headword order
+  readonly words: Word[]
+  private byId: Map<string, Word>
+  private byWord: Map<string, Word>
+  private buckets: Map<string, Word[]>
+
+  constructor(words: Word[], version: number, importStamp = 0) {
+    this.version = version
+    this.importStamp = importStamp
+    this.loadedAt = Date.now()
+    this.words = [...words].sort((a, b) => (a.word < b.word ? -1 : a.word > b.word ? 1 : 0))
+    this.byId = new Map(this.words.map((word) => [word.id, word]))
+    this.byWord = new Map(this.words.map((word) => [word.word, word]))
+    this.buckets = new Map()
+    for (const word of this.words) {
+      const bucket = this.buckets.get(word.difficulty)
+      if (bucket) bucket.push(word)
+      else this.buckets.set(word.difficulty, [word])
+    }
+  }
+
+  get size() {
+    return this.words.length
+  }
+
+  get(id: string): Word | undefined {
+    return this.byId.get(id)
+  }
+
+  getByWord(word: string): Word | undefined {
+    return this.byWord.get(word)
+  }
+
+  // Words of one difficulty (or all of them), in headword order
+  list(difficulty?: string | null): Word[] {
+    if (!difficulty) return this.words
+    return this.buckets.get(difficulty) || []
+  }
+}
+
+// Kept on globalThis like the Prisma client so dev hot reloads share one cache
+const globalForCache = globalThis as unknown as {
+  wordCacheVersion: number | undefined
+  wordCache: Promise<WordCache> | null | undefined
+}
+
+export function wordCacheVersion(): number {
+  return globalForCache.wordCacheVersion ?? 0
+}
+
+// Finish time of the newest succeeded import, in ms (0 before the first one)
+async function lastImportStamp(): Promise<number> {
+  const job = await prisma.importJob.findFirst({
+    where: { status: 'succeeded' },
+    orderBy: { finishedAt: 'desc' },
+    select: { finishedAt: true },
+  })
+  return job?.finishedAt?.getTime() ?? 0
+}
+
+// Loads the Word table on first use and whenever the version stamp, the last
+// import or the max age says it is stale
+export async function getWordCache(): Promise<WordCache> {
+  const cached = globalForCache.wordCache
+  if (cached) {
+    const [cache, importStamp] = await Promise.all([cached, lastImportStamp()])
+    if (
+      cache.version === wordCacheVersion() &&
+      cache.importStamp === importStamp &&
+      Date.now() - cache.loadedAt < WORD_CACHE_MAX_AGE_MS
+    ) {
+      return cache
+    }
+    // Another request may already have started the reload
+    if (globalForCache.wordCache !== cached) return getWordCache()
+  }
+
+  // The stamp is read before the words, so an import finishing in between
+  // only causes one more reload
+  const version = wordCacheVersion()
+  const loading = lastImportStamp().then((importStamp) =>
+    prisma.word.findMany().then((words) => new WordCache(words, version, importStamp))
+  )
+  globalForCache.wordCache = loading
+  loading.catch(() => {
+    if (globalForCache.wordCache === loading) globalForCache.wordCache = null
+  })
+  return loading
+}
+
+// Bumps the version stamp so the next request reloads the Word table (e.g. after an import)
+export function invalidateWordCache() {
+  globalForCache.wordCacheVersion = wordCacheVersion() + 1
+  globalForCache.wordCache = null
+}
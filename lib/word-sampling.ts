@@ -0,0 +1,157 @@
+import { prisma } from './prisma'
+import type { WordCache } from './word-cache'
+
+// Random study sets for GET /api/words?random=true, drawn from the in-memory
+// word cache. Uniform draws use a partial Fisher-Yates shuffle that only
+// touches the k positions it picks. Mastery-weighted draws use Vose's alias
+// method: building the table is O(n) once per learner and difficulty, and
+// every draw is O(1).
+
+// Relative weight of a word by the learner's FlashcardProgress.masteryLevel (0-5);
+// words the learner has never reviewed weigh the same as level 0
+export const MASTERY_WEIGHTS = [6, 5, 4, 3, 2, 1]
+export const UNSEEN_WEIGHT = MASTERY_WEIGHTS[0]
+
+// Alias tables are rebuilt after a review (invalidateMasteryTables) or once this old
+const MASTERY_TABLE_MAX_AGE_MS = 60 * 1000
+const MAX_MASTERY_TABLES = 500
+
+// Rejected draws allowed per requested word before weighted sampling tops up uniformly
+const MAX_REJECTIONS_PER_DRAW = 32
+
+export function masteryWeight(masteryLevel: number | undefined): number {
+  if (masteryLevel === undefined) return UNSEEN_WEIGHT
+  const level = Math.max(0, Math.min(MASTERY_WEIGHTS.length - 1, Math.round(masteryLevel)))
+  return MASTERY_WEIGHTS[level]
+}
+
+// k distinct items, uniformly at random, in random order. The swaps of a
+// Fisher-Yates shuffle are recorded in a map instead of on a copy of items.
+export function sampleUniform<T>(items: T[], k: number, random: () => number = Math.random): T[] {
+  const n = items.length
+  const count = Math.max(0, Math.min(k, n))
+  const swapped = new Map<number, number>()
+  const sample: T[] = []
+
+  for (let i = 0; i < count; i++) {
+    const j = i + Math.floor(random() * (n - i))
+    const picked = swapped.get(j) ?? j
+    swapped.set(j, swapped.get(i) ?? i)
+    sample.push(items[picked])
+  }
+  return sample
+}
+
+export class AliasTable {
+  readonly size: number
+  private probability: Float64Array
+  private alias: Uint32Array
+
+  constructor(weights: number[]) {
+    const n = weights.length
+    this.size = n
+    this.probability = new Float64Array(n)
+    this.alias = new Uint32Array(n)
+    if (n === 0) return
+
+    const total = weights.reduce((sum, w) => sum + Math.max(0, w), 0)
+    const scaled = weights.map((w) => (total > 0 ? (Math.max(0, w) * n) / total : 1))
+    const small: number[] = []
+    const large: number[] = []
+    scaled.forEach((p, i) => (p < 1 ? small : large).push(i))
+
+    while (small.length > 0 && large.length > 0) {
+      const less = small.pop() as number
+      const more = large.pop() as number
+      this.probability[less] = scaled[less]
+      this.alias[less] = more
+      scaled[more] = scaled[more] + scaled[less] - 1
+      ;(scaled[more] < 1 ? small : large).push(more)
+    }
+    // Whatever is left is 1 up to rounding error
+    for (const i of large) this.probability[i] = 1
+    for (const i of small) this.probability[i] = 1
+  }
+
+  // One index, drawn with probability proportional to its weight
+  draw(random: () => number = Math.random): number {
+    const column = Math.floor(random() * this.size)
+    return random() < this.probability[column] ? column : this.alias[column]
+  }
+}
+
+// k distinct items drawn with probability proportional to their weight in
+// table. Repeats are redrawn; if the heavy items run out, the rest of the
+// set is filled uniformly from the items not yet picked.
+export function sampleWeighted<T>(
+  items: T[],
+  table: AliasTable,
+  k: number,
+  random: () => number = Math.random
+): T[] {
+  const count = Math.max(0, Math.min(k, items.length))
+  const picked = new Set<number>()
+  let rejections = 0
+
+  while (picked.size < count && rejections < count * MAX_REJECTIONS_PER_DRAW) {
+    const index = table.draw(random)
+    if (picked.has(index)) rejections++
+    else picked.add(index)
+  }
+
+  const sample = Array.from(picked, (index) => items[index])
+  if (sample.length < count) {
+    const rest = items.filter((_, index) => !picked.has(index))
+    sample.push(...sampleUniform(rest, count - sample.length, random))
+  }
+  return sample
+}
+
+interface MasteryTable {
+  cache: WordCache
+  table: AliasTable
+  builtAt: number
+}
+
+const masteryTables = new Map<string, MasteryTable>()
+
+function masteryTableKey(userId: string | null) {
+  return `${userId ?? ''}:`
+}
+
+// Alias table over cache.list(difficulty) weighted by the learner's mastery,
+// built from one FlashcardProgress query and reused until it goes stale
+export async function getMasteryTable(
+  cache: WordCache,
+  userId: string | null,
+  difficulty: string | null
+): Promise<AliasTable> {
+  const key = masteryTableKey(userId) + (difficulty ?? '')
+  const cached = masteryTables.get(key)
+  if (cached && cached.cache === cache && Date.now() - cached.builtAt < MASTERY_TABLE_MAX_AGE_MS) {
+    return cached.table
+  }
+
+  const progress = await prisma.flashcardProgress.findMany({
+    where: { userId: userId || null },
+    select: { wordId: true, masteryLevel: true },
+  })
+  const mastery = new Map(progress.map((p) => [p.wordId, p.masteryLevel]))
+  const table = new AliasTable(cache.list(difficulty).map((word) => masteryWeight(mastery.get(word.id))))
+
+  masteryTables.delete(key)
+  masteryTables.set(key, { cache, table, builtAt: Date.now() })
+  // Maps iterate in insertion order, so the first key is the least recently built table
+  if (masteryTables.size > MAX_MASTERY_TABLES) {
+    masteryTables.delete(masteryTables.keys().next().value as string)
+  }
+  return table
+}
+
+// Drops a learner's alias tables so the next weighted draw sees their latest reviews
+export function invalidateMasteryTables(userId: string | null) {
+  const prefix = masteryTableKey(userId)
+  for (const key of Array.from(masteryTables.keys())) {
+    if (key.startsWith(prefix)) masteryTables.delete(key)
+  }
+}
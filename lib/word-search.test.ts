@@ -0,0 +1,35 @@
+import assert from 'node:assert/strict'
+import { test } from 'node:test'
+import { WordSearchIndex } from './word-search'
+
+const difficulty: Record<string, string> = {
+  abase: 'easy',
+  abate: 'easy',
+  abdicate: 'hard',
+  aberration: 'hard',
+  abet: 'easy',
+  abeyance: 'hard',
+  abhor: 'medium',
+  abject: 'medium',
+}
+const index = new WordSearchIndex(Object.keys(difficulty))
+const level = (wanted: string) => (word: string) => difficulty[word] === wanted
+
+test('a difficulty filter is applied before the limit', () => {
+  // The first two prefix matches are easy words; the hard ones come later
+  const matches = index.search('ab', 2, level('hard')).map((match) => match.word)
+  assert.deepEqual(matches, ['abdicate', 'aberration'])
+})
+
+test('a filtered search fills the limit from typo matches', () => {
+  const matches = index.search('abjeck', 3, level('medium')).map((match) => match.word)
+  assert.deepEqual(matches, ['abject'])
+  assert.deepEqual(
+    index.search('abete', 3, level('easy')).map((match) => match.word),
+    ['abate', 'abet']
+  )
+})
+
+test('an unfiltered search still stops at the limit', () => {
+  assert.equal(index.search('ab', 3).length, 3)
+})
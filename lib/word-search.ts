@@ -0,0 +1,143 @@
+import { WordCache, getWordCache } from './word-cache'
+
+// In-memory headword search for GET /api/words?q=. Prefix completion is a
+// binary search over the sorted headwords; typo-tolerant matching walks a
+// BK-tree keyed by Levenshtein distance, so only a few branches are visited
+// per query. Both are built from the word cache and rebuilt when it reloads.
+
+export interface SearchMatch {
+  word: string
+  distance: number
+}
+
+interface BKNode {
+  word: string
+  children: Map<number, BKNode>
+}
+
+export function levenshtein(a: string, b: string): number {
+  if (a === b) return 0
+  if (a.length === 0) return b.length
+  if (b.length === 0) return a.length
+
+  let previous = new Array<number>(b.length + 1)
+  let current = new Array<number>(b.length + 1)
+  for (let j = 0; j <= b.length; j++) previous[j] = j
+
+  for (let i = 1; i <= a.length; i++) {
+    current[0] = i
+    for (let j = 1; j <= b.length; j++) {
+      const cost = a[i - 1] === b[j - 1] ? 0 : 1
+      current[j] = Math.min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+    }
+    ;[previous, current] = [current, previous]
+  }
+  return previous[b.length]
+}
+
+// Typos allowed for a query: none for very short ones, two for long ones
+export function maxTypos(query: string): number {
+  if (query.length <= 3) return 0
+  return query.length <= 6 ? 1 : 2
+}
+
+export class WordSearchIndex {
+  readonly size: number
+  private sorted: string[]
+  private root: BKNode | null = null
+
+  constructor(words: string[]) {
+    this.sorted = Array.from(new Set(words.map((w) => w.toLowerCase().trim()))).sort()
+    this.size = this.sorted.length
+    for (const word of this.sorted) this.insert(word)
+  }
+
+  private insert(word: string) {
+    if (!this.root) {
+      this.root = { word, children: new Map() }
+      return
+    }
+    let node = this.root
+    for (;;) {
+      const distance = levenshtein(word, node.word)
+      const child = node.children.get(distance)
+      if (!child) {
+        node.children.set(distance, { word, children: new Map() })
+        return
+      }
+      node = child
+    }
+  }
+
+  // Headwords starting with prefix and passing accept, in alphabetical order
+  prefix(prefix: string, limit = 10, accept?: (word: string) => boolean): string[] {
+    let low = 0
+    let high = this.sorted.length
+    while (low < high) {
+      const mid = (low + high) >>> 1
+      if (this.sorted[mid] < prefix) low = mid + 1
+      else high = mid
+    }
+    const matches: string[] = []
+    for (let i = low; i < this.sorted.length && matches.length < limit; i++) {
+      if (!this.sorted[i].startsWith(prefix)) break
+      if (!accept || accept(this.sorted[i])) matches.push(this.sorted[i])
+    }
+    return matches
+  }
+
+  // Headwords within maxDistance edits of query and passing accept, closest first
+  fuzzy(
+    query: string,
+    maxDistance: number,
+    limit = 10,
+    accept?: (word: string) => boolean
+  ): SearchMatch[] {
+    const matches: SearchMatch[] = []
+    const stack = this.root ? [this.root] : []
+    while (stack.length > 0) {
+      const node = stack.pop() as BKNode
+      const distance = levenshtein(query, node.word)
+      if (distance <= maxDistance && (!accept || accept(node.word))) {
+        matches.push({ word: node.word, distance })
+      }
+      // Triangle inequality: only children within maxDistance of this distance can match
+      node.children.forEach((child, edge) => {
+        if (edge >= distance - maxDistance && edge <= distance + maxDistance) stack.push(child)
+      })
+    }
+    return matches
+      .sort((a, b) => a.distance - b.distance || (a.word < b.word ? -1 : 1))
+      .slice(0, limit)
+  }
+
+  // Prefix completions first, then typo-tolerant matches. accept filters
+  // headwords (e.g. by difficulty) before the limit is applied, so a filtered
+  // search still returns up to limit matches.
+  search(query: string, limit = 10, accept?: (word: string) => boolean): SearchMatch[] {
+    const q = query.toLowerCase().trim()
+    if (!q) return []
+
+    const results: SearchMatch[] = this.prefix(q, limit, accept).map((word) => ({ word, distance: 0 }))
+    if (results.length < limit && maxTypos(q) > 0) {
+      const seen = new Set(results.map((match) => match.word))
+      // Prefix matches are also within the typo budget, so ask for enough to skip them
+      for (const match of this.fuzzy(q, maxTypos(q), limit + results.length, accept)) {
+        if (results.length >= limit) break
+        if (!seen.has(match.word)) results.push(match)
+      }
+    }
+    return results
+  }
+}
+
+let cachedIndex: { cache: WordCache; index: WordSearchIndex } | null = null
+
+// Builds the index from the cached words, again whenever the word cache reloads
+export async function getWordSearchIndex(): Promise<WordSearchIndex> {
+  const cache = await getWordCache()
+  if (!cachedIndex || cachedIndex.cache !== cache) {
+    cachedIndex = { cache, index: new WordSearchIndex(cache.words.map((word) => word.word)) }
+  }
+  return cachedIndex.index
+}
@@ -0,0 +1,22 @@
+import { POOL_DIFFICULTIES, POOL_WORD_COUNTS, fillPool } from '../../lib/crossword-pool'
+
+// Netlify background function that tops up one crossword pool. POST
+// /api/crosswords/generate sends it { difficulty, wordCount } when a claim
+// leaves the pool below its low-water mark (see refillPoolIfLow); fillPool
+// counts the pool first, so a repeated call only fills what is missing.
+export default async (request: Request) => {
+  const { difficulty, wordCount } = await request.json().catch(() => ({}))
+  if (
+    !(POOL_DIFFICULTIES as readonly string[]).includes(difficulty) ||
+    !(POOL_WORD_COUNTS as readonly number[]).includes(wordCount)
+  ) {
+    console.error('fill-crossword-pool-background: invalid difficulty or wordCount')
+    return
+  }
+  const start = Date.now()
+  const { pooled, created, failed } = await fillPool(difficulty, wordCount)
+  console.log(
+    `fill-crossword-pool-background: ${difficulty} / ${wordCount} words: ${pooled} pooled ` +
+      `(+${created}, ${failed} failed attempts) in ${Date.now() - start}ms`
+  )
+}
@@ -0,0 +1,16 @@
+import { runImportJob } from '../../lib/import-jobs'
+
+// Netlify background function (the -background suffix lets it run for up to
+// 15 minutes after the caller has had its 202). POST /api/admin/import sends
+// it { jobId } for a queued ImportJob; runImportJob claims the job, so a
+// repeated or stray call for the same id does nothing.
+export default async (request: Request) => {
+  const { jobId } = await request.json().catch(() => ({}))
+  if (typeof jobId !== 'string') {
+    console.error('import-vocab-background: missing jobId')
+    return
+  }
+  if (!(await runImportJob(jobId))) {
+    console.warn(`import-vocab-background: job ${jobId} is not queued`)
+  }
+}
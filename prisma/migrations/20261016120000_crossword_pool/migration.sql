@@ -0,0 +1,5 @@
+-- AlterTable
+ALTER TABLE "Crossword" ADD COLUMN     "pooled" BOOLEAN NOT NULL DEFAULT false;
+
+-- CreateIndex
+CREATE INDEX "Crossword_pooled_difficulty_wordCount_idx" ON "Crossword"("pooled", "difficulty", "wordCount");
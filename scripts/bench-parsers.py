@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vocabulary parsers on synthetic corpora.
+
+Generates a corpus per size (cached under the work directory), then runs
+each parser stage by stage (read, segment, parse, dedup, sort) and reports
+throughput and peak traced memory per stage.
+"""
+
+import argparse
+import importlib.util
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from vocab_pipeline import (
+    DEFAULT_STAGES,
+    TOKEN_STAGES,
+    dedupe,
+    iter_blocks,
+    parse_entries,
+    parse_tokens,
+    read_chunks,
+    read_lines,
+    tokenize,
+)
+from vocab_pipeline.parser import apply_stages, build_entry
+from vocab_pipeline.stages import cut_merged_entry, split_head
+from vocab_pipeline.synthetic import write_corpus
+
+SCRIPT_DIR = Path(__file__).parent
+
+# Old standalone scripts and the name of their per-block parse function
+LEGACY_SCRIPTS = {
+    'parse_sat_vocab': ('parse_sat_vocab.py', 'parse_entry'),
+    'parse_sat_vocab_improved': ('parse_sat_vocab_improved.py', 'parse_entry'),
+    'reparse-vocab-correctly': ('reparse-vocab-correctly.py', 'parse_entry'),
+    'parse-correctly-final': ('parse-correctly-final.py', 'parse_entry'),
+    'parse-perfect': ('parse-perfect.py', 'parse_entry'),
+    'ultimate-parser': ('ultimate-parser.py', 'parse_entry'),
+    'simple-correct-parser': ('simple-correct-parser.py', 'parse_entry'),
+    'final-fix-vocab': ('final-fix-vocab.py', 'parse_line'),
+}
+
+
+def load_legacy(name):
+    """Import a hyphenated legacy script and return its parse function."""
+    filename, func_name = LEGACY_SCRIPTS[name]
+    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), SCRIPT_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, func_name)
+
+
+def engine_stages(path):
+    """Stage functions for the tokenizer-based engine."""
+    return [
+        ('read', lambda _: list(read_chunks(path))),
+        ('segment', lambda chunks: list(tokenize(chunks))),
+        ('parse', lambda tokens: list(parse_tokens(tokens))),
+    ]
+
+
+def blocks_stages(path):
+    """Stage functions for the engine's regex block path."""
+    return [
+        ('read', lambda _: list(read_lines(path))),
+        ('segment', lambda lines: list(iter_blocks(lines))),
+        ('parse', lambda blocks: list(parse_entries(blocks, DEFAULT_STAGES))),
+    ]
+
+
+def cascade_entries(lines):
+    """Segment like the engine's tokenizer, but with the per-line regex cascade."""
+    entries = []
+    for block in iter_blocks(lines):
+        entry = split_head({'text': block})
+        if entry is not None:
+            entries.append(cut_merged_entry(entry))
+    return entries
+
+
+def cascade_stages(path):
+    """Stage functions for the per-line cascade the tokenizer replaced.
+
+    Its segment stage finds heads and cuts merged entries, so it does the
+    same work as the engine's segment stage.
+    """
+    return [
+        ('read', lambda _: list(read_lines(path))),
+        ('segment', cascade_entries),
+        ('parse', lambda entries: [
+            build_entry(e) for e in (apply_stages(e, TOKEN_STAGES) for e in entries) if e
+        ]),
+    ]
+
+
+def legacy_stages(path, parse_func):
+    """Stage functions for a legacy script's parse function."""
+    return [
+        ('read', lambda _: list(read_lines(path))),
+        ('segment', lambda lines: list(iter_blocks(lines))),
+        ('parse', lambda blocks: [e for e in map(parse_func, blocks) if e]),
+    ]
+
+
+BUILTIN_PARSERS = {
+    'engine': engine_stages,
+    'blocks': blocks_stages,
+    'cascade': cascade_stages,
+}
+
+
+def common_stages():
+    return [
+        ('dedup', lambda entries: dedupe(entries, 'keep-first')),
+        ('sort', lambda entries: sorted(entries, key=lambda x: x['word'])),
+    ]
+
+
+def run_stages(stages, lines, trace_memory):
+    """Run stages in order, returning per-stage rows and the final output."""
+    rows = []
+    data = None
+    for name, func in stages:
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        data = func(data)
+        seconds = time.perf_counter() - start
+        peak = None
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        rows.append({
+            'stage': name,
+            'seconds': seconds,
+            'lines_per_sec': lines / seconds if seconds else None,
+            'items': len(data),
+            'peak_bytes': peak,
+        })
+    return rows, data
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        '--sizes', default='1000,10000,100000',
+        help='comma-separated corpus sizes in entries (default: 1000,10000,100000)',
+    )
+    arg_parser.add_argument(
+        '--parsers', default='engine,blocks,cascade,' + ','.join(LEGACY_SCRIPTS),
+        help='comma-separated parsers: engine, blocks, cascade and legacy script names',
+    )
+    arg_parser.add_argument(
+        '--workdir', default=Path('/tmp/sat-vocab-bench'), type=Path,
+        help='where generated corpora are kept',
+    )
+    arg_parser.add_argument('--seed', default=0, type=int, help='corpus seed')
+    arg_parser.add_argument(
+        '--no-memory', action='store_true',
+        help='skip the tracemalloc run (peak memory is measured in a separate pass)',
+    )
+    arg_parser.add_argument('--json', type=Path, help='also write results to this JSON file')
+    args = arg_parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    parsers = [name.strip() for name in args.parsers.split(',') if name.strip()]
+    for name in parsers:
+        if name not in BUILTIN_PARSERS and name not in LEGACY_SCRIPTS:
+            arg_parser.error(f'Unknown parser {name!r}')
+
+    args.workdir.mkdir(parents=True, exist_ok=True)
+    results = []
+
+    for size in sizes:
+        corpus = args.workdir / f'corpus-{size}-{args.seed}.txt'
+        if not corpus.exists():
+            print(f"Generating {size} entries -> {corpus}...")
+            write_corpus(corpus, size, args.seed)
+        with open(corpus, 'r', encoding='utf-8') as f:
+            lines = sum(1 for _ in f)
+
+        print(f"\n{size} entries, {lines} lines")
+        print(f"  {'parser':<26} {'stage':<8} {'seconds':>9} {'lines/s':>12} {'items':>9} {'peak MiB':>9}")
+
+        for name in parsers:
+            if name in BUILTIN_PARSERS:
+                stages = BUILTIN_PARSERS[name](corpus)
+            else:
+                stages = legacy_stages(corpus, load_legacy(name))
+            stages += common_stages()
+
+            rows, _ = run_stages(stages, lines, trace_memory=False)
+            if not args.no_memory:
+                memory_rows, _ = run_stages(stages, lines, trace_memory=True)
+                for row, memory_row in zip(rows, memory_rows):
+                    row['peak_bytes'] = memory_row['peak_bytes']
+
+            for row in rows:
+                peak = f"{row['peak_bytes'] / (1 << 20):.1f}" if row['peak_bytes'] is not None else '-'
+                print(
+                    f"  {name:<26} {row['stage']:<8} {row['seconds']:>9.3f} "
+                    f"{row['lines_per_sec'] or 0:>12,.0f} {row['items']:>9} {peak:>9}"
+                )
+                results.append(dict(row, parser=name, entries=size, lines=lines))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✅ Wrote {len(results)} rows to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+import { prisma } from '../lib/prisma'
+import { AliasTable, masteryWeight, sampleUniform, sampleWeighted } from '../lib/word-sampling'
+
+// Benchmarks random study-set sampling for GET /api/words?random=true: the
+// previous count + skip/take window with a sort-based shuffle against uniform
+// and mastery-weighted sampling from memory. Besides time per set it reports
+// how often neighbouring headwords land in the same set and how unevenly
+// words are drawn (max / min draw count over all runs).
+// Usage: npx tsx scripts/bench-sampling.ts [--words 1000] [--set-size 20] [--runs 20000] [--db]
+
+function argValue(name: string): string | undefined {
+  const index = process.argv.indexOf(name)
+  return index >= 0 ? process.argv[index + 1] : undefined
+}
+
+type Sampler = (size: number) => number[]
+
+// The previous route, minus the database: a random contiguous window, then sort(() => Math.random() - 0.5)
+function windowSample(n: number): Sampler {
+  return (size) => {
+    const skip = Math.floor(Math.random() * Math.max(0, n - size))
+    const window: number[] = []
+    for (let i = skip; i < Math.min(n, skip + size); i++) window.push(i)
+    return window.sort(() => Math.random() - 0.5)
+  }
+}
+
+function measure(name: string, n: number, size: number, runs: number, sampler: Sampler) {
+  const draws = new Array<number>(n).fill(0)
+  let neighbours = 0
+  const start = process.hrtime.bigint()
+  for (let run = 0; run < runs; run++) {
+    const sample = sampler(size)
+    const inSet = new Set(sample)
+    for (const index of sample) {
+      draws[index]++
+      if (inSet.has(index + 1)) neighbours++
+    }
+  }
+  const micros = Number(process.hrtime.bigint() - start) / 1000 / runs
+  const min = Math.min(...draws)
+  const spread = min > 0 ? (Math.max(...draws) / min).toFixed(2) : 'inf'
+  const neighbourShare = ((neighbours / (runs * Math.max(1, size - 1))) * 100).toFixed(1)
+  console.log(
+    `${name.padEnd(22)} ${micros.toFixed(2).padStart(9)} us/set  neighbours ${neighbourShare.padStart(5)}%  max/min draws ${spread}`
+  )
+}
+
+async function measureDatabase(size: number, runs: number) {
+  let start = Date.now()
+  for (let run = 0; run < runs; run++) {
+    const count = await prisma.word.count()
+    const skip = Math.floor(Math.random() * Math.max(0, count - size))
+    await prisma.word.findMany({ take: size, skip })
+  }
+  console.log(`${'count + skip/take (db)'.padEnd(22)} ${(((Date.now() - start) * 1000) / runs).toFixed(2).padStart(9)} us/set`)
+
+  start = Date.now()
+  const words = await prisma.word.findMany()
+  console.log(`${'load word cache (db)'.padEnd(22)} ${((Date.now() - start) * 1000).toFixed(2).padStart(9)} us once (${words.length} words)`)
+}
+
+async function benchSampling() {
+  const n = parseInt(argValue('--words') || '1000')
+  const size = parseInt(argValue('--set-size') || '20')
+  const runs = parseInt(argValue('--runs') || '20000')
+  const items = Array.from({ length: n }, (_, i) => i)
+
+  // Mastery spread over the corpus: a third unseen, the rest at levels 0-5
+  const weights = items.map((i) => masteryWeight(i % 3 === 0 ? undefined : i % 6))
+  let table = new AliasTable(weights)
+
+  console.log(`${n} words, sets of ${size}, ${runs} runs\n`)
+  measure('window + sort shuffle', n, size, runs, windowSample(n))
+  measure('uniform (Fisher-Yates)', n, size, runs, (k) => sampleUniform(items, k))
+  measure('weighted (alias)', n, size, runs, (k) => sampleWeighted(items, table, k))
+
+  const builds = Math.max(1, Math.floor(runs / 100))
+  const start = process.hrtime.bigint()
+  for (let i = 0; i < builds; i++) table = new AliasTable(weights)
+  console.log(`${'alias table build'.padEnd(22)} ${(Number(process.hrtime.bigint() - start) / 1000 / builds).toFixed(2).padStart(9)} us`)
+
+  if (process.argv.includes('--db')) {
+    try {
+      await measureDatabase(size, Math.min(runs, 200))
+    } finally {
+      await prisma.$disconnect()
+    }
+  }
+}
+
+benchSampling()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Compare a parsed vocabulary dataset against a golden file by headword and
+report added, removed and changed entries field by field.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from vocab_pipeline import read_entries
+from vocab_pipeline.golden import diff_datasets, format_report, report_ok
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('golden', type=Path, help='expected dataset (JSON array or NDJSON)')
+    arg_parser.add_argument(
+        'actual', nargs='?', default=project_root / 'data' / 'sats_vocab.json',
+        type=Path, help='produced dataset (default: data/sats_vocab.json)',
+    )
+    arg_parser.add_argument(
+        '--fields', help='comma-separated fields to compare (default: all fields)',
+    )
+    arg_parser.add_argument('--report', type=Path, help='write the full report as JSON')
+    arg_parser.add_argument(
+        '--limit', type=int, default=20,
+        help='max entries printed per category (default: 20)',
+    )
+    args = arg_parser.parse_args()
+
+    fields = args.fields.split(',') if args.fields else None
+    report = diff_datasets(read_entries(args.golden), read_entries(args.actual), fields)
+    print('\n'.join(format_report(report, args.limit)))
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report written to {args.report}")
+
+    if report_ok(report):
+        print("✅ Output matches golden file")
+    else:
+        print("❌ Output differs from golden file")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Run any ordered set of definition cleanups over data/sats_vocab.json in a
+single read/write pass, reporting per-pass timing and change counts.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from vocab_pipeline import read_entries, write_entries
+from vocab_pipeline.passes import PASSES, build_passes, run_passes
+from vocab_pipeline.profile import PipelineProfile
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        'vocab_file', nargs='?', default=project_root / 'data' / 'sats_vocab.json',
+        type=Path, help='dataset to clean in place',
+    )
+    arg_parser.add_argument(
+        '-p', '--passes', default=','.join(PASSES),
+        help=f"comma-separated passes to run in order (default: {','.join(PASSES)})",
+    )
+    arg_parser.add_argument(
+        '--profile', type=Path, metavar='METRICS',
+        help='run read, clean and write one after another and record per-stage metrics to this JSON file',
+    )
+    arg_parser.add_argument(
+        '--profile-memory', action='store_true',
+        help='with --profile, also record peak traced memory per stage; tracing slows '
+             'every stage, so take timings from a separate run without it',
+    )
+    arg_parser.add_argument(
+        '--profile-dump', type=Path, metavar='DIR',
+        help='with --profile, also dump a cProfile (and with --profile-memory a '
+             'tracemalloc snapshot) per stage',
+    )
+    args = arg_parser.parse_args()
+
+    try:
+        passes = build_passes([name.strip() for name in args.passes.split(',') if name.strip()])
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    print(f"Cleaning {args.vocab_file}...")
+    start = time.perf_counter()
+    if args.profile:
+        profile = PipelineProfile(dump_dir=args.profile_dump, trace_memory=args.profile_memory)
+        entries = profile.run('read', list, read_entries(args.vocab_file))
+        entries = profile.run('clean', list, run_passes(entries, passes))
+        with profile.stage('write') as record:
+            total = record['items'] = write_entries(args.vocab_file, entries)
+    else:
+        total = write_entries(args.vocab_file, run_passes(read_entries(args.vocab_file), passes))
+    elapsed = time.perf_counter() - start
+
+    print(f"\n  {'pass':<24} {'changed':>8} {'time (ms)':>10}")
+    for cleanup in passes:
+        print(f"  {cleanup.name:<24} {cleanup.changed:>8} {cleanup.seconds * 1000:>10.1f}")
+
+    print(f"\n✅ Cleaned {total} entries in {elapsed * 1000:.1f} ms (one read, one write)")
+
+    if args.profile:
+        print()
+        print('\n'.join(profile.format_table()))
+        profile.write(args.profile, input=args.vocab_file, passes=[p.name for p in passes])
+        print(f"\n✅ Wrote stage metrics to {args.profile}")
+
+
+if __name__ == '__main__':
+    main()
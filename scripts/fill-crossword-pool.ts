@@ -0,0 +1,55 @@
+import { prisma } from '../lib/prisma'
+import {
+  DEFAULT_POOL_TARGET,
+  POOL_DIFFICULTIES,
+  POOL_WORD_COUNTS,
+  fillPool,
+} from '../lib/crossword-pool'
+
+// Tops up the pre-generated crossword pool for every difficulty and word count.
+// Usage: npm run db:fill-pool -- [--target 20] [--difficulty medium] [--word-count 15]
+
+function argValue(name: string): string | undefined {
+  const index = process.argv.indexOf(name)
+  return index >= 0 ? process.argv[index + 1] : undefined
+}
+
+async function fillCrosswordPool() {
+  const target = parseInt(argValue('--target') || String(DEFAULT_POOL_TARGET))
+  const difficulty = argValue('--difficulty')
+  const wordCount = argValue('--word-count')
+
+  if (difficulty && !(POOL_DIFFICULTIES as readonly string[]).includes(difficulty)) {
+    console.error('--difficulty must be easy, medium, or hard')
+    process.exit(1)
+  }
+
+  const difficulties = difficulty ? [difficulty] : [...POOL_DIFFICULTIES]
+  const wordCounts = wordCount ? [parseInt(wordCount)] : [...POOL_WORD_COUNTS]
+
+  try {
+    console.log(`Filling crossword pool to ${target} puzzles per difficulty and size...`)
+
+    for (const d of difficulties) {
+      for (const count of wordCounts) {
+        const start = Date.now()
+        const { pooled, created, failed } = await fillPool(d, count, target)
+        console.log(
+          `${d} / ${count} words: ${pooled} pooled (+${created}, ${failed} failed attempts) in ${Date.now() - start}ms`
+        )
+        if (pooled < target) {
+          console.warn(`  Pool for ${d} / ${count} words is below target; not enough words place cleanly.`)
+        }
+      }
+    }
+
+    console.log('\nCrossword pool is topped up.')
+  } catch (error: any) {
+    console.error('Filling the crossword pool failed:', error.message)
+    process.exit(1)
+  } finally {
+    await prisma.$disconnect()
+  }
+}
+
+fillCrosswordPool()
@@ -7,36 +7,22 @@ import json
 import re
 from pathlib import Path
 
-def normalize_pos(pos_str):
-    if not pos_str:
-        return None
-    pos_lower = pos_str.lower().strip()
-    if 'adj' in pos_lower:
-        return 'adjective'
-    elif 'adv' in pos_lower:
-        return 'adverb'
-    elif pos_lower.startswith('n.') or pos_lower == 'n':
-        return 'noun'
-    elif pos_lower.startswith('v.') or pos_lower == 'v':
-        return 'verb'
-    return pos_str.strip()
+from vocab_pipeline import is_paren_entry_start, iter_blocks, read_lines
+from vocab_pipeline.normalize import ABBREVIATION_POS_RULES, Normalizer, STOPWORDS
+from vocab_pipeline.parens import ParenIndex
+
+_normalizer = Normalizer(
+    pos_rules=ABBREVIATION_POS_RULES,
+    stopwords=[word for word in STOPWORDS if word not in ('so', 'if', 'as', 'well')],
+)
 
 def extract_complete_definition(text):
     """Extract the definition part, stopping before example sentence."""
     # Find the last complete parenthetical expression (the example)
     # Everything before that is the definition
-    
-    # Count parentheses to find complete pairs
-    depth = 0
-    last_complete_end = -1
-    
-    for i, char in enumerate(text):
-        if char == '(':
-            depth += 1
-        elif char == ')':
-            depth -= 1
-            if depth == 0:
-                last_complete_end = i
+    index = ParenIndex(text)
+    span = index.last_span()
+    last_complete_end = span[1] if span else -1
     
     if last_complete_end > 0:
         # Extract definition (everything before the last complete parentheses)
@@ -51,8 +37,7 @@ def extract_complete_definition(text):
     
     # No complete example found, return whole text as definition
     # But remove incomplete trailing parentheses
-    cleaned = re.sub(r'\s*\([^)]*$', '', text).strip()
-    return cleaned, None
+    return index.without_tail().strip(), None
 
 def parse_line(line):
     """Parse a single line entry."""
@@ -66,14 +51,14 @@ def parse_line(line):
         return None
     
     word = match.group(1).lower().strip()
-    pos = normalize_pos(match.group(2))
+    pos = _normalizer.normalize_pos(match.group(2))
     content = match.group(3).strip()
     
     # Extract definition and example
     definition, example = extract_complete_definition(content)
     
     # Clean up definition - remove any trailing incomplete words
-    definition = re.sub(r'\s+(the|a|an|which|that|when|where|who|what|how|are|is|was|were|be|not|to|of|in|on|at|for|with|from|and|or|but)$', '', definition, flags=re.IGNORECASE).strip()
+    definition = _normalizer.trim_stopwords(definition)
     
     # Remove trailing commas
     definition = definition.rstrip(',').strip()
@@ -92,36 +77,9 @@ def main():
     output_file = project_root / 'data' / 'sats_vocab.json'
     
     print(f"Reading from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
     entries = []
-    current_lines = []
-    
-    for line in lines:
-        line = line.strip()
-        
-        # Check if starts new entry
-        is_new = bool(re.match(r'^[a-z]+\s*\(', line, re.IGNORECASE))
-        
-        if is_new and current_lines:
-            combined = ' '.join(current_lines)
-            parsed = parse_line(combined)
-            if parsed:
-                entries.append(parsed)
-            current_lines = [line]
-        elif line:
-            current_lines.append(line)
-        elif current_lines:
-            combined = ' '.join(current_lines)
-            parsed = parse_line(combined)
-            if parsed:
-                entries.append(parsed)
-            current_lines = []
-    
-    if current_lines:
-        combined = ' '.join(current_lines)
-        parsed = parse_line(combined)
+    for block in iter_blocks(read_lines(input_file), is_paren_entry_start):
+        parsed = parse_line(block)
         if parsed:
             entries.append(parsed)
     
@@ -139,8 +97,9 @@ def main():
     
     # Verify samples
     print("\nSample entries:")
+    by_word = {e['word']: e for e in unique}
     for word in ['affable', 'gregarious', 'indigenous', 'aesthetic', 'agile']:
-        entry = next((e for e in unique if e['word'] == word), None)
+        entry = by_word.get(word)
         if entry:
             print(f"  {word}: {entry['definition']}")
     
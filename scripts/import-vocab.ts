@@ -1,105 +1,81 @@
-import { PrismaClient } from '@prisma/client'
+import { prisma } from '../lib/prisma'
 import { loadVocabFile } from '../lib/vocab-check'
+import {
+  BatchReport,
+  DEFAULT_BATCH_RETRIES,
+  DEFAULT_CHUNK_SIZE,
+  prepareWordRows,
+  replaceWords,
+  syncWords,
+} from '../lib/vocab-import'
 
-const prisma = new PrismaClient()
+// Syncs the Word table with data/sats_vocab.json: only new, edited and removed
+// words are written, so progress on the rest is kept. --replace clears Word and
+// every table that references it and inserts from scratch instead.
+// Usage: npm run db:import -- [--replace] [--batch-size 500] [--retries 2]
 
-interface VocabEntry {
-  word: string
-  partOfSpeech?: string
-  definition: string
-  synonyms?: string[] | string
-  exampleSentence?: string
-  difficulty?: string
-}
-
-function determineDifficulty(word: string, definition: string): string {
-  const length = word.length
-  const defLength = definition.length
-  
-  if (length <= 5 && defLength <= 50) return 'easy'
-  if (length >= 10 || defLength >= 100) return 'hard'
-  return 'medium'
+function argValue(name: string): string | undefined {
+  const index = process.argv.indexOf(name)
+  return index >= 0 ? process.argv[index + 1] : undefined
 }
 
 async function importVocab() {
+  const chunkSize = parseInt(argValue('--batch-size') || String(DEFAULT_CHUNK_SIZE))
+  const retries = parseInt(argValue('--retries') || String(DEFAULT_BATCH_RETRIES))
+  const replace = process.argv.includes('--replace')
+
+  if (!(chunkSize > 0) || !(retries >= 0)) {
+    console.error('--batch-size must be a positive number and --retries zero or more')
+    process.exit(1)
+  }
+
   try {
     console.log('Loading SAT vocabulary file...')
     const vocab = loadVocabFile()
-    
-    console.log(`Found ${vocab.length} words. Starting import...`)
-    
-    // Clear existing data (must delete in order due to foreign keys)
-    await prisma.flashcardProgress.deleteMany({})
-    await prisma.crosswordWord.deleteMany({})
-    await prisma.crosswordProgress.deleteMany({})
-    await prisma.crossword.deleteMany({})
-    await prisma.word.deleteMany({})
-    console.log('Cleared existing words and related data.')
-    
-    let imported = 0
-    let skipped = 0
-    
-    for (const entry of vocab) {
-      try {
-        // Skip placeholder entries
-        if ((entry as any)._note || (entry as any)._source || (entry as any)._format) {
-          continue
-        }
-        
-        const vocabEntry = entry as VocabEntry
-        
-        if (!vocabEntry.word || !vocabEntry.definition) {
-          console.warn(`Skipping entry missing word or definition:`, entry)
-          skipped++
-          continue
-        }
-        
-        const synonyms = Array.isArray(vocabEntry.synonyms)
-          ? JSON.stringify(vocabEntry.synonyms)
-          : typeof vocabEntry.synonyms === 'string'
-          ? vocabEntry.synonyms
-          : null
-        
-        const difficulty = vocabEntry.difficulty || determineDifficulty(
-          vocabEntry.word,
-          vocabEntry.definition
+
+    const { rows, skipped, duplicates } = prepareWordRows(vocab)
+    for (const word of duplicates) {
+      console.warn(`Duplicate word skipped: ${word}`)
+    }
+
+    const mode = replace ? 'Replacing all words' : 'Syncing changed words'
+    console.log(`Found ${rows.length} words. ${mode} in batches of ${chunkSize}...`)
+
+    const options = {
+      chunkSize,
+      retries,
+      onBatch: ({ operation, batch, batches, rows, attempts, ms, rowsPerSecond }: BatchReport) => {
+        const retried = attempts > 1 ? ` after ${attempts} attempts` : ''
+        console.log(
+          `${operation} batch ${batch}/${batches}: ${rows} words in ${ms}ms (${rowsPerSecond} rows/s)${retried}`
         )
-        
-        await prisma.word.create({
-          data: {
-            word: vocabEntry.word.toLowerCase().trim(),
-            partOfSpeech: vocabEntry.partOfSpeech || null,
-            definition: vocabEntry.definition,
-            synonyms: synonyms,
-            exampleSentence: vocabEntry.exampleSentence || null,
-            difficulty: difficulty,
-          },
-        })
-        
-        imported++
-        if (imported % 50 === 0) {
-          console.log(`Imported ${imported} words...`)
-        }
-      } catch (error: any) {
-        if (error.code === 'P2002') {
-          console.warn(`Duplicate word skipped: ${entry.word}`)
-          skipped++
-        } else {
-          console.error(`Error importing word ${entry.word}:`, error.message)
-          skipped++
-        }
+      },
+    }
+
+    // All writes share one transaction, so a failed import leaves the old words in place
+    const start = Date.now()
+    if (replace) {
+      const { inserted } = await replaceWords(prisma, rows, options)
+      console.log(`\nImport complete in ${Date.now() - start}ms!`)
+      console.log(`Imported: ${inserted}`)
+    } else {
+      const { inserted, updated, deleted, unchanged, crosswordsRemoved } = await syncWords(prisma, rows, options)
+      console.log(`\nSync complete in ${Date.now() - start}ms!`)
+      console.log(`Inserted: ${inserted}`)
+      console.log(`Updated: ${updated}`)
+      console.log(`Deleted: ${deleted}`)
+      console.log(`Unchanged: ${unchanged}`)
+      if (crosswordsRemoved > 0) {
+        console.log(`Crosswords removed (used changed or deleted words): ${crosswordsRemoved}`)
       }
     }
-    
-    console.log(`\nImport complete!`)
-    console.log(`Imported: ${imported}`)
     console.log(`Skipped: ${skipped}`)
-    
+
     const totalWords = await prisma.word.count()
     console.log(`Total words in database: ${totalWords}`)
-    
+
   } catch (error: any) {
-    console.error('Import failed:', error.message)
+    console.error('Import failed, database left unchanged:', error.message)
     process.exit(1)
   } finally {
     await prisma.$disconnect()
@@ -107,4 +83,3 @@ async function importVocab() {
 }
 
 importVocab()
-
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Build the definition term index data/sats_vocab.terms from
+data/sats_vocab.json: normalized definition terms mapped to the headwords
+that use them, for "words meaning X" queries and related-word suggestions.
+"""
+
+import argparse
+from pathlib import Path
+
+from vocab_pipeline import read_entries
+from vocab_pipeline.terms import TermIndex, write_index
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        'input', nargs='?', default=project_root / 'data' / 'sats_vocab.json',
+        type=Path, help='dataset to index (JSON array or NDJSON)',
+    )
+    arg_parser.add_argument(
+        '-o', '--output', default=project_root / 'data' / 'sats_vocab.terms',
+        type=Path, help='index path',
+    )
+    args = arg_parser.parse_args()
+
+    words, terms = write_index(args.output, read_entries(args.input))
+    size = args.output.stat().st_size
+    print(f"✅ Indexed {terms} terms across {words} words into {args.output} ({size} bytes)")
+
+    with TermIndex(args.output) as index:
+        for query in ['friendly', 'praise']:
+            matches = ', '.join(word for word, _ in index.search(query, 5))
+            print(f"  {query}: {matches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Bulk-load data/sats_vocab.json into the Word table: executemany batches
+for SQLite, COPY for PostgreSQL, all in one transaction. Words are upserted
+by headword so learner progress is kept; --replace clears the tables first.
+The packed artifact data/sats_vocab.bin is read instead of the JSON file
+when it is at least as new.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from vocab_pipeline.binary import artifact_path, read_dataset
+from vocab_pipeline.loader import REPLACE_WARNING, default_database_url, load
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        'input', nargs='?', default=project_root / 'data' / 'sats_vocab.json',
+        type=Path, help='dataset to load (JSON array, NDJSON or packed .bin artifact)',
+    )
+    arg_parser.add_argument(
+        '--database-url', default=default_database_url(),
+        help='Prisma-style DATABASE_URL (default: $DATABASE_URL or file:./prisma/sat_vocab.db)',
+    )
+    arg_parser.add_argument(
+        '--replace', action='store_true',
+        help='clear Word and its dependent tables first, deleting all learner progress',
+    )
+    args = arg_parser.parse_args()
+
+    if args.replace:
+        print(REPLACE_WARNING)
+    print(f"Loading {artifact_path(args.input) or args.input}...")
+    start = time.perf_counter()
+    stats = load(args.database_url, read_dataset(args.input), project_root / 'prisma', args.replace)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"✅ Imported {stats['imported']} words ({stats['inserted']} new, {stats['updated']} updated), "
+        f"skipped {stats['skipped']} in {elapsed:.2f}s"
+    )
+
+
+if __name__ == '__main__':
+    main()
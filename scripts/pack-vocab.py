@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Pack data/sats_vocab.json into the memory-mappable binary artifact
+data/sats_vocab.bin (string table, fixed-width records, sorted headword
+index).
+"""
+
+import argparse
+from pathlib import Path
+
+from vocab_pipeline import read_entries
+from vocab_pipeline.binary import VocabArtifact, write_artifact
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        'input', nargs='?', default=project_root / 'data' / 'sats_vocab.json',
+        type=Path, help='dataset to pack (JSON array or NDJSON)',
+    )
+    arg_parser.add_argument(
+        '-o', '--output', default=project_root / 'data' / 'sats_vocab.bin',
+        type=Path, help='artifact path',
+    )
+    args = arg_parser.parse_args()
+
+    stats = {}
+    count = write_artifact(args.output, read_entries(args.input), stats)
+    size = args.output.stat().st_size
+    print(f"✅ Packed {count} words into {args.output} ({size} bytes)")
+    if stats['skipped']:
+        print(f"  Skipped {stats['skipped']} entries without a word or definition")
+
+    with VocabArtifact(args.output) as artifact:
+        for word in ['affable', 'gregarious']:
+            entry = artifact.lookup(word)
+            if entry:
+                print(f"  {word}: {entry['definition']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,19 +7,11 @@ import json
 import re
 from pathlib import Path
 
-def normalize_pos(pos_str):
-    if not pos_str:
-        return None
-    pos_lower = pos_str.lower().strip()
-    if 'adj' in pos_lower:
-        return 'adjective'
-    elif 'adv' in pos_lower:
-        return 'adverb'
-    elif pos_lower.startswith('n.') or pos_lower == 'n':
-        return 'noun'
-    elif pos_lower.startswith('v.') or pos_lower == 'v':
-        return 'verb'
-    return pos_str.strip()
+from vocab_pipeline import is_paren_entry_start, iter_blocks, read_lines
+from vocab_pipeline.normalize import ABBREVIATION_POS_RULES, Normalizer
+from vocab_pipeline.parens import ParenIndex
+
+_normalizer = Normalizer(pos_rules=ABBREVIATION_POS_RULES)
 
 def split_merged_entries(text):
     """Split text that contains multiple merged entries."""
@@ -42,32 +34,21 @@ def split_merged_entries(text):
 def extract_definition(text):
     """Extract definition, stopping before example sentence."""
     # Find the last complete parenthetical expression
-    depth = 0
-    last_close = -1
-    
-    for i, char in enumerate(text):
-        if char == '(':
-            depth += 1
-        elif char == ')':
-            depth -= 1
-            if depth == 0:
-                last_close = i
-    
-    if last_close > 0:
+    index = ParenIndex(text)
+    span = index.last_span()
+    
+    if span and span[0] > 0:
         # Check if the parenthetical looks like an example (starts with capital)
-        example_start = text.rfind('(', 0, last_close + 1)
-        if example_start > 0:
-            potential_example = text[example_start + 1:last_close]
-            if potential_example and potential_example[0].isupper():
-                # This is an example sentence - definition is before it
-                definition = text[:example_start].strip()
-                # Remove trailing "(" if present
-                definition = definition.rstrip('(').strip()
-                return definition
+        potential_example = index.content(span)
+        if potential_example and potential_example[0].isupper():
+            # This is an example sentence - definition is before it
+            definition = text[:span[0]].strip()
+            # Remove trailing "(" if present
+            definition = definition.rstrip('(').strip()
+            return definition
     
     # No complete example found, remove incomplete parentheses
-    cleaned = re.sub(r'\s*\([^)]*$', '', text).strip()
-    return cleaned
+    return index.without_tail().strip()
 
 def parse_entry(text):
     """Parse a vocabulary entry."""
@@ -81,7 +62,7 @@ def parse_entry(text):
         return None
     
     word = match.group(1).lower().strip()
-    pos = normalize_pos(match.group(2))
+    pos = _normalizer.normalize_pos(match.group(2))
     content = match.group(3).strip()
     
     # Check if this entry is merged with another (contains "word (pos)" pattern)
@@ -95,7 +76,7 @@ def parse_entry(text):
     definition = extract_definition(content)
     
     # Clean up: remove trailing incomplete words
-    definition = re.sub(r'\s+(the|a|an|which|that|when|where|who|what|how|are|is|was|were|be|not|to|of|in|on|at|for|with|from|and|or|but|so|if|as|well)$', '', definition, flags=re.IGNORECASE).strip()
+    definition = _normalizer.trim_stopwords(definition)
     
     # Remove trailing punctuation
     definition = definition.rstrip(',').rstrip('.').strip()
@@ -114,37 +95,9 @@ def main():
     output_file = project_root / 'data' / 'sats_vocab.json'
     
     print(f"Reading from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
     entries = []
-    current_lines = []
-    
-    for line in lines:
-        line = line.strip()
-        
-        # Check if starts new entry
-        is_new = bool(re.match(r'^[a-z]+\s*\(', line, re.IGNORECASE))
-        
-        if is_new and current_lines:
-            combined = ' '.join(current_lines)
-            # Check for merged entries and split them
-            parsed = parse_entry(combined)
-            if parsed:
-                entries.append(parsed)
-            current_lines = [line]
-        elif line:
-            current_lines.append(line)
-        elif current_lines:
-            combined = ' '.join(current_lines)
-            parsed = parse_entry(combined)
-            if parsed:
-                entries.append(parsed)
-            current_lines = []
-    
-    if current_lines:
-        combined = ' '.join(current_lines)
-        parsed = parse_entry(combined)
+    for block in iter_blocks(read_lines(input_file), is_paren_entry_start):
+        parsed = parse_entry(block)
         if parsed:
             entries.append(parsed)
     
@@ -162,8 +115,9 @@ def main():
     
     # Verify samples
     print("\nSample entries:")
+    by_word = {e['word']: e for e in unique}
     for word in ['affable', 'gregarious', 'indigenous', 'aesthetic', 'agile', 'aggregate']:
-        entry = next((e for e in unique if e and e['word'] == word), None)
+        entry = by_word.get(word)
         if entry:
             print(f"  {word}: {entry['definition']}")
     
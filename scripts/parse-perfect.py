@@ -7,19 +7,14 @@ import json
 import re
 from pathlib import Path
 
-def normalize_pos(pos_str):
-    if not pos_str:
-        return None
-    pos_lower = pos_str.lower().strip()
-    if 'adj' in pos_lower:
-        return 'adjective'
-    elif 'adv' in pos_lower:
-        return 'adverb'
-    elif pos_lower.startswith('n.') or pos_lower == 'n':
-        return 'noun'
-    elif pos_lower.startswith('v.') or pos_lower == 'v':
-        return 'verb'
-    return pos_str.strip()
+from vocab_pipeline import is_paren_entry_start, iter_blocks, read_lines
+from vocab_pipeline.normalize import ABBREVIATION_POS_RULES, Normalizer, STOPWORDS
+from vocab_pipeline.parens import ParenIndex
+
+_normalizer = Normalizer(
+    pos_rules=ABBREVIATION_POS_RULES,
+    stopwords=STOPWORDS + ('people', 'he', 'she', 'they', 'it', 'we', 'you', 'i'),
+)
 
 def parse_entry(text):
     """Parse entry: word (pos) definition (example)"""
@@ -33,7 +28,7 @@ def parse_entry(text):
         return None
     
     word = match.group(1).lower().strip()
-    pos = normalize_pos(match.group(2))
+    pos = _normalizer.normalize_pos(match.group(2))
     rest = match.group(3).strip()
     
     # Check if merged with next entry (contains "word (pos)" pattern)
@@ -44,45 +39,21 @@ def parse_entry(text):
     
     # Find the example sentence (last complete parentheses that starts with capital)
     # Look for pattern: definition (Example sentence starts here...
-    paren_pairs = []
-    depth = 0
-    start_idx = -1
-    
-    for i, char in enumerate(rest):
-        if char == '(':
-            if depth == 0:
-                start_idx = i
-            depth += 1
-        elif char == ')':
-            depth -= 1
-            if depth == 0 and start_idx != -1:
-                paren_pairs.append((start_idx, i))
-                start_idx = -1
-    
-    # Find the last complete parentheses that looks like an example
-    example_start = -1
-    example_end = -1
+    index = ParenIndex(rest)
+    span = index.last_example_span(min_length=10)
     
-    for start, end in reversed(paren_pairs):
-        content = rest[start + 1:end].strip()
-        # Check if it looks like an example sentence (starts with capital, has reasonable length)
-        if content and content[0].isupper() and len(content) > 10:
-            example_start = start
-            example_end = end
-            break
-    
-    if example_start > 0:
+    if span and span[0] > 0:
         # Extract definition (everything before the example)
-        definition = rest[:example_start].strip()
+        definition = rest[:span[0]].strip()
         # Remove trailing "(" if present
         definition = definition.rstrip('(').strip()
     else:
         # No complete example found, remove incomplete parentheses
-        definition = re.sub(r'\s*\([^)]*$', '', rest).strip()
+        definition = index.without_tail().strip()
     
     # Clean up definition: remove trailing incomplete words
     # But be careful not to remove valid words
-    definition = re.sub(r'\s+(the|a|an|which|that|when|where|who|what|how|are|is|was|were|be|not|to|of|in|on|at|for|with|from|and|or|but|so|if|as|well|people|he|she|they|it|we|you|i)$', '', definition, flags=re.IGNORECASE).strip()
+    definition = _normalizer.trim_stopwords(definition)
     
     # Remove trailing punctuation
     definition = definition.rstrip(',').rstrip('.').strip()
@@ -101,34 +72,9 @@ def main():
     output_file = project_root / 'data' / 'sats_vocab.json'
     
     print(f"Reading from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
     entries = []
-    current_lines = []
-    
-    for line in lines:
-        line = line.strip()
-        is_new = bool(re.match(r'^[a-z]+\s*\(', line, re.IGNORECASE))
-        
-        if is_new and current_lines:
-            combined = ' '.join(current_lines)
-            parsed = parse_entry(combined)
-            if parsed:
-                entries.append(parsed)
-            current_lines = [line]
-        elif line:
-            current_lines.append(line)
-        elif current_lines:
-            combined = ' '.join(current_lines)
-            parsed = parse_entry(combined)
-            if parsed:
-                entries.append(parsed)
-            current_lines = []
-    
-    if current_lines:
-        combined = ' '.join(current_lines)
-        parsed = parse_entry(combined)
+    for block in iter_blocks(read_lines(input_file), is_paren_entry_start):
+        parsed = parse_entry(block)
         if parsed:
             entries.append(parsed)
     
@@ -146,9 +92,10 @@ def main():
     
     # Verify critical samples
     print("\nVerifying key entries:")
+    by_word = {e['word']: e for e in unique}
     test_words = ['affable', 'gregarious', 'indigenous', 'aesthetic', 'agile', 'aggregate', 'abate']
     for word in test_words:
-        entry = next((e for e in unique if e and e['word'] == word), None)
+        entry = by_word.get(word)
         if entry:
             print(f"  ✅ {word}: {entry['definition']}")
         else:
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Parse SAT vocabulary sources into data/sats_vocab.json using the shared
+streaming engine in scripts/vocab_pipeline. Several sources (text dumps,
+CSV exports, JSON lists) are read concurrently and merged into one
+deduplicated dataset.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from vocab_pipeline import (
+    POLICIES,
+    ParseCache,
+    dedupe,
+    parse_file,
+    parse_file_parallel,
+    read_entries,
+    write_entries,
+)
+from vocab_pipeline.binary import write_artifact
+from vocab_pipeline.difficulty import assign_difficulty
+from vocab_pipeline.golden import diff_datasets, format_report, report_ok
+from vocab_pipeline.loader import REPLACE_WARNING, default_database_url, load
+from vocab_pipeline.profile import PipelineProfile, profile_parse
+from vocab_pipeline.sources import parse_source_spec, read_sources
+from vocab_pipeline.terms import write_index
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        'sources', nargs='*', metavar='SOURCE',
+        default=[str(project_root.parent / 'Downloads' / 'sats_words_with_definitions.txt')],
+        help='text dumps, CSV exports or JSON/NDJSON lists, merged in the order given; '
+             'prefix with text:, csv: or json: to override the format',
+    )
+    arg_parser.add_argument(
+        '-o', '--output', default=project_root / 'data' / 'sats_vocab.json',
+        type=Path, help='output file (.ndjson/.jsonl for one entry per line)',
+    )
+    arg_parser.add_argument(
+        '--dedup', choices=POLICIES, default='keep-first',
+        help='how to resolve duplicate headwords (default: keep-first)',
+    )
+    arg_parser.add_argument(
+        '-j', '--jobs', type=int,
+        help='parse with this many worker processes (0 = one per CPU; '
+             'default: serial for one source, one per source for several)',
+    )
+    arg_parser.add_argument(
+        '--cache', nargs='?', const=True, type=Path,
+        help='reuse parsed entries from a sidecar cache (default: <input>.parse-cache.json)',
+    )
+    arg_parser.add_argument(
+        '--difficulty', action='store_true',
+        help='score difficulty across the corpus and write balanced easy/medium/hard buckets',
+    )
+    arg_parser.add_argument(
+        '--golden', type=Path,
+        help='verify the parsed entries against this dataset before writing',
+    )
+    arg_parser.add_argument(
+        '--pack', type=Path, metavar='PATH',
+        help='also write the packed binary artifact (e.g. data/sats_vocab.bin)',
+    )
+    arg_parser.add_argument(
+        '--index', type=Path, metavar='PATH',
+        help='also write the definition term index (e.g. data/sats_vocab.terms)',
+    )
+    arg_parser.add_argument(
+        '--load', nargs='?', const=default_database_url(), metavar='DATABASE_URL',
+        help='bulk-load the result into the Word table, upserting by headword (default: $DATABASE_URL)',
+    )
+    arg_parser.add_argument(
+        '--replace', action='store_true',
+        help='with --load, clear Word and its dependent tables first, deleting all learner progress',
+    )
+    arg_parser.add_argument(
+        '--profile', nargs='?', const=True, type=Path, metavar='METRICS',
+        help='record per-stage time and entry counts to a JSON file '
+             '(default: <output>.metrics.json); stages are run one after another',
+    )
+    arg_parser.add_argument(
+        '--profile-memory', action='store_true',
+        help='with --profile, also record peak traced memory per stage; tracing slows '
+             'every stage, so take timings from a separate run without it',
+    )
+    arg_parser.add_argument(
+        '--profile-dump', type=Path, metavar='DIR',
+        help='with --profile, also dump a cProfile (and with --profile-memory a '
+             'tracemalloc snapshot) per stage',
+    )
+    args = arg_parser.parse_args()
+
+    sources = [parse_source_spec(spec) for spec in args.sources]
+    # One text dump keeps the streaming path with --cache/--jobs/--profile stages
+    single_text = len(sources) == 1 and sources[0][0] == 'text'
+    input_path = sources[0][1]
+
+    if args.cache and not single_text:
+        arg_parser.error('--cache works on a single text dump')
+    if args.cache and args.jobs not in (None, 1):
+        arg_parser.error('--cache parses only changed entries and cannot be combined with --jobs')
+    if args.replace and not args.load:
+        arg_parser.error('--replace only applies with --load')
+    if args.cache is True:
+        args.cache = input_path.with_name(input_path.name + '.parse-cache.json')
+    if (args.profile_dump or args.profile_memory) and not args.profile:
+        args.profile = True
+    if args.profile is True:
+        args.profile = args.output.with_name(args.output.stem + '.metrics.json')
+
+    for _, path in sources:
+        if not path.exists():
+            print(f"Error: Input file not found at {path}")
+            sys.exit(1)
+
+    print(f"Reading from {', '.join(str(path) for _, path in sources)}...")
+
+    profile = PipelineProfile(
+        enabled=bool(args.profile), dump_dir=args.profile_dump, trace_memory=args.profile_memory,
+    )
+
+    cache = None
+    if not single_text:
+        with profile.stage('parse') as record:
+            entries = []
+            for spec, source_entries in read_sources(args.sources, args.jobs):
+                print(f"  {spec}: {len(source_entries)} entries")
+                entries += source_entries
+            record['items'] = len(entries)
+    elif args.cache:
+        cache = ParseCache(args.cache).load()
+        entries = cache.parse_file(input_path)
+    elif args.jobs in (None, 1):
+        entries = profile_parse(input_path, profile) if args.profile else parse_file(input_path)
+    else:
+        entries = parse_file_parallel(input_path, args.jobs or None)
+
+    if args.profile and single_text and (cache or args.jobs not in (None, 1)):
+        # Read, segment and clean run inside the cache or the worker pool
+        entries = profile.run('parse', list, entries)
+
+    unique = profile.run('dedup', dedupe, entries, args.dedup)
+
+    if cache:
+        cache.save()
+        print(f"Cache: {cache.hits} reused, {cache.misses} parsed")
+
+    with profile.stage('sort') as record:
+        unique.sort(key=lambda x: x['word'])
+        record['items'] = len(unique)
+
+    print(f"✅ Parsed {len(unique)} unique words")
+
+    if args.difficulty:
+        with profile.stage('difficulty') as record:
+            counts = assign_difficulty(unique)
+            record['items'] = sum(counts.values())
+        print('✅ Difficulty: ' + ', '.join(f'{count} {level}' for level, count in counts.items()))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    if args.golden:
+        report = profile.run('golden', diff_datasets, read_entries(args.golden), unique)
+        print('\n'.join(format_report(report)))
+        if not report_ok(report):
+            print(f"❌ Output differs from {args.golden}, not writing {args.output}")
+            sys.exit(1)
+        print(f"✅ Output matches {args.golden}")
+
+    with profile.stage('write') as record:
+        record['items'] = write_entries(args.output, unique)
+
+    print(f"✅ Saved {len(unique)} words to {args.output}")
+
+    if args.pack:
+        with profile.stage('pack') as record:
+            record['items'] = write_artifact(args.pack, unique)
+        print(f"✅ Packed {record['items']} words into {args.pack}")
+
+    if args.index:
+        with profile.stage('index') as record:
+            words, terms = write_index(args.index, unique)
+            record['items'] = terms
+        print(f"✅ Indexed {terms} definition terms across {words} words into {args.index}")
+
+    if args.load:
+        if args.replace:
+            print(REPLACE_WARNING)
+        with profile.stage('load') as record:
+            stats = load(args.load, unique, project_root / 'prisma', args.replace)
+            record['items'] = stats['imported']
+        print(
+            f"✅ Loaded {stats['imported']} words into the database "
+            f"({stats['inserted']} new, {stats['updated']} updated), skipped {stats['skipped']}"
+        )
+
+    if args.profile:
+        print()
+        print('\n'.join(profile.format_table()))
+        profile.write(args.profile, input=args.sources, output=args.output)
+        print(f"\n✅ Wrote stage metrics to {args.profile}")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,22 +8,8 @@ import re
 import sys
 from pathlib import Path
 
-def normalize_pos(pos_str):
-    """Convert part of speech abbreviations to full words."""
-    pos_lower = pos_str.lower()
-    if 'adj' in pos_lower:
-        return 'adjective'
-    elif 'adv' in pos_lower:
-        return 'adverb'
-    elif pos_lower.startswith('n.') or 'noun' in pos_lower:
-        return 'noun'
-    elif pos_lower.startswith('v.') or 'verb' in pos_lower:
-        return 'verb'
-    elif 'prep' in pos_lower:
-        return 'preposition'
-    elif 'conj' in pos_lower:
-        return 'conjunction'
-    return pos_str.strip()
+from vocab_pipeline import is_paren_entry_start, iter_blocks, read_lines
+from vocab_pipeline.normalize import normalize_pos
 
 def parse_entry(text):
     """Parse a vocabulary entry from text."""
@@ -88,42 +74,9 @@ def main():
         sys.exit(1)
     
     print(f"Reading from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    lines = content.split('\n')
-    print(f"Found {len(lines)} lines")
-    
     entries = []
-    current_entry = []
-    
-    for i, line in enumerate(lines):
-        line = line.strip()
-        
-        if not line:
-            if current_entry:
-                combined = ' '.join(current_entry)
-                parsed = parse_entry(combined)
-                if parsed:
-                    entries.append(parsed)
-                current_entry = []
-            continue
-        
-        # Check if this line starts a new entry (word followed by parentheses)
-        if re.match(r'^[a-z]+\s*\(', line, re.IGNORECASE):
-            if current_entry:
-                combined = ' '.join(current_entry)
-                parsed = parse_entry(combined)
-                if parsed:
-                    entries.append(parsed)
-            current_entry = [line]
-        else:
-            current_entry.append(line)
-    
-    # Handle last entry
-    if current_entry:
-        combined = ' '.join(current_entry)
-        parsed = parse_entry(combined)
+    for block in iter_blocks(read_lines(input_file), is_paren_entry_start):
+        parsed = parse_entry(block)
         if parsed:
             entries.append(parsed)
     
@@ -8,43 +8,20 @@ import re
 import sys
 from pathlib import Path
 
-def normalize_pos(pos_str):
-    """Convert part of speech abbreviations to full words."""
-    if not pos_str:
-        return None
-    pos_lower = pos_str.lower().strip()
-    if 'adj' in pos_lower or pos_lower == 'adj':
-        return 'adjective'
-    elif 'adv' in pos_lower or pos_lower == 'adv':
-        return 'adverb'
-    elif pos_lower.startswith('n.') or pos_lower == 'n' or 'noun' in pos_lower:
-        return 'noun'
-    elif pos_lower.startswith('v.') or pos_lower == 'v' or 'verb' in pos_lower:
-        return 'verb'
-    elif 'prep' in pos_lower:
-        return 'preposition'
-    elif 'conj' in pos_lower:
-        return 'conjunction'
-    return pos_str.strip()
+from vocab_pipeline import dedupe, read_lines, iter_blocks
+from vocab_pipeline.normalize import normalize_pos
+from vocab_pipeline.parens import ParenIndex
 
 def extract_example(text):
     """Extract example sentence from parentheses at the end."""
     # Look for the last complete parenthetical expression
-    paren_count = 0
-    start_idx = -1
-    for i in range(len(text) - 1, -1, -1):
-        if text[i] == ')':
-            if start_idx == -1:
-                start_idx = i
-            paren_count += 1
-        elif text[i] == '(':
-            paren_count -= 1
-            if paren_count == 0:
-                example = text[i+1:start_idx].strip()
-                # Check if it looks like an example sentence (starts with capital)
-                if example and example[0].isupper():
-                    return example, text[:i].strip()
-                break
+    index = ParenIndex(text)
+    span = index.last_span()
+    if span:
+        example = index.content(span)
+        # Check if it looks like an example sentence (starts with capital)
+        if example and example[0].isupper():
+            return example, text[:span[0]].strip()
     return None, text
 
 def parse_entry(text):
@@ -115,61 +92,14 @@ def main():
         sys.exit(1)
     
     print(f"Reading from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    print(f"Found {len(lines)} lines")
-    
     entries = []
-    current_entry_lines = []
-    
-    for i, line in enumerate(lines):
-        line = line.strip()
-        
-        # Check if this line starts a new entry
-        # A new entry starts with a word followed by (pos) or 1. (pos)
-        is_new_entry = bool(re.match(r'^[a-z]+\s*(?:\(|1\.)', line, re.IGNORECASE))
-        
-        if is_new_entry and current_entry_lines:
-            # Parse previous entry
-            combined = ' '.join(current_entry_lines)
-            parsed = parse_entry(combined)
-            if parsed:
-                entries.append(parsed)
-            current_entry_lines = [line]
-        elif line or current_entry_lines:
-            # Continue current entry or start new one
-            if line:
-                current_entry_lines.append(line)
-            elif current_entry_lines:
-                # Empty line - finish current entry
-                combined = ' '.join(current_entry_lines)
-                parsed = parse_entry(combined)
-                if parsed:
-                    entries.append(parsed)
-                current_entry_lines = []
-    
-    # Handle last entry
-    if current_entry_lines:
-        combined = ' '.join(current_entry_lines)
-        parsed = parse_entry(combined)
+    for block in iter_blocks(read_lines(input_file)):
+        parsed = parse_entry(block)
         if parsed:
             entries.append(parsed)
     
-    # Remove duplicates, keeping first occurrence
-    seen = set()
-    unique_entries = []
-    for entry in entries:
-        word = entry['word']
-        if word not in seen:
-            seen.add(word)
-            unique_entries.append(entry)
-        else:
-            # If duplicate, keep the one with more complete definition
-            existing = next(e for e in unique_entries if e['word'] == word)
-            if len(entry.get('definition', '')) > len(existing.get('definition', '')):
-                unique_entries.remove(existing)
-                unique_entries.append(entry)
+    # Remove duplicates, keeping the most complete definition
+    unique_entries = dedupe(entries, 'keep-longest')
     
     # Sort by word
     unique_entries.sort(key=lambda x: x['word'])
@@ -7,51 +7,19 @@ import json
 import re
 from pathlib import Path
 
-def normalize_pos(pos_str):
-    """Convert part of speech abbreviations to full words."""
-    if not pos_str:
-        return None
-    pos_lower = pos_str.lower().strip()
-    if 'adj' in pos_lower or pos_lower == 'adj':
-        return 'adjective'
-    elif 'adv' in pos_lower or pos_lower == 'adv':
-        return 'adverb'
-    elif pos_lower.startswith('n.') or pos_lower == 'n' or 'noun' in pos_lower:
-        return 'noun'
-    elif pos_lower.startswith('v.') or pos_lower == 'v' or 'verb' in pos_lower:
-        return 'verb'
-    elif 'prep' in pos_lower:
-        return 'preposition'
-    elif 'conj' in pos_lower:
-        return 'conjunction'
-    return pos_str.strip()
+from vocab_pipeline import read_lines, iter_blocks
+from vocab_pipeline.normalize import normalize_pos
+from vocab_pipeline.parens import ParenIndex
 
 def extract_definition_and_example(text):
     """Extract definition and example sentence from text."""
     # Pattern: definition (example sentence)
-    # We need to find the last complete parenthetical expression
-    
-    # Find all parenthetical expressions
-    paren_pairs = []
-    depth = 0
-    start = -1
-    
-    for i, char in enumerate(text):
-        if char == '(':
-            if depth == 0:
-                start = i
-            depth += 1
-        elif char == ')':
-            depth -= 1
-            if depth == 0 and start != -1:
-                paren_pairs.append((start, i))
-                start = -1
-    
-    # The last complete parentheses is likely the example
-    if paren_pairs:
-        last_start, last_end = paren_pairs[-1]
-        example = text[last_start + 1:last_end].strip()
-        definition = text[:last_start].strip()
+    # The last complete parenthetical expression is likely the example
+    index = ParenIndex(text)
+    span = index.last_span()
+    if span:
+        example = index.content(span)
+        definition = text[:span[0]].strip()
         
         # Check if example looks like a sentence (starts with capital)
         if example and example[0].isupper():
@@ -119,42 +87,9 @@ def main():
         return
     
     print(f"Reading from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    print(f"Found {len(lines)} lines")
-    
     entries = []
-    current_entry_lines = []
-    
-    for i, line in enumerate(lines):
-        line = line.strip()
-        
-        # Check if this line starts a new entry
-        is_new_entry = bool(re.match(r'^[a-z]+\s*(?:\(|1\.)', line, re.IGNORECASE))
-        
-        if is_new_entry and current_entry_lines:
-            # Parse previous entry
-            combined = ' '.join(current_entry_lines)
-            parsed = parse_entry(combined)
-            if parsed:
-                entries.append(parsed)
-            current_entry_lines = [line]
-        elif line or current_entry_lines:
-            if line:
-                current_entry_lines.append(line)
-            elif current_entry_lines:
-                # Empty line - finish current entry
-                combined = ' '.join(current_entry_lines)
-                parsed = parse_entry(combined)
-                if parsed:
-                    entries.append(parsed)
-                current_entry_lines = []
-    
-    # Handle last entry
-    if current_entry_lines:
-        combined = ' '.join(current_entry_lines)
-        parsed = parse_entry(combined)
+    for block in iter_blocks(read_lines(input_file)):
+        parsed = parse_entry(block)
         if parsed:
             entries.append(parsed)
     
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Score every entry of data/sats_vocab.json for difficulty across the whole
+corpus and write balanced easy/medium/hard buckets into the dataset, which
+the importers then copy as-is.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from vocab_pipeline import read_entries, write_entries
+from vocab_pipeline.difficulty import assign_difficulty, np
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        'vocab_file', nargs='?', default=project_root / 'data' / 'sats_vocab.json',
+        type=Path, help='dataset to score in place (JSON array or NDJSON)',
+    )
+    arg_parser.add_argument(
+        '--no-numpy', action='store_true',
+        help='use the pure Python scorer even if NumPy is installed',
+    )
+    args = arg_parser.parse_args()
+
+    use_numpy = np is not None and not args.no_numpy
+    print(f"Scoring {args.vocab_file} ({'NumPy' if use_numpy else 'pure Python'})...")
+
+    entries = list(read_entries(args.vocab_file))
+    start = time.perf_counter()
+    counts = assign_difficulty(entries, use_numpy=use_numpy)
+    elapsed = time.perf_counter() - start
+    write_entries(args.vocab_file, entries)
+
+    for level, count in counts.items():
+        print(f"  {level:<8} {count:>8}")
+    print(f"\n✅ Scored {sum(counts.values())} words in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,19 +7,10 @@ import json
 import re
 from pathlib import Path
 
-def normalize_pos(pos_str):
-    if not pos_str:
-        return None
-    pos_lower = pos_str.lower().strip()
-    if 'adj' in pos_lower:
-        return 'adjective'
-    elif 'adv' in pos_lower:
-        return 'adverb'
-    elif pos_lower.startswith('n.') or pos_lower == 'n':
-        return 'noun'
-    elif pos_lower.startswith('v.') or pos_lower == 'v':
-        return 'verb'
-    return pos_str.strip()
+from vocab_pipeline import is_paren_entry_start, iter_blocks, read_lines
+from vocab_pipeline.normalize import ABBREVIATION_POS_RULES, Normalizer
+
+_normalizer = Normalizer(pos_rules=ABBREVIATION_POS_RULES)
 
 def parse_entry(text):
     """Parse: word (pos) definition (example)"""
@@ -33,7 +24,7 @@ def parse_entry(text):
         return None
     
     word = match.group(1).lower().strip()
-    pos = normalize_pos(match.group(2))
+    pos = _normalizer.normalize_pos(match.group(2))
     rest = match.group(3).strip()
     
     # Check if merged with next entry
@@ -93,34 +84,9 @@ def main():
     output_file = project_root / 'data' / 'sats_vocab.json'
     
     print(f"Reading from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
     entries = []
-    current_lines = []
-    
-    for line in lines:
-        line = line.strip()
-        is_new = bool(re.match(r'^[a-z]+\s*\(', line, re.IGNORECASE))
-        
-        if is_new and current_lines:
-            combined = ' '.join(current_lines)
-            parsed = parse_entry(combined)
-            if parsed:
-                entries.append(parsed)
-            current_lines = [line]
-        elif line:
-            current_lines.append(line)
-        elif current_lines:
-            combined = ' '.join(current_lines)
-            parsed = parse_entry(combined)
-            if parsed:
-                entries.append(parsed)
-            current_lines = []
-    
-    if current_lines:
-        combined = ' '.join(current_lines)
-        parsed = parse_entry(combined)
+    for block in iter_blocks(read_lines(input_file), is_paren_entry_start):
+        parsed = parse_entry(block)
         if parsed:
             entries.append(parsed)
     
@@ -138,9 +104,10 @@ def main():
     
     # Verify critical samples
     print("\nVerifying entries:")
+    by_word = {e['word']: e for e in unique}
     test_words = ['affable', 'gregarious', 'indigenous', 'aesthetic', 'agile']
     for word in test_words:
-        entry = next((e for e in unique if e and e['word'] == word), None)
+        entry = by_word.get(word)
         if entry:
             print(f"  ✅ {word}: {entry['definition']}")
         else:
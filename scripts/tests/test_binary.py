@@ -0,0 +1,45 @@
+import os
+
+from vocab_pipeline.binary import VocabArtifact, artifact_path, read_dataset, write_artifact
+from vocab_pipeline.jsonio import write_entries
+
+ENTRIES = [
+    {'word': 'candid', 'partOfSpeech': 'adjective', 'definition': 'honest', 'synonyms': ['frank', 'open']},
+    {'word': 'abate', 'partOfSpeech': 'verb', 'definition': 'to lessen', 'exampleSentence': 'It abated.'},
+]
+
+
+def test_round_trip_keeps_synonyms(tmp_path):
+    path = tmp_path / 'vocab.bin'
+    write_artifact(path, ENTRIES)
+    with VocabArtifact(path) as artifact:
+        assert artifact.lookup('candid')['synonyms'] == '["frank", "open"]'
+        assert artifact.lookup('abate')['exampleSentence'] == 'It abated.'
+        assert [entry['word'] for entry in artifact] == ['candid', 'abate']
+
+
+def test_read_dataset_prefers_fresh_artifact(tmp_path):
+    dataset = tmp_path / 'vocab.json'
+    write_entries(dataset, ENTRIES)
+    assert artifact_path(dataset) is None
+
+    write_artifact(tmp_path / 'vocab.bin', ENTRIES[:1])
+    assert artifact_path(dataset) == tmp_path / 'vocab.bin'
+    assert [entry['word'] for entry in read_dataset(dataset)] == ['candid']
+
+    # An edited dataset is newer than its artifact and is read directly
+    stat = os.stat(tmp_path / 'vocab.bin')
+    os.utime(dataset, (stat.st_atime, stat.st_mtime + 10))
+    assert artifact_path(dataset) is None
+    assert [entry['word'] for entry in read_dataset(dataset)] == ['candid', 'abate']
+
+
+def test_placeholders_and_incomplete_entries_are_skipped(tmp_path):
+    path = tmp_path / 'vocab.bin'
+    entries = [{'_note': 'placeholder'}, {'word': 'terse'}, {'definition': 'no headword'}] + ENTRIES
+    stats = {}
+    assert write_artifact(path, entries, stats) == 2
+    assert stats['skipped'] == 2
+    with VocabArtifact(path) as artifact:
+        assert [entry['word'] for entry in artifact] == ['candid', 'abate']
+        assert artifact.lookup('terse') is None
@@ -0,0 +1,48 @@
+import shutil
+
+from vocab_pipeline import cache
+from vocab_pipeline.cache import PACKAGE_DIR, ParseCache
+from vocab_pipeline.tokenizer import Token
+
+TOKENS = [
+    Token('abate', 'v.', 'to lessen in intensity (The storm abated.)'),
+    Token('candid', 'adj.', 'honest and direct'),
+]
+
+
+def copy_package(tmp_path):
+    package_dir = tmp_path / 'vocab_pipeline'
+    shutil.copytree(PACKAGE_DIR, package_dir, ignore=shutil.ignore_patterns('__pycache__'))
+    return package_dir
+
+
+def test_unchanged_source_hits(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, 'PACKAGE_DIR', copy_package(tmp_path))
+    path = tmp_path / 'parse-cache.json'
+
+    first = ParseCache(path).load()
+    list(first.parse_tokens(TOKENS))
+    first.save()
+
+    second = ParseCache(path).load()
+    entries = list(second.parse_tokens(TOKENS))
+    assert (second.hits, second.misses) == (2, 0)
+    assert [e.word for e in entries] == ['abate', 'candid']
+
+
+def test_helper_edit_misses(tmp_path, monkeypatch):
+    package_dir = copy_package(tmp_path)
+    monkeypatch.setattr(cache, 'PACKAGE_DIR', package_dir)
+    path = tmp_path / 'parse-cache.json'
+
+    first = ParseCache(path).load()
+    list(first.parse_tokens(TOKENS))
+    first.save()
+
+    # parens.py holds no stage, but ParenIndex decides the example split
+    parens = package_dir / 'parens.py'
+    parens.write_text(parens.read_text(encoding='utf-8') + '\n# edited\n', encoding='utf-8')
+
+    second = ParseCache(path).load()
+    list(second.parse_tokens(TOKENS))
+    assert (second.hits, second.misses) == (0, 2)
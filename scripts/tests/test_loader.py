@@ -0,0 +1,68 @@
+import sqlite3
+
+from vocab_pipeline.loader import load_sqlite
+
+SCHEMA = '''
+CREATE TABLE "Word" (
+    "id" TEXT NOT NULL PRIMARY KEY,
+    "word" TEXT NOT NULL,
+    "partOfSpeech" TEXT,
+    "definition" TEXT NOT NULL,
+    "synonyms" TEXT,
+    "exampleSentence" TEXT,
+    "difficulty" TEXT NOT NULL DEFAULT 'medium',
+    "createdAt" DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE UNIQUE INDEX "Word_word_key" ON "Word"("word");
+CREATE TABLE "FlashcardProgress" ("id" TEXT NOT NULL PRIMARY KEY, "wordId" TEXT NOT NULL);
+CREATE TABLE "CrosswordWord" ("id" TEXT NOT NULL PRIMARY KEY, "wordId" TEXT NOT NULL);
+CREATE TABLE "CrosswordProgress" ("id" TEXT NOT NULL PRIMARY KEY);
+CREATE TABLE "Crossword" ("id" TEXT NOT NULL PRIMARY KEY);
+'''
+
+ENTRIES = [
+    {'word': 'abate', 'partOfSpeech': 'verb', 'definition': 'to lessen'},
+    {'word': 'candid', 'partOfSpeech': 'adjective', 'definition': 'honest'},
+]
+
+
+def make_db(tmp_path):
+    path = tmp_path / 'test.db'
+    with sqlite3.connect(path) as conn:
+        conn.executescript(SCHEMA)
+    return path
+
+
+def query(path, sql):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(sql).fetchall()
+
+
+def test_reload_upserts_and_keeps_progress(tmp_path):
+    path = make_db(tmp_path)
+    load_sqlite(path, ENTRIES)
+    ids = dict(query(path, 'SELECT "word", "id" FROM "Word"'))
+    with sqlite3.connect(path) as conn:
+        conn.execute('INSERT INTO "FlashcardProgress" VALUES (?, ?)', ('p1', ids['abate']))
+
+    edited = [dict(ENTRIES[0], definition='to become less intense'), {'word': 'zeal', 'definition': 'great energy'}]
+    stats = load_sqlite(path, edited)
+
+    assert (stats['inserted'], stats['updated']) == (1, 1)
+    assert dict(query(path, 'SELECT "word", "id" FROM "Word"'))['abate'] == ids['abate']
+    assert query(path, 'SELECT "definition" FROM "Word" WHERE "word" = \'abate\'') == [('to become less intense',)]
+    assert query(path, 'SELECT COUNT(*) FROM "Word"') == [(3,)]
+    assert query(path, 'SELECT "wordId" FROM "FlashcardProgress"') == [(ids['abate'],)]
+
+
+def test_replace_clears_progress(tmp_path):
+    path = make_db(tmp_path)
+    load_sqlite(path, ENTRIES)
+    with sqlite3.connect(path) as conn:
+        conn.execute('INSERT INTO "FlashcardProgress" VALUES (?, ?)', ('p1', 'old'))
+
+    stats = load_sqlite(path, ENTRIES[:1], replace=True)
+
+    assert (stats['inserted'], stats['updated']) == (1, 0)
+    assert query(path, 'SELECT "word" FROM "Word"') == [('abate',)]
+    assert query(path, 'SELECT COUNT(*) FROM "FlashcardProgress"') == [(0,)]
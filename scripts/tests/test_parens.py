@@ -0,0 +1,24 @@
+import re
+
+import pytest
+
+from vocab_pipeline.parens import ParenIndex
+
+# The trailing-paren cleanup the scripts used before ParenIndex
+INCOMPLETE_PAREN = re.compile(r'\s*\([^)]*$')
+
+
+@pytest.mark.parametrize('text', [
+    'calm (He was calm.)',
+    'calm (He was',
+    'calm (He (was',
+    'calm (Went home (v.) quiet (And the hall.) more',
+    'calm (Went home (v.) quiet (And the hall.) more (cut',
+    'stray ) then (open',
+    '',
+])
+def test_without_tail_matches_regex(text):
+    index = ParenIndex(text)
+    assert index.without_tail() == INCOMPLETE_PAREN.sub('', text)
+    end = len(text) // 2
+    assert index.prefix(end).without_tail() == INCOMPLETE_PAREN.sub('', text[:end])
@@ -0,0 +1,26 @@
+import pytest
+
+from vocab_pipeline.sources import read_csv_source
+
+
+def test_spaced_headers_map_to_fields(tmp_path):
+    path = tmp_path / 'list.csv'
+    path.write_text(
+        'Word,Part of Speech,Definition,Example-Sentence\n'
+        'Abate,v.,to lessen,The storm abated.\n',
+        encoding='utf-8',
+    )
+    assert read_csv_source(path) == [{
+        'word': 'abate',
+        'partOfSpeech': 'verb',
+        'definition': 'to lessen',
+        'exampleSentence': 'The storm abated.',
+    }]
+
+
+def test_unmapped_column_warns(tmp_path):
+    path = tmp_path / 'list.tsv'
+    path.write_text('word\tdefinition\tword class\nabate\tto lessen\tverb\n', encoding='utf-8')
+    with pytest.warns(UserWarning, match="'word class'"):
+        entries = read_csv_source(path)
+    assert entries[0]['partOfSpeech'] is None
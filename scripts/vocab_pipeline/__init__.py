@@ -0,0 +1,55 @@
+"""
+Shared parsing engine for SAT vocabulary source dumps.
+
+The engine reads the source lazily, splits it into entries with a single-pass
+tokenizer and runs each entry through an ordered list of parse stages.
+"""
+
+from .reader import read_chunks, read_lines, iter_blocks, is_entry_start, is_paren_entry_start
+from .tokenizer import Token, tokenize
+from .parser import (
+    DEFAULT_STAGES,
+    TOKEN_STAGES,
+    parse_block,
+    parse_entries,
+    parse_file,
+    parse_token,
+    parse_tokens,
+)
+from .cache import ParseCache
+from .dedup import POLICIES, dedupe
+from .entry import VocabEntry
+from .golden import diff_datasets
+from .jsonio import read_entries, write_entries
+from .parallel import parse_file_parallel
+from .sources import read_source, read_sources
+from . import normalize, stages
+
+__all__ = [
+    'DEFAULT_STAGES',
+    'POLICIES',
+    'ParseCache',
+    'TOKEN_STAGES',
+    'Token',
+    'VocabEntry',
+    'dedupe',
+    'diff_datasets',
+    'is_entry_start',
+    'is_paren_entry_start',
+    'iter_blocks',
+    'normalize',
+    'parse_block',
+    'parse_entries',
+    'parse_file',
+    'parse_file_parallel',
+    'parse_token',
+    'parse_tokens',
+    'read_chunks',
+    'read_entries',
+    'read_lines',
+    'read_source',
+    'read_sources',
+    'stages',
+    'tokenize',
+    'write_entries',
+]
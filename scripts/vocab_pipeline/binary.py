@@ -0,0 +1,193 @@
+"""
+Packed binary vocab artifact with a sorted headword index.
+
+Layout (all integers little-endian):
+
+    header   'SATV', version u16, fields u16, count u32,
+             records offset u32, index offset u32,
+             strings offset u32, strings size u32
+    records  count x fields x (offset u32, length u32) into the string
+             table, in dataset order; a missing value has offset 0xFFFFFFFF
+    index    count x u32 record numbers sorted by UTF-8 headword bytes
+    strings  UTF-8 string table, each distinct string stored once
+
+Readers memory-map the file and look entries up by binary search over the
+index without decoding the rest of the dataset. Synonym lists are stored as
+their JSON text, the way the Word table keeps them; fields other than those
+in FIELDS (senses) are not stored.
+
+The importers (scripts/load-vocab.py, and lib/vocab-check.ts for
+npm run db:import and admin imports) read the artifact in place of
+data/sats_vocab.json when it is at least as new as the JSON file.
+"""
+
+import json
+import mmap
+import struct
+from pathlib import Path
+
+from .jsonio import read_entries
+
+MAGIC = b'SATV'
+VERSION = 2
+FIELDS = ('word', 'partOfSpeech', 'definition', 'exampleSentence', 'difficulty', 'synonyms')
+MISSING = 0xFFFFFFFF
+
+HEADER = struct.Struct('<4sHHIIIII')
+SLOT = struct.Struct('<II')
+RECORD = struct.Struct('<' + 'II' * len(FIELDS))
+INDEX_ITEM = struct.Struct('<I')
+
+
+def write_artifact(path, entries, stats=None):
+    """Pack entries into a binary artifact at path and return the entry count.
+
+    Placeholder entries are left out, and entries without a word or a
+    definition are counted in stats['skipped'], as word_rows does.
+    """
+    stats = stats if stats is not None else {}
+    stats.setdefault('skipped', 0)
+    strings = bytearray()
+    offsets = {}
+    records = bytearray()
+    headwords = []
+
+    for entry in entries:
+        if entry.get('_note') or entry.get('_source') or entry.get('_format'):
+            continue
+        if not entry.get('word') or not entry.get('definition'):
+            stats['skipped'] += 1
+            continue
+
+        number = len(headwords)
+        slots = []
+        for field in FIELDS:
+            value = entry.get(field)
+            if isinstance(value, list):
+                value = json.dumps(value, ensure_ascii=False)
+            if value is None:
+                slots += (MISSING, 0)
+                continue
+            data = value.encode('utf-8')
+            offset = offsets.get(data)
+            if offset is None:
+                offset = offsets[data] = len(strings)
+                strings += data
+            slots += (offset, len(data))
+        records += RECORD.pack(*slots)
+        headwords.append((entry['word'].encode('utf-8'), number))
+
+    count = len(headwords)
+    headwords.sort()
+    index = b''.join(INDEX_ITEM.pack(number) for _, number in headwords)
+
+    records_offset = HEADER.size
+    index_offset = records_offset + len(records)
+    strings_offset = index_offset + len(index)
+    header = HEADER.pack(
+        MAGIC, VERSION, len(FIELDS), count,
+        records_offset, index_offset, strings_offset, len(strings),
+    )
+
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.write(records)
+        f.write(index)
+        f.write(strings)
+    return count
+
+
+class VocabArtifact:
+    """Memory-mapped reader for a packed vocab artifact."""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, fields, self.count, self._records,
+         self._index, self._strings, _) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or fields != len(FIELDS):
+            self.close()
+            raise ValueError(f'{path} is not a version {VERSION} vocab artifact')
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def _field_bytes(self, number, field_number):
+        offset, length = SLOT.unpack_from(
+            self._map, self._records + number * RECORD.size + field_number * SLOT.size
+        )
+        if offset == MISSING:
+            return None
+        start = self._strings + offset
+        return self._map[start:start + length]
+
+    def entry(self, number):
+        """Decode the entry stored at a record number."""
+        slots = RECORD.unpack_from(self._map, self._records + number * RECORD.size)
+        entry = {}
+        for i, field in enumerate(FIELDS):
+            offset, length = slots[2 * i], slots[2 * i + 1]
+            if offset == MISSING:
+                entry[field] = None
+            else:
+                start = self._strings + offset
+                entry[field] = self._map[start:start + length].decode('utf-8')
+        return entry
+
+    def __iter__(self):
+        """Yield entries in dataset order."""
+        for number in range(self.count):
+            yield self.entry(number)
+
+    def lookup(self, word):
+        """Return the entry for a headword, or None, by binary search."""
+        key = word.encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            number = INDEX_ITEM.unpack_from(self._map, self._index + mid * INDEX_ITEM.size)[0]
+            headword = self._field_bytes(number, 0)
+            if headword < key:
+                low = mid + 1
+            elif headword > key:
+                high = mid
+            else:
+                return self.entry(number)
+        return None
+
+
+def artifact_path(dataset_path):
+    """Return the artifact next to a dataset if it is at least as new, else None."""
+    dataset_path = Path(dataset_path)
+    if dataset_path.suffix == '.bin':
+        return dataset_path
+    path = dataset_path.with_suffix('.bin')
+    if not path.exists():
+        return None
+    if dataset_path.exists() and dataset_path.stat().st_mtime > path.stat().st_mtime:
+        return None
+    return path
+
+
+def read_dataset(dataset_path):
+    """Yield entries from the dataset's packed artifact, or from the dataset itself.
+
+    The artifact is used when artifact_path finds one; otherwise the JSON
+    array or NDJSON file is streamed with read_entries.
+    """
+    path = artifact_path(dataset_path)
+    if path is None:
+        yield from read_entries(dataset_path)
+        return
+    with VocabArtifact(path) as artifact:
+        yield from artifact
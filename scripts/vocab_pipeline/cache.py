@@ -0,0 +1,110 @@
+"""
+Content-hash cache of parsed entries for incremental re-parses.
+
+Each tokenized entry is hashed from its raw word, part of speech and body.
+Entries whose hash is already in the sidecar cache reuse the stored result;
+only new or edited entries run through the parse stages. The cache is
+invalidated as a whole when the stage list, the source of any
+vocab_pipeline module (the stages and every helper they call) or the
+normalizer configuration changes.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from .entry import VocabEntry, to_json
+from .normalize import get_normalizer
+from .parser import TOKEN_STAGES, parse_token
+from .reader import read_chunks
+from .tokenizer import tokenize
+
+CACHE_FORMAT = 2
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def token_hash(token):
+    """Return a stable content hash for a tokenizer Token."""
+    raw = f'{token.word}\0{token.pos}\0{token.body}'.encode('utf-8')
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def source_files(stage_list, package_dir=None):
+    """Return the sorted source files the parse output can depend on.
+
+    That is every module of the package, since stages reach helpers such as
+    parens.ParenIndex and parser.build_entry, plus the module of any stage
+    defined outside it.
+    """
+    files = set(Path(package_dir or PACKAGE_DIR).glob('*.py'))
+    for stage in stage_list:
+        module = sys.modules.get(getattr(stage, '__module__', None) or '')
+        filename = getattr(module, '__file__', None)
+        if filename:
+            files.add(Path(filename).resolve())
+    return sorted(files)
+
+
+def stages_fingerprint(stage_list, package_dir=None):
+    """Hash the stage names and source files so code changes invalidate the cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(CACHE_FORMAT).encode())
+    digest.update(get_normalizer().fingerprint().encode())
+    for stage in stage_list:
+        digest.update(f'{stage.__module__}.{stage.__qualname__}\0'.encode())
+    for path in source_files(stage_list, package_dir):
+        digest.update(f'{path.name}\0'.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Sidecar cache mapping entry hashes to parsed entries (or None)."""
+
+    def __init__(self, path, stage_list=TOKEN_STAGES):
+        self.path = path
+        self.stage_list = stage_list
+        self.fingerprint = stages_fingerprint(stage_list)
+        self.entries = {}
+        self.seen = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self):
+        """Load the cache file if it exists and matches the current stages."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if data.get('fingerprint') == self.fingerprint:
+            self.entries = data.get('entries', {})
+        return self
+
+    def parse_tokens(self, tokens):
+        """Yield parsed entries, running the stages only on cache misses."""
+        for token in tokens:
+            key = token_hash(token)
+            if key in self.entries:
+                entry = self.entries[key]
+                self.hits += 1
+            else:
+                entry = parse_token(token, self.stage_list)
+                self.misses += 1
+            self.seen[key] = entry
+            if entry:
+                yield VocabEntry.from_dict(entry)
+
+    def parse_file(self, path):
+        """Lazily parse a source file through the cache."""
+        return self.parse_tokens(tokenize(read_chunks(path)))
+
+    def save(self):
+        """Write the entries seen in this run, dropping stale ones."""
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self.fingerprint, 'entries': self.seen}, f, ensure_ascii=False, default=to_json)
+        os.replace(tmp_path, self.path)
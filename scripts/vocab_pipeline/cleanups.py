@@ -0,0 +1,101 @@
+"""
+Definition cleanups applied to an already parsed dataset.
+
+These are the cleanups from fix-definitions.py, fix-merged-entries.py and
+clean-definitions-only.py with their patterns compiled once. Cut-off
+parentheticals are found through ParenIndex rather than by rescanning.
+"""
+
+import re
+
+from .parens import ParenIndex
+
+LOWERCASE_TAIL = re.compile(r'\s+[a-z][^.]*$')
+MERGED_POS = re.compile(r'\s[a-z]+\s*\([^)]+\)')
+MERGED_SPLIT = re.compile(r'\s+[a-z]+\s*\([^)]+\)')
+SENTENCE_END = re.compile(r'[.!?]\s+')
+OPEN_PAREN_TAIL = re.compile(r'\s*\(.*$')
+MERGED_ENTRY = re.compile(r'\s+([a-z]+)\s*\(([^)]+)\)\s*([a-z])', re.IGNORECASE)
+MERGED_STOPWORD = re.compile(
+    r'\s+(the|a|an|which|that|when|where|who|what|how|are|is|was|were|be|not|'
+    r'to|of|in|on|at|for|with|from)$',
+    re.IGNORECASE,
+)
+EXAMPLE_START_TAIL = re.compile(r'\s*\([A-Z][^)]*$')
+CORE_STOPWORDS = [
+    re.compile(rf'\s+{word}$', re.IGNORECASE)
+    for word in (
+        'the', 'a', 'an', 'which', 'that', 'when', 'where', 'who', 'what', 'how',
+        'are', 'is', 'was', 'were', 'be', 'not', 'to', 'of', 'in', 'on',
+        'at', 'for', 'with', 'from',
+    )
+]
+TRAILING_PUNCT = re.compile(r'[.,]\s*$')
+
+
+def clean_incomplete_examples(definition):
+    """Remove incomplete example sentences from definitions."""
+    if not definition:
+        return definition
+
+    # Remove incomplete parentheses at the end (cut-off example sentences)
+    cleaned = ParenIndex(definition).without_tail().strip()
+
+    # Remove trailing incomplete sentences that start with lowercase
+    cleaned = LOWERCASE_TAIL.sub('', cleaned).strip()
+
+    # Keep only the first of several merged "word (pos)" definitions
+    if MERGED_POS.search(cleaned):
+        parts = MERGED_SPLIT.split(cleaned)
+        cleaned = parts[0].strip() if parts else cleaned
+
+    # Remove trailing incomplete phrases
+    if cleaned.endswith('(') or cleaned.endswith(',') or cleaned.endswith('the'):
+        sentences = SENTENCE_END.split(cleaned)
+        if len(sentences) > 1:
+            cleaned = '. '.join(sentences[:-1]) + '.'
+        else:
+            cleaned = OPEN_PAREN_TAIL.sub('', cleaned)
+            cleaned = LOWERCASE_TAIL.sub('', cleaned).strip()
+
+    return cleaned.strip()
+
+
+def clean_merged_definition(definition):
+    """Remove merged entries from definitions."""
+    if not definition:
+        return definition
+
+    # Take only the text before the first merged "word (pos)" entry
+    match = MERGED_ENTRY.search(definition)
+    if match:
+        definition = definition[:match.start()].strip()
+
+    # Remove an incomplete parenthetical example
+    definition = ParenIndex(definition).without_tail().strip()
+
+    # Remove trailing incomplete words
+    definition = MERGED_STOPWORD.sub('', definition).strip()
+
+    return definition
+
+
+def clean_core_definition(definition):
+    """Remove incomplete example sentences, keep only the core definition."""
+    if not definition:
+        return definition
+
+    # An open paren without a matching close is a cut-off example
+    cleaned = ParenIndex(definition).without_tail().strip()
+
+    # Remove trailing example sentence starts
+    cleaned = EXAMPLE_START_TAIL.sub('', cleaned).strip()
+
+    # Remove trailing incomplete words like "the", "a", "which"
+    for pattern in CORE_STOPWORDS:
+        cleaned = pattern.sub('', cleaned).strip()
+
+    # Remove trailing commas or periods
+    cleaned = TRAILING_PUNCT.sub('', cleaned).strip()
+
+    return cleaned
@@ -0,0 +1,69 @@
+"""
+Duplicate headword merging.
+
+Entries are indexed by headword in a dict, so each duplicate is resolved in
+constant time and the whole stage is linear in the number of entries.
+"""
+
+KEEP_FIRST = 'keep-first'
+KEEP_LONGEST = 'keep-longest'
+MERGE_SENSES = 'merge-senses'
+
+POLICIES = (KEEP_FIRST, KEEP_LONGEST, MERGE_SENSES)
+
+
+def _sense(entry):
+    return {
+        'partOfSpeech': entry.get('partOfSpeech'),
+        'definition': entry.get('definition'),
+        'exampleSentence': entry.get('exampleSentence'),
+    }
+
+
+def _keep_first(existing, entry):
+    return existing
+
+
+def _keep_longest(existing, entry):
+    if len(entry.get('definition') or '') > len(existing.get('definition') or ''):
+        return entry
+    return existing
+
+
+def _merge_senses(existing, entry):
+    if 'senses' not in existing:
+        existing['senses'] = [_sense(existing)]
+    sense = _sense(entry)
+    if sense not in existing['senses']:
+        existing['senses'].append(sense)
+    return existing
+
+
+_RESOLVERS = {
+    KEEP_FIRST: _keep_first,
+    KEEP_LONGEST: _keep_longest,
+    MERGE_SENSES: _merge_senses,
+}
+
+
+def dedupe(entries, policy=KEEP_FIRST):
+    """Merge entries that share a headword according to the given policy.
+
+    Returns a list in first-seen order. With 'merge-senses', duplicated words
+    keep their first sense as the top-level fields and gain a 'senses' list.
+    """
+    if policy not in _RESOLVERS:
+        raise ValueError(f"Unknown dedup policy {policy!r}, expected one of {', '.join(POLICIES)}")
+    resolve = _RESOLVERS[policy]
+
+    index = {}
+    unique = []
+    for entry in entries:
+        word = entry['word']
+        pos = index.get(word)
+        if pos is None:
+            index[word] = len(unique)
+            unique.append(entry)
+        else:
+            unique[pos] = resolve(unique[pos], entry)
+    return unique
@@ -0,0 +1,190 @@
+"""
+Corpus-wide difficulty scoring.
+
+Each entry is scored from its headword length, syllable estimate, letter
+rarity, definition length and sense count. Every feature is standardized
+over the whole corpus, and entries are bucketed by the percentile rank of
+their weighted score, so 'easy', 'medium' and 'hard' hold equal shares.
+NumPy computes the features in one vectorized pass when it is installed;
+otherwise the same scoring runs in pure Python.
+"""
+
+import math
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+LEVELS = ('easy', 'medium', 'hard')
+
+FEATURES = ('length', 'syllables', 'rarity', 'definition', 'senses')
+
+# Headword features count fully; definition length and sense count are weaker signals
+WEIGHTS = {
+    'length': 1.0,
+    'syllables': 1.0,
+    'rarity': 1.0,
+    'definition': 0.5,
+    'senses': 0.5,
+}
+
+# Scores are rounded before ranking so both backends order ties the same way
+SCORE_DIGITS = 9
+
+VOWELS = b'aeiouy'
+VOWEL_GROUP = re.compile(r'[aeiouy]+')
+
+
+def _headword(entry):
+    return entry['word'].lower().encode('utf-8')
+
+
+def _definition_words(entry):
+    return len((entry.get('definition') or '').split())
+
+
+def _sense_count(entry):
+    return len(entry.get('senses') or ()) or 1
+
+
+def _python_features(entries):
+    words = [_headword(entry) for entry in entries]
+    counts = {}
+    for word in words:
+        for byte in word:
+            counts[byte] = counts.get(byte, 0) + 1
+    total = sum(counts.values())
+    rarity = {byte: -math.log(count / total) for byte, count in counts.items()}
+
+    columns = {feature: [] for feature in FEATURES}
+    for entry, word in zip(entries, words):
+        text = word.decode('utf-8')
+        syllables = len(VOWEL_GROUP.findall(text))
+        # A final silent 'e' ('glade') does not add a syllable, '-le' ('fickle') does
+        if syllables > 1 and text.endswith('e') and not text.endswith('le'):
+            syllables -= 1
+        columns['length'].append(len(word))
+        columns['syllables'].append(max(syllables, 1))
+        columns['rarity'].append(sum(rarity[b] for b in word) / len(word) if word else 0.0)
+        columns['definition'].append(_definition_words(entry))
+        columns['senses'].append(_sense_count(entry))
+    return columns
+
+
+def _numpy_features(entries):
+    words = [_headword(entry) for entry in entries]
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    width = max(int(lengths.max()), 1)
+    # One row of bytes per headword, zero padded
+    chars = np.frombuffer(b''.join(w.ljust(width, b'\0') for w in words), dtype=np.uint8)
+    chars = chars.reshape(len(words), width)
+    present = chars != 0
+
+    vowel = np.isin(chars, np.frombuffer(VOWELS, dtype=np.uint8))
+    group_start = vowel.copy()
+    group_start[:, 1:] &= ~vowel[:, :-1]
+    syllables = group_start.sum(axis=1)
+    rows = np.arange(len(words))
+    last = chars[rows, np.maximum(lengths - 1, 0)]
+    before_last = chars[rows, np.maximum(lengths - 2, 0)]
+    silent_e = (syllables > 1) & (last == ord('e')) & ~((before_last == ord('l')) & (lengths > 1))
+    syllables = np.maximum(syllables - silent_e, 1)
+
+    counts = np.bincount(chars[present], minlength=256)
+    with np.errstate(divide='ignore'):
+        letter_rarity = np.where(counts > 0, -np.log(counts / counts.sum()), 0.0)
+    rarity = np.where(present, letter_rarity[chars], 0.0).sum(axis=1)
+    rarity = np.divide(rarity, lengths, out=np.zeros(len(words)), where=lengths > 0)
+
+    return {
+        'length': lengths,
+        'syllables': syllables,
+        'rarity': rarity,
+        'definition': np.fromiter((_definition_words(e) for e in entries), dtype=np.int64, count=len(entries)),
+        'senses': np.fromiter((_sense_count(e) for e in entries), dtype=np.int64, count=len(entries)),
+    }
+
+
+def _python_scores(columns, weights):
+    count = len(columns['length'])
+    scores = [0.0] * count
+    for feature in FEATURES:
+        values = columns[feature]
+        mean = math.fsum(values) / count
+        std = math.sqrt(math.fsum((v - mean) ** 2 for v in values) / count)
+        if not std:
+            continue
+        weight = weights.get(feature, 0.0)
+        for i, value in enumerate(values):
+            scores[i] += weight * ((value - mean) / std)
+    return [round(score, SCORE_DIGITS) for score in scores]
+
+
+def _numpy_scores(columns, weights):
+    scores = np.zeros(len(columns['length']))
+    for feature in FEATURES:
+        values = columns[feature].astype(np.float64)
+        mean = values.mean()
+        std = values.std()
+        if not std:
+            continue
+        scores += weights.get(feature, 0.0) * ((values - mean) / std)
+    return np.round(scores, SCORE_DIGITS)
+
+
+def _resolve_backend(use_numpy):
+    if use_numpy is None:
+        return np is not None
+    if use_numpy and np is None:
+        raise RuntimeError('NumPy is not installed')
+    return use_numpy
+
+
+def score_entries(entries, weights=None, use_numpy=None):
+    """Return the difficulty score of each entry, higher meaning harder."""
+    weights = weights or WEIGHTS
+    if not entries:
+        return []
+    if _resolve_backend(use_numpy):
+        return _numpy_scores(_numpy_features(entries), weights).tolist()
+    return _python_scores(_python_features(entries), weights)
+
+
+def _bucket_indexes(entries, weights, bucket_count, use_numpy):
+    """Return each entry's bucket number from the rank of its score."""
+    count = len(entries)
+    if _resolve_backend(use_numpy):
+        scores = _numpy_scores(_numpy_features(entries), weights)
+        order = np.lexsort((np.array([entry['word'] for entry in entries]), scores))
+        buckets = np.empty(count, dtype=np.int64)
+        buckets[order] = np.arange(count) * bucket_count // count
+        return buckets.tolist()
+
+    scores = _python_scores(_python_features(entries), weights)
+    order = sorted(range(count), key=lambda i: (scores[i], entries[i]['word']))
+    buckets = [0] * count
+    for rank, i in enumerate(order):
+        buckets[i] = rank * bucket_count // count
+    return buckets
+
+
+def assign_difficulty(entries, weights=None, levels=LEVELS, use_numpy=None):
+    """Score the corpus and set entry['difficulty'] by percentile bucket.
+
+    Entries without a headword are left untouched. Ties are ordered by
+    headword, so the result does not depend on the input order. Returns a
+    {level: count} dict.
+    """
+    scored = [entry for entry in entries if entry.get('word')]
+    counts = dict.fromkeys(levels, 0)
+    if not scored:
+        return counts
+
+    buckets = _bucket_indexes(scored, weights or WEIGHTS, len(levels), use_numpy)
+    for entry, bucket in zip(scored, buckets):
+        level = levels[bucket]
+        entry['difficulty'] = level
+        counts[level] += 1
+    return counts
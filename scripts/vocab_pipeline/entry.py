@@ -0,0 +1,89 @@
+"""
+Compact entry type for the parse pipeline.
+
+VocabEntry stores its fields in __slots__ instead of a per-entry dict and
+interns partOfSpeech and difficulty, which repeat across the whole corpus.
+It supports the dict operations the pipeline uses (entry['word'],
+entry.get(...), item assignment, keys(), dict(entry)) so stages and
+cleanups work on either representation.
+"""
+
+import sys
+
+FIELDS = ('word', 'partOfSpeech', 'definition', 'exampleSentence')
+# Only written out when set, so existing datasets round-trip unchanged
+OPTIONAL_FIELDS = ('difficulty', 'senses')
+ALL_FIELDS = FIELDS + OPTIONAL_FIELDS
+
+_MISSING = object()
+
+
+def _intern(value):
+    return sys.intern(value) if value is not None else None
+
+
+class VocabEntry:
+    """One vocabulary entry with slot-based storage."""
+
+    __slots__ = ALL_FIELDS
+
+    def __init__(self, word, partOfSpeech=None, definition=None, exampleSentence=None,
+                 difficulty=None, senses=None):
+        self.word = word
+        self.partOfSpeech = _intern(partOfSpeech)
+        self.definition = definition
+        self.exampleSentence = exampleSentence
+        self.difficulty = _intern(difficulty)
+        self.senses = senses
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build an entry from a dataset dict, ignoring unknown keys."""
+        return cls(**{field: data[field] for field in ALL_FIELDS if field in data})
+
+    def keys(self):
+        return [field for field in ALL_FIELDS
+                if field in FIELDS or getattr(self, field) is not None]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __contains__(self, field):
+        return field in self.keys()
+
+    def __getitem__(self, field):
+        if field not in ALL_FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        if field not in ALL_FIELDS:
+            raise KeyError(field)
+        if field in ('partOfSpeech', 'difficulty'):
+            value = _intern(value)
+        setattr(self, field, value)
+
+    def get(self, field, default=None):
+        return getattr(self, field) if field in self else default
+
+    def to_dict(self):
+        """Return the entry as a plain dict in dataset field order."""
+        return {field: getattr(self, field) for field in self.keys()}
+
+    def __eq__(self, other):
+        if isinstance(other, (VocabEntry, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f'VocabEntry({self.to_dict()!r})'
+
+
+def to_json(obj):
+    """json.dump default hook that serializes VocabEntry objects."""
+    if isinstance(obj, VocabEntry):
+        return obj.to_dict()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
@@ -0,0 +1,113 @@
+"""
+Golden-file verification of parsed output.
+
+The expected dataset is indexed by headword once; produced entries are then
+streamed past the index, so each lookup is a dict access and the whole
+check is linear in the size of both datasets.
+"""
+
+
+def index_by_word(entries):
+    """Index entries by headword, keeping the first of any duplicates.
+
+    Returns (index, duplicates) where duplicates lists repeated headwords.
+    """
+    index = {}
+    duplicates = []
+    for entry in entries:
+        word = entry['word']
+        if word in index:
+            duplicates.append(word)
+        else:
+            index[word] = entry
+    return index, duplicates
+
+
+def diff_entry(expected, actual, fields=None):
+    """Return {field: [expected, actual]} for every field that differs."""
+    keys = fields or set(expected.keys()) | set(actual.keys())
+    return {
+        field: [expected.get(field), actual.get(field)]
+        for field in sorted(keys)
+        if expected.get(field) != actual.get(field)
+    }
+
+
+def diff_datasets(expected_entries, actual_entries, fields=None):
+    """Compare two datasets by headword and return a structured report.
+
+    The report holds 'added' and 'removed' headwords, 'changed' entries with
+    their per-field differences, 'duplicates' in either dataset and a
+    'summary' of counts. Only the expected dataset is held in memory.
+    """
+    expected, expected_duplicates = index_by_word(expected_entries)
+    remaining = set(expected)
+    seen = set()
+    added = []
+    changed = []
+    actual_duplicates = []
+    unchanged = 0
+
+    for entry in actual_entries:
+        word = entry['word']
+        if word in seen:
+            actual_duplicates.append(word)
+            continue
+        seen.add(word)
+
+        golden = expected.get(word)
+        if golden is None:
+            added.append(word)
+            continue
+        remaining.discard(word)
+
+        differences = diff_entry(golden, entry, fields)
+        if differences:
+            changed.append({'word': word, 'fields': differences})
+        else:
+            unchanged += 1
+
+    removed = sorted(remaining)
+    return {
+        'summary': {
+            'expected': len(expected),
+            'actual': len(seen),
+            'unchanged': unchanged,
+            'added': len(added),
+            'removed': len(removed),
+            'changed': len(changed),
+        },
+        'added': added,
+        'removed': removed,
+        'changed': changed,
+        'duplicates': {
+            'expected': expected_duplicates,
+            'actual': actual_duplicates,
+        },
+    }
+
+
+def report_ok(report):
+    """Return True if the report shows no added, removed or changed entries."""
+    summary = report['summary']
+    return not (summary['added'] or summary['removed'] or summary['changed'])
+
+
+def format_report(report, limit=20):
+    """Return the report as printable lines, at most limit entries per category."""
+    summary = report['summary']
+    lines = [
+        f"Expected {summary['expected']}, got {summary['actual']}: "
+        f"{summary['unchanged']} unchanged, {summary['changed']} changed, "
+        f"{summary['added']} added, {summary['removed']} removed"
+    ]
+    lines += [f"  + {word}" for word in report['added'][:limit]]
+    lines += [f"  - {word}" for word in report['removed'][:limit]]
+    for change in report['changed'][:limit]:
+        lines.append(f"  ~ {change['word']}")
+        for field, (expected, actual) in change['fields'].items():
+            lines.append(f"      {field}: {expected!r} -> {actual!r}")
+    for name, words in report['duplicates'].items():
+        if words:
+            lines.append(f"  ! {len(words)} duplicate headwords in {name} dataset")
+    return lines
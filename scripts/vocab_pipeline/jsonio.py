@@ -0,0 +1,113 @@
+"""
+Streaming reader and writer for the vocab dataset.
+
+Two layouts are supported: the JSON array used by data/sats_vocab.json
+(written byte-for-byte like json.dump(..., indent=2)) and NDJSON, one
+compact entry per line. Both read and write one entry at a time, so memory
+stays flat as the dataset grows.
+"""
+
+import json
+import os
+
+from .entry import to_json
+
+READ_SIZE = 1 << 16
+
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
+
+
+def detect_format(path):
+    """Return 'ndjson' for .ndjson/.jsonl paths and 'json' otherwise."""
+    return 'ndjson' if str(path).endswith(NDJSON_SUFFIXES) else 'json'
+
+
+def _iter_json_array(f):
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        # Skip whitespace and separators, refilling the buffer as needed
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            more = f.read(READ_SIZE)
+            if not more:
+                eof = True
+            buf = buf[pos:] + more
+            pos = 0
+
+        if pos >= len(buf):
+            raise ValueError('Unexpected end of JSON array')
+
+        if not started:
+            if buf[pos] != '[':
+                raise ValueError('Expected a JSON array')
+            started = True
+            pos += 1
+            continue
+
+        if buf[pos] == ']':
+            return
+
+        try:
+            obj, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            more = f.read(READ_SIZE)
+            if not more:
+                raise
+            buf = buf[pos:] + more
+            pos = 0
+            continue
+
+        yield obj
+        pos = end
+
+
+def read_entries(path):
+    """Yield entries from a JSON array or NDJSON file one at a time."""
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+
+        if first == '[':
+            yield from _iter_json_array(f)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def write_entries(path, entries, fmt=None):
+    """Stream entries to path and return how many were written.
+
+    The file is written to a temporary path and moved into place, so a
+    dataset can be read and rewritten in the same pass.
+    """
+    fmt = fmt or detect_format(path)
+    tmp_path = f'{path}.tmp'
+    count = 0
+
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        if fmt == 'ndjson':
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, default=to_json))
+                f.write('\n')
+                count += 1
+        else:
+            for entry in entries:
+                f.write('[\n  ' if count == 0 else ',\n  ')
+                f.write(json.dumps(entry, indent=2, ensure_ascii=False, default=to_json).replace('\n', '\n  '))
+                count += 1
+            f.write('\n]' if count else '[]')
+
+    os.replace(tmp_path, path)
+    return count
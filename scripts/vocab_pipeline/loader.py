@@ -0,0 +1,214 @@
+"""
+Bulk loader from parsed entries into the Word table.
+
+Rows are prepared with the same rules as scripts/import-vocab.ts (skip
+placeholders and incomplete entries, lowercase headwords, JSON-encode
+synonym lists, copy the precomputed difficulty or fall back to the
+length-based rule) and written in one transaction: batched executemany for
+SQLite, COPY for PostgreSQL.
+
+By default rows are upserted by headword: new words are inserted and
+existing ones get the new content but keep their id, so flashcard and
+crossword progress survives a reload. Words missing from the dataset are
+left alone; `npm run db:import` also removes them. replace=True clears Word
+and every table that references it first, wiping all learner progress.
+"""
+
+import json
+import os
+import sqlite3
+import string
+import time
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
+
+BATCH_SIZE = 1000
+
+WORD_COLUMNS = (
+    'id', 'word', 'partOfSpeech', 'definition', 'synonyms',
+    'exampleSentence', 'difficulty', 'createdAt',
+)
+
+# Columns an upsert overwrites; id and createdAt of an existing word are kept
+UPDATE_COLUMNS = ('partOfSpeech', 'definition', 'synonyms', 'exampleSentence', 'difficulty')
+
+REPLACE_WARNING = (
+    '⚠️  Replacing the Word table: all flashcard and crossword progress '
+    'and every crossword will be deleted'
+)
+
+# Tables cleared before a full reload, children first (see import-vocab.ts)
+DEPENDENT_TABLES = ('FlashcardProgress', 'CrosswordWord', 'CrosswordProgress', 'Crossword', 'Word')
+
+_BASE36 = string.digits + string.ascii_lowercase
+
+
+def _base36(number, width):
+    digits = []
+    while number:
+        number, digit = divmod(number, 36)
+        digits.append(_BASE36[digit])
+    return ''.join(reversed(digits)).rjust(width, '0')[-width:]
+
+
+def new_id(counter):
+    """Return a 25-character cuid-style id ('c' + time + counter + random)."""
+    random_part = _base36(int.from_bytes(os.urandom(8), 'big'), 12)
+    return 'c' + _base36(int(time.time() * 1000), 8) + _base36(counter, 4) + random_part
+
+
+def determine_difficulty(word, definition):
+    """Length-based difficulty, matching determineDifficulty in import-vocab.ts."""
+    if len(word) <= 5 and len(definition) <= 50:
+        return 'easy'
+    if len(word) >= 10 or len(definition) >= 100:
+        return 'hard'
+    return 'medium'
+
+
+def word_rows(entries, stats=None):
+    """Yield Word rows as dicts, skipping placeholders, incomplete entries and duplicates."""
+    stats = stats if stats is not None else {}
+    stats.setdefault('skipped', 0)
+    seen = set()
+    for counter, entry in enumerate(entries):
+        if entry.get('_note') or entry.get('_source') or entry.get('_format'):
+            continue
+        if not entry.get('word') or not entry.get('definition'):
+            stats['skipped'] += 1
+            continue
+
+        word = entry['word'].lower().strip()
+        if word in seen:
+            stats['skipped'] += 1
+            continue
+        seen.add(word)
+
+        synonyms = entry.get('synonyms')
+        if isinstance(synonyms, list):
+            synonyms = json.dumps(synonyms)
+        elif not isinstance(synonyms, str):
+            synonyms = None
+
+        yield {
+            'id': new_id(counter),
+            'word': word,
+            'partOfSpeech': entry.get('partOfSpeech') or None,
+            'definition': entry['definition'],
+            'synonyms': synonyms,
+            'exampleSentence': entry.get('exampleSentence') or None,
+            'difficulty': entry.get('difficulty') or determine_difficulty(word, entry['definition']),
+        }
+
+
+def _batches(rows, size):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def upsert_sql(source):
+    """Return the INSERT that upserts Word rows from source by headword."""
+    columns = ', '.join(f'"{column}"' for column in WORD_COLUMNS)
+    updates = ', '.join(f'"{column}" = excluded."{column}"' for column in UPDATE_COLUMNS)
+    return f'INSERT INTO "Word" ({columns}) {source} ON CONFLICT ("word") DO UPDATE SET {updates}'
+
+
+def _count(stats, row, existing):
+    stats['imported'] += 1
+    stats['updated' if row['word'] in existing else 'inserted'] += 1
+
+
+def load_sqlite(db_path, entries, replace=False, batch_size=BATCH_SIZE):
+    """Upsert entries into a Prisma SQLite database in one transaction.
+
+    With replace=True, Word and its dependent tables are cleared first.
+    Returns a stats dict with 'imported' (inserted + updated), 'inserted',
+    'updated' and 'skipped' counts.
+    """
+    stats = {'imported': 0, 'inserted': 0, 'updated': 0, 'skipped': 0}
+    placeholders = ', '.join('?' for _ in WORD_COLUMNS)
+    sql = upsert_sql(f'VALUES ({placeholders})')
+
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            if replace:
+                for table in DEPENDENT_TABLES:
+                    conn.execute(f'DELETE FROM "{table}"')
+            existing = {word for (word,) in conn.execute('SELECT "word" FROM "Word"')}
+            # Prisma stores SQLite DateTime values as milliseconds since the epoch
+            created_at = int(time.time() * 1000)
+            for batch in _batches(word_rows(entries, stats), batch_size):
+                conn.executemany(sql, [
+                    tuple(row[column] for column in WORD_COLUMNS[:-1]) + (created_at,)
+                    for row in batch
+                ])
+                for row in batch:
+                    _count(stats, row, existing)
+    finally:
+        conn.close()
+    return stats
+
+
+def load_postgres(dsn, entries, replace=False):
+    """Stream entries into PostgreSQL with COPY and upsert them in one transaction.
+
+    Rows are copied into a temporary table and merged into Word with one
+    INSERT ... ON CONFLICT. With replace=True, Word and its dependent tables
+    are cleared first. Requires the psycopg (v3) package. Returns the same
+    stats dict as load_sqlite.
+    """
+    if psycopg is None:
+        raise RuntimeError('PostgreSQL loading requires psycopg: pip install "psycopg[binary]"')
+
+    stats = {'imported': 0, 'inserted': 0, 'updated': 0, 'skipped': 0}
+    columns = ', '.join(f'"{column}"' for column in WORD_COLUMNS)
+    created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    with psycopg.connect(dsn) as conn:
+        with conn.cursor() as cur:
+            if replace:
+                for table in DEPENDENT_TABLES:
+                    cur.execute(f'DELETE FROM "{table}"')
+            cur.execute('SELECT "word" FROM "Word"')
+            existing = {word for (word,) in cur}
+            cur.execute('CREATE TEMP TABLE "WordLoad" (LIKE "Word" INCLUDING DEFAULTS) ON COMMIT DROP')
+            with cur.copy(f'COPY "WordLoad" ({columns}) FROM STDIN') as copy:
+                for row in word_rows(entries, stats):
+                    copy.write_row(tuple(row[column] for column in WORD_COLUMNS[:-1]) + (created_at,))
+                    _count(stats, row, existing)
+            cur.execute(upsert_sql(f'SELECT {columns} FROM "WordLoad"'))
+    return stats
+
+
+def sqlite_path_from_url(url, prisma_dir):
+    """Resolve a Prisma 'file:' URL, which is relative to the prisma/ directory."""
+    path = Path(url[len('file:'):])
+    return path if path.is_absolute() else Path(prisma_dir) / path
+
+
+def load(database_url, entries, prisma_dir, replace=False):
+    """Upsert entries into the database named by a Prisma DATABASE_URL.
+
+    replace=True clears Word and its dependent tables first.
+    """
+    if database_url.startswith('file:'):
+        return load_sqlite(sqlite_path_from_url(database_url, prisma_dir), entries, replace)
+    if database_url.startswith(('postgres://', 'postgresql://')):
+        return load_postgres(database_url, entries, replace)
+    raise ValueError(f'Unsupported DATABASE_URL {database_url!r}')
+
+
+def default_database_url():
+    """Return DATABASE_URL from the environment, or the README's SQLite default."""
+    return os.environ.get('DATABASE_URL', 'file:./prisma/sat_vocab.db')
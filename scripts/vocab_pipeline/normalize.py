@@ -0,0 +1,126 @@
+"""
+Lexical normalization shared by the parse pipeline and the legacy scripts.
+
+Part-of-speech labels go through a lookup table built once from the ordered
+POS_RULES, with an LRU cache in front for spellings outside the table, and
+trailing stopwords are stripped by a single precompiled pattern. Build a
+Normalizer with other rules or stopwords, or call configure() to replace the
+default one used by the module-level functions.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+
+# Ordered (pattern, label) rules, matched against the lowercased label.
+# The first match wins, so 'adverb' never reaches the 'verb' rule.
+POS_RULES = (
+    (r'adj', 'adjective'),
+    (r'adv', 'adverb'),
+    (r'^n\.|^n$|noun', 'noun'),
+    (r'^v\.|^v$|verb', 'verb'),
+    (r'prep', 'preposition'),
+    (r'conj', 'conjunction'),
+)
+
+# The rules of the older 'word (pos)' parse scripts: abbreviations only, any
+# other label is kept as written
+ABBREVIATION_POS_RULES = (
+    (r'adj', 'adjective'),
+    (r'adv', 'adverb'),
+    (r'^n\.|^n$', 'noun'),
+    (r'^v\.|^v$', 'verb'),
+)
+
+# Spellings precomputed into the lookup table
+POS_SPELLINGS = (
+    'adj', 'adj.', 'adv', 'adv.', 'n', 'n.', 'v', 'v.', 'prep', 'prep.',
+    'conj', 'conj.', 'pron', 'pron.', 'interj', 'interj.',
+    'noun', 'verb', 'adjective', 'adverb', 'preposition', 'conjunction',
+)
+
+# Words a cut-off definition can end on
+STOPWORDS = (
+    'the', 'a', 'an', 'which', 'that', 'when', 'where', 'who', 'what', 'how',
+    'are', 'is', 'was', 'were', 'be', 'not', 'to', 'of', 'in', 'on', 'at',
+    'for', 'with', 'from', 'and', 'or', 'but', 'so', 'if', 'as', 'well',
+)
+
+CACHE_SIZE = 1024
+
+
+class Normalizer:
+    """Normalizes part-of-speech labels and trailing stopwords."""
+
+    def __init__(self, pos_rules=POS_RULES, stopwords=STOPWORDS, extra_pos=None,
+                 cache_size=CACHE_SIZE):
+        self.pos_rules = tuple((re.compile(pattern), label) for pattern, label in pos_rules)
+        self.stopwords = tuple(stopwords)
+        self.pos_table = {}
+        for spelling in POS_SPELLINGS:
+            label = self._match_rules(spelling)
+            if label:
+                self.pos_table[spelling] = label
+        self.pos_table.update((k.lower(), v) for k, v in (extra_pos or {}).items())
+        self.trailing_stopword = re.compile(
+            r'\s+(?:' + '|'.join(re.escape(word) for word in self.stopwords) + r')$',
+            re.IGNORECASE,
+        )
+        self.normalize_pos = lru_cache(maxsize=cache_size)(self._normalize_pos)
+
+    def _match_rules(self, pos_lower):
+        for pattern, label in self.pos_rules:
+            if pattern.search(pos_lower):
+                return label
+        return None
+
+    def _normalize_pos(self, pos_str):
+        if not pos_str:
+            return None
+        pos_lower = pos_str.lower().strip()
+        return self.pos_table.get(pos_lower) or self._match_rules(pos_lower) or pos_str.strip()
+
+    def trim_stopwords(self, text, min_length=0):
+        """Strip one trailing stopword from text longer than min_length."""
+        if len(text) > min_length:
+            text = self.trailing_stopword.sub('', text).strip()
+        return text
+
+    def fingerprint(self):
+        """Hash the configuration, so caches keyed on parse output can tell it changed."""
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(repr(([(p.pattern, label) for p, label in self.pos_rules],
+                            sorted(self.pos_table.items()), self.stopwords)).encode())
+        return digest.hexdigest()
+
+
+def join_lines(text):
+    """Strip text and join its lines with single spaces."""
+    text = text.strip()
+    if '\n' in text:
+        text = ' '.join(line.strip() for line in text.split('\n'))
+    return text
+
+
+_default = Normalizer()
+
+
+def configure(**options):
+    """Replace the default normalizer; options are Normalizer arguments."""
+    global _default
+    _default = Normalizer(**options)
+    return _default
+
+
+def get_normalizer():
+    return _default
+
+
+def normalize_pos(pos_str):
+    """Convert a part of speech abbreviation to the full word."""
+    return _default.normalize_pos(pos_str)
+
+
+def trim_stopwords(text, min_length=0):
+    """Strip one trailing stopword from text longer than min_length."""
+    return _default.trim_stopwords(text, min_length)
@@ -0,0 +1,68 @@
+"""
+Multi-process parsing of large sources.
+
+The source is cut into pieces at lines the tokenizer always treats as entry
+boundaries (blank lines and entry heads), so each piece tokenizes exactly
+as it would inside a serial run. Pieces are parsed in a process pool and
+their results are yielded in input order, keeping the output identical to
+parse_file.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .parser import TOKEN_STAGES, parse_tokens
+from .reader import read_chunks
+from .tokenizer import BOUNDARY_LINE, tokenize
+
+PIECE_SIZE = 1 << 20
+
+
+def _last_boundary(text):
+    """Return the index of the newline before the last boundary line, or -1."""
+    cut = text.rfind('\n')
+    while cut != -1:
+        if BOUNDARY_LINE.match(text, cut + 1):
+            return cut
+        cut = text.rfind('\n', 0, cut)
+    return -1
+
+
+def iter_pieces(chunks):
+    """Regroup chunks of whole lines into pieces that end at entry boundaries."""
+    carry = ''
+    for chunk in chunks:
+        text = carry + '\n' + chunk if carry else chunk
+        cut = _last_boundary(text)
+        if cut <= 0:
+            carry = text
+            continue
+        yield text[:cut]
+        carry = text[cut + 1:]
+    if carry:
+        yield carry
+
+
+def _parse_piece(text, stage_list):
+    return list(parse_tokens(tokenize([text]), stage_list))
+
+
+def parse_file_parallel(path, jobs=None, stage_list=TOKEN_STAGES, piece_size=PIECE_SIZE):
+    """Parse a source file in a process pool, yielding entries in file order.
+
+    At most two pieces per worker are in flight, so memory stays bounded by
+    the piece size rather than the file size.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    worker = partial(_parse_piece, stage_list=stage_list)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for piece in iter_pieces(read_chunks(path, piece_size)):
+            pending.append(pool.submit(worker, piece))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,77 @@
+"""
+Parenthesis structure of an entry's text, computed once.
+
+The definition, example and cleanup heuristics all need the same facts
+about an entry: where its balanced top-level parentheticals are and where
+a cut-off one starts. ParenIndex collects them with a single C-level scan
+for paren characters, so callers query spans instead of walking the text
+character by character.
+"""
+
+import re
+
+PAREN = re.compile(r'[()]')
+
+
+class ParenIndex:
+    """Top-level balanced paren spans and the unclosed tail of a text.
+
+    spans: (open, close) index pairs of complete top-level parentheticals,
+        in order; stray ')' characters are ignored.
+    """
+
+    __slots__ = ('text', 'spans')
+
+    def __init__(self, text):
+        self.text = text
+        self.spans = []
+        depth = 0
+        start = -1
+        for match in PAREN.finditer(text):
+            pos = match.start()
+            if text[pos] == '(':
+                if depth == 0:
+                    start = pos
+                depth += 1
+            elif depth:
+                depth -= 1
+                if depth == 0:
+                    self.spans.append((start, pos))
+
+    def content(self, span):
+        """Return the stripped text inside a span's parentheses."""
+        return self.text[span[0] + 1:span[1]].strip()
+
+    def last_span(self):
+        """Return the last complete top-level span, or None."""
+        return self.spans[-1] if self.spans else None
+
+    def last_example_span(self, min_length=0):
+        """Return the last span whose content starts with a capital letter.
+
+        Only spans longer than min_length characters are considered.
+        """
+        for span in reversed(self.spans):
+            content = self.content(span)
+            if content and content[0].isupper() and len(content) > min_length:
+                return span
+        return None
+
+    def without_tail(self):
+        """Return the text with a cut-off trailing parenthetical removed.
+
+        The cut starts at the first '(' after the last ')', the same text the
+        scripts' trailing-paren regex used to drop; an earlier unclosed '('
+        followed by complete parentheticals is kept.
+        """
+        start = self.text.find('(', self.text.rfind(')') + 1)
+        if start == -1:
+            return self.text
+        return self.text[:start].rstrip()
+
+    def prefix(self, end):
+        """Return the index of text[:end] without rescanning it."""
+        index = ParenIndex.__new__(ParenIndex)
+        index.text = self.text[:end]
+        index.spans = [span for span in self.spans if span[1] < end]
+        return index
@@ -0,0 +1,90 @@
+"""
+Staged parser: runs entries through an ordered list of stages.
+"""
+
+from . import stages
+from .entry import VocabEntry
+from .normalize import normalize_pos
+from .reader import read_chunks
+from .tokenizer import tokenize
+
+# Stages for entries that already went through the tokenizer, which has
+# split off the head, merged entries and later senses. The clean stages are
+# the trailing ones that only tidy the definition text.
+CLEAN_STAGES = (
+    stages.trim_definition,
+)
+TOKEN_STAGES = (
+    stages.extract_example,
+) + CLEAN_STAGES
+
+# Stages for raw entry blocks from reader.iter_blocks.
+DEFAULT_STAGES = (
+    stages.split_head,
+    stages.cut_merged_entry,
+) + TOKEN_STAGES
+
+
+def apply_stages(entry, stage_list):
+    """Run a working entry dict through the stages, or return None if one drops it."""
+    for stage in stage_list:
+        entry = stage(entry)
+        if entry is None:
+            return None
+    return entry
+
+
+def build_entry(entry):
+    """Build the output entry from a fully staged working dict."""
+    return VocabEntry(
+        entry['word'],
+        entry.get('partOfSpeech'),
+        entry['definition'],
+        entry.get('exampleSentence'),
+    )
+
+
+def run_stages(entry, stage_list):
+    """Run a working entry dict through the stages and build the output entry."""
+    entry = apply_stages(entry, stage_list)
+    return build_entry(entry) if entry is not None else None
+
+
+def parse_block(text, stage_list=DEFAULT_STAGES):
+    """Parse one raw entry block into a vocab entry, or None if it is not one."""
+    return run_stages({'text': text}, stage_list)
+
+
+def parse_entries(blocks, stage_list=DEFAULT_STAGES):
+    """Yield parsed entries for an iterable of raw entry blocks."""
+    for block in blocks:
+        entry = parse_block(block, stage_list)
+        if entry:
+            yield entry
+
+
+def token_entry(token):
+    """Return the working entry dict for a tokenizer Token."""
+    return {
+        'word': token.word,
+        'partOfSpeech': normalize_pos(token.pos),
+        'rest': token.body,
+    }
+
+
+def parse_token(token, stage_list=TOKEN_STAGES):
+    """Parse one tokenizer Token into a vocab entry, or None."""
+    return run_stages(token_entry(token), stage_list)
+
+
+def parse_tokens(tokens, stage_list=TOKEN_STAGES):
+    """Yield parsed entries for an iterable of tokenizer Tokens."""
+    for token in tokens:
+        entry = parse_token(token, stage_list)
+        if entry:
+            yield entry
+
+
+def parse_file(path, stage_list=TOKEN_STAGES):
+    """Lazily parse a source file, yielding entries one at a time."""
+    return parse_tokens(tokenize(read_chunks(path)), stage_list)
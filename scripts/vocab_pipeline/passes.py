@@ -0,0 +1,53 @@
+"""
+Fused cleanup passes over a parsed dataset.
+
+Any ordered set of cleanups runs over each entry in a single traversal, so
+the dataset is read and written once no matter how many passes are
+selected. Each pass keeps its own change count and time.
+"""
+
+import time
+
+from . import cleanups
+
+PASSES = {
+    'fix-definitions': cleanups.clean_incomplete_examples,
+    'fix-merged-entries': cleanups.clean_merged_definition,
+    'clean-definitions-only': cleanups.clean_core_definition,
+}
+
+
+class CleanupPass:
+    """One cleanup applied to a single entry field, with change count and time."""
+
+    def __init__(self, name, func, field='definition'):
+        self.name = name
+        self.func = func
+        self.field = field
+        self.changed = 0
+        self.seconds = 0.0
+
+    def apply(self, entry):
+        start = time.perf_counter()
+        original = entry.get(self.field, '')
+        cleaned = self.func(original)
+        if cleaned != original:
+            entry[self.field] = cleaned
+            self.changed += 1
+        self.seconds += time.perf_counter() - start
+
+
+def build_passes(names):
+    """Build CleanupPass objects for the given pass names, in order."""
+    unknown = [name for name in names if name not in PASSES]
+    if unknown:
+        raise ValueError(f"Unknown cleanup pass(es): {', '.join(unknown)}; expected {', '.join(PASSES)}")
+    return [CleanupPass(name, PASSES[name]) for name in names]
+
+
+def run_passes(entries, passes):
+    """Yield each entry after applying every pass to it in order."""
+    for entry in entries:
+        for cleanup in passes:
+            cleanup.apply(entry)
+        yield entry
@@ -0,0 +1,148 @@
+"""
+Per-stage profiling for the vocab scripts.
+
+PipelineProfile.stage(name) records the wall and CPU time of a block of
+work and how many items it produced, and can dump a cProfile per stage.
+The metrics are written as JSON, so runs before and after a parser change
+can be compared stage by stage. A disabled profile runs the same code
+without measuring anything.
+
+With trace_memory=True it also records the peak traced memory of each
+stage (and dumps a tracemalloc snapshot next to the cProfile). tracemalloc
+hooks every allocation and slows the parse stages several times over, so
+times from a traced run are inflated: take timings from a run without it
+and peak memory from a separate traced run.
+"""
+
+import cProfile
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .parser import CLEAN_STAGES, TOKEN_STAGES, apply_stages, build_entry, token_entry
+from .reader import read_chunks
+from .tokenizer import tokenize
+
+METRICS_FORMAT = 1
+
+
+class PipelineProfile:
+    """Collects per-stage metrics; pass enabled=False for a no-op profile."""
+
+    def __init__(self, enabled=True, dump_dir=None, trace_memory=False):
+        self.enabled = enabled
+        self.dump_dir = Path(dump_dir) if dump_dir else None
+        self.trace_memory = enabled and trace_memory
+        self.stages = []
+        self._owns_tracing = False
+        if enabled:
+            if self.dump_dir:
+                self.dump_dir.mkdir(parents=True, exist_ok=True)
+            if self.trace_memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+
+    @contextmanager
+    def stage(self, name):
+        """Measure the enclosed block; set record['items'] to its output size."""
+        record = {'stage': name, 'items': None}
+        if not self.enabled:
+            yield record
+            return
+
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            retained_before = tracemalloc.get_traced_memory()[0]
+        profiler = cProfile.Profile() if self.dump_dir else None
+        if profiler:
+            profiler.enable()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] = time.perf_counter() - wall
+            record['cpu_seconds'] = time.process_time() - cpu
+            if profiler:
+                profiler.disable()
+            record['peak_bytes'] = record['retained_bytes'] = None
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record['peak_bytes'] = peak
+                record['retained_bytes'] = current - retained_before
+            if self.dump_dir:
+                profiler.dump_stats(self.dump_dir / f'{name}.prof')
+                if self.trace_memory:
+                    tracemalloc.take_snapshot().dump(str(self.dump_dir / f'{name}.tracemalloc'))
+            self.stages.append(record)
+
+    def run(self, name, func, *args, **kwargs):
+        """Call func under stage(name) and record len() of its result."""
+        with self.stage(name) as record:
+            result = func(*args, **kwargs)
+            record['items'] = len(result)
+        return result
+
+    def to_dict(self, **meta):
+        return {
+            'format': METRICS_FORMAT,
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'argv': sys.argv,
+            **meta,
+            'memory_traced': self.trace_memory,
+            'stages': self.stages,
+            'total': {
+                'wall_seconds': sum(s['wall_seconds'] for s in self.stages),
+                'cpu_seconds': sum(s['cpu_seconds'] for s in self.stages),
+                'peak_bytes': max((s['peak_bytes'] for s in self.stages), default=0)
+                if self.trace_memory else None,
+            },
+        }
+
+    def format_table(self):
+        """Return the metrics as printable lines."""
+        lines = [f"  {'stage':<10} {'wall (ms)':>10} {'cpu (ms)':>10} {'items':>10} {'peak MiB':>9}"]
+        for s in self.stages:
+            items = s['items'] if s['items'] is not None else '-'
+            peak = f"{s['peak_bytes'] / (1 << 20):.1f}" if s['peak_bytes'] is not None else '-'
+            lines.append(
+                f"  {s['stage']:<10} {s['wall_seconds'] * 1000:>10.1f} {s['cpu_seconds'] * 1000:>10.1f} "
+                f"{items:>10} {peak:>9}"
+            )
+        if self.trace_memory:
+            lines.append('  (memory traced: times are inflated; time a run without --profile-memory)')
+        return lines
+
+    def write(self, path, **meta):
+        """Stop tracing and write the metrics JSON to path."""
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(**meta), f, indent=2, default=str)
+            f.write('\n')
+
+
+def _apply_all(entries, stage_list):
+    staged = (apply_stages(entry, stage_list) for entry in entries)
+    return [entry for entry in staged if entry is not None]
+
+
+def profile_parse(path, profile):
+    """Parse a source file one stage at a time under profile.
+
+    Each stage's output is materialized so read, segment, parse and clean
+    are measured separately; this trades the streaming memory profile of
+    parse_file for per-stage numbers.
+    """
+    parse_stages = TOKEN_STAGES[:len(TOKEN_STAGES) - len(CLEAN_STAGES)]
+    chunks = profile.run('read', list, read_chunks(path))
+    tokens = profile.run('segment', list, tokenize(chunks))
+    working = profile.run('parse', _apply_all, map(token_entry, tokens), parse_stages)
+    return profile.run('clean', lambda: [build_entry(e) for e in _apply_all(working, CLEAN_STAGES)])
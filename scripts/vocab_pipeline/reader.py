@@ -0,0 +1,75 @@
+"""
+Lazy line reading and entry-boundary detection.
+"""
+
+import re
+
+ENTRY_START = re.compile(r'^[a-z]+\s*(?:\(|1\.)', re.IGNORECASE)
+# The older parse scripts only start an entry at 'word (pos)'; a 'word 1.'
+# line continues the previous block. They keep that rule so their output
+# does not change.
+PAREN_ENTRY_START = re.compile(r'^[a-z]+\s*\(', re.IGNORECASE)
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_lines(path):
+    """Yield stripped lines from the source file one at a time."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield line.strip()
+
+
+def read_chunks(path, size=CHUNK_SIZE):
+    """Yield the source in chunks of whole lines, without the final newline.
+
+    Memory stays bounded by the chunk size regardless of the file size.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tail = ''
+        while True:
+            data = f.read(size)
+            if not data:
+                break
+            data = tail + data
+            cut = data.rfind('\n')
+            if cut == -1:
+                tail = data
+                continue
+            yield data[:cut]
+            tail = data[cut + 1:]
+        if tail:
+            yield tail
+
+
+def is_entry_start(line):
+    """Return True if the line starts a new entry: word (pos) or word 1. (pos)."""
+    return bool(ENTRY_START.match(line))
+
+
+def is_paren_entry_start(line):
+    """Return True if the line starts a new entry under the older rule: word (pos)."""
+    return bool(PAREN_ENTRY_START.match(line))
+
+
+def iter_blocks(lines, is_start=is_entry_start):
+    """Group lines into raw entry blocks, yielding each block as one string.
+
+    A block ends at a blank line or when the next line starts a new entry.
+    """
+    current = []
+    for line in lines:
+        if not line:
+            if current:
+                yield ' '.join(current)
+                current = []
+            continue
+
+        if is_start(line) and current:
+            yield ' '.join(current)
+            current = [line]
+        else:
+            current.append(line)
+
+    if current:
+        yield ' '.join(current)
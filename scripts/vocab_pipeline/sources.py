@@ -0,0 +1,154 @@
+"""
+Multi-source ingestion through format adapters.
+
+A source is a path, optionally prefixed with its format ('csv:list.txt').
+Without a prefix the format follows the suffix: .csv/.tsv exports, .json /
+.ndjson / .jsonl entry lists, and text dumps for everything else. Each
+source is read and parsed in its own worker process, and the results come
+back in the order the sources were given, so merging them with dedupe
+resolves duplicate headwords the same way on every run.
+"""
+
+import csv
+import os
+import re
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .jsonio import read_entries
+from .normalize import normalize_pos
+from .parser import parse_file
+
+# Column names accepted in CSV exports for each dataset field, as compared
+# after header_key ('Part of Speech' and 'part_of_speech' both match)
+CSV_COLUMNS = {
+    'word': ('word', 'headword', 'term'),
+    'partOfSpeech': ('partofspeech', 'pos'),
+    'definition': ('definition', 'meaning', 'definitions'),
+    'exampleSentence': ('examplesentence', 'example'),
+    'synonyms': ('synonyms',),
+    'difficulty': ('difficulty',),
+}
+
+SUFFIX_FORMATS = {
+    '.csv': 'csv',
+    '.tsv': 'csv',
+    '.json': 'json',
+    '.ndjson': 'json',
+    '.jsonl': 'json',
+}
+
+
+def read_text_source(path):
+    """Parse a raw text dump with the tokenizer engine."""
+    return list(parse_file(path))
+
+
+def header_key(column):
+    """Lowercase a CSV header and drop spaces, underscores and hyphens."""
+    return re.sub(r'[\s_-]+', '', column.lower())
+
+
+def map_columns(fieldnames, path='CSV'):
+    """Map dataset fields to the CSV columns that hold them.
+
+    Warns about every column that matches no field, since its values are
+    dropped (a part-of-speech column under an unexpected name, say).
+    """
+    columns = {}
+    for column in fieldnames or ():
+        key = header_key(column)
+        for field, names in CSV_COLUMNS.items():
+            if key in names and field not in columns:
+                columns[field] = column
+                break
+        else:
+            if key:
+                warnings.warn(
+                    f'{path}: column {column!r} is not mapped to a dataset field and is ignored',
+                    stacklevel=3,
+                )
+    return columns
+
+
+def _column(row, columns, field):
+    column = columns.get(field)
+    return (row.get(column) or '').strip() if column else ''
+
+
+def read_csv_source(path):
+    """Read a CSV/TSV export, mapping its columns onto dataset fields."""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        dialect = csv.excel_tab if str(path).endswith('.tsv') else csv.excel
+        reader = csv.DictReader(f, dialect=dialect)
+        columns = map_columns(reader.fieldnames, path)
+        if 'word' not in columns or 'definition' not in columns:
+            raise ValueError(f'{path}: CSV needs a word and a definition column')
+
+        entries = []
+        for row in reader:
+            word = _column(row, columns, 'word').lower()
+            definition = _column(row, columns, 'definition')
+            if not word or not definition:
+                continue
+            entry = {
+                'word': word,
+                'partOfSpeech': normalize_pos(_column(row, columns, 'partOfSpeech')),
+                'definition': definition,
+                'exampleSentence': _column(row, columns, 'exampleSentence') or None,
+            }
+            for field in ('synonyms', 'difficulty'):
+                value = _column(row, columns, field)
+                if value:
+                    entry[field] = value
+            entries.append(entry)
+        return entries
+
+
+def read_json_source(path):
+    """Read an existing JSON array or NDJSON entry list."""
+    entries = []
+    for entry in read_entries(path):
+        if entry.get('word') and entry.get('definition'):
+            entry['word'] = entry['word'].strip().lower()
+            entries.append(entry)
+    return entries
+
+
+ADAPTERS = {
+    'text': read_text_source,
+    'csv': read_csv_source,
+    'json': read_json_source,
+}
+
+
+def parse_source_spec(spec):
+    """Split 'format:path' (or a bare path) into (format, Path)."""
+    spec = str(spec)
+    fmt, sep, rest = spec.partition(':')
+    if sep and fmt in ADAPTERS:
+        return fmt, Path(rest)
+    path = Path(spec)
+    return SUFFIX_FORMATS.get(path.suffix.lower(), 'text'), path
+
+
+def read_source(spec):
+    """Read one source through its adapter and return its entries."""
+    fmt, path = parse_source_spec(spec)
+    return ADAPTERS[fmt](path)
+
+
+def read_sources(specs, jobs=None):
+    """Read sources concurrently, yielding (spec, entries) in the given order."""
+    specs = list(specs)
+    jobs = min(jobs or os.cpu_count() or 1, len(specs)) or 1
+    if jobs == 1:
+        for spec in specs:
+            yield spec, read_source(spec)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(read_source, spec) for spec in specs]
+        for spec, future in zip(specs, futures):
+            yield spec, future.result()
@@ -0,0 +1,85 @@
+"""
+Parse stages for a single raw entry block.
+
+Each stage takes the working entry dict and returns it (possibly modified),
+or None to drop the block. The working dict starts as {'text': block} and
+the head stage fills in 'word', 'partOfSpeech' and 'rest'. The example
+stage stores a ParenIndex for the definition under 'parens' so later stages
+can query the paren structure without rescanning.
+"""
+
+import re
+
+from .normalize import normalize_pos, trim_stopwords
+from .parens import ParenIndex
+
+HEAD = re.compile(r'^([a-z]+)\s*(?:1\.\s*)?\(([^)]+)\)\s+(.+)$', re.IGNORECASE | re.DOTALL)
+NEXT_SENSE = re.compile(r'\s+2\.\s*\(')
+# A merged entry looks like 'word (pos) ...' with a short abbreviation in the
+# parentheses, which keeps example sentences in parentheses from matching.
+MERGED_ENTRY = re.compile(r'\s+([a-z]+)\s*(?:1\.\s*)?\(([a-z]{1,5}\.?)\)\s', re.IGNORECASE)
+
+
+def split_head(entry):
+    """Split 'word (pos) rest' or 'word 1. (pos) rest' into its parts."""
+    match = HEAD.match(entry['text'].strip())
+    if not match:
+        return None
+    entry['word'] = match.group(1).lower()
+    entry['partOfSpeech'] = normalize_pos(match.group(2))
+    rest = match.group(3).strip()
+
+    # Numbered senses: keep only the first one
+    sense = NEXT_SENSE.search(rest)
+    if sense:
+        rest = rest[:sense.start()].strip()
+
+    entry['rest'] = rest
+    return entry
+
+
+def cut_merged_entry(entry):
+    """Cut the body off where a following 'word (pos)' entry was merged in."""
+    match = MERGED_ENTRY.search(entry['rest'])
+    if match:
+        entry['rest'] = entry['rest'][:match.start()].strip()
+    return entry
+
+
+def _paren_index(entry):
+    """Return the entry's ParenIndex for its current definition, building it if stale."""
+    index = entry.get('parens')
+    if index is None or index.text is not entry['definition']:
+        index = entry['parens'] = ParenIndex(entry['definition'])
+    return index
+
+
+def extract_example(entry):
+    """Split the trailing complete parenthetical example off the definition."""
+    text = entry['rest']
+    index = ParenIndex(text)
+    entry['exampleSentence'] = None
+
+    span = index.last_span()
+    if span:
+        example = index.content(span)
+        # Example sentences start with a capital letter
+        if example and example[0].isupper():
+            entry['exampleSentence'] = example
+            index = index.prefix(span[0])
+            index.text = index.text.rstrip()
+
+    entry['definition'] = index.text
+    entry['parens'] = index
+    return entry
+
+
+def trim_definition(entry):
+    """Drop cut-off parentheticals, dangling stopwords and trailing punctuation."""
+    definition = _paren_index(entry).without_tail()
+    definition = trim_stopwords(definition, min_length=20)
+    definition = definition.rstrip(',').rstrip('.').strip()
+    if not definition:
+        return None
+    entry['definition'] = definition
+    return entry
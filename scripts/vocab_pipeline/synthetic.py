@@ -0,0 +1,92 @@
+"""
+Synthetic source corpus generator for benchmarks.
+
+Produces text in the layout of the SAT source dump, including the cases the
+parsers have to handle: entries wrapped over several lines, numbered
+senses, two entries merged onto one line, example sentences cut off before
+their closing parenthesis and duplicate headwords.
+"""
+
+import random
+import textwrap
+
+SYLLABLES = [c + v for c in 'bcdfglmnprstv' for v in 'aeiou']
+POS_ABBREVIATIONS = ['adj.', 'n.', 'v.', 'adv.']
+DEFINITION_WORDS = (
+    'to make or become greater quiet calm strong honest unable unwilling '
+    'related to the state of being having a tendency showing lacking '
+    'excessive pride praise harm speech manner person who group of people '
+    'something that cannot be changed easily understood with great care'
+).split()
+EXAMPLE_WORDS = (
+    'the old professor was always quite sure that his students would '
+    'remember every detail of the lecture after they left the hall and '
+    'went home to the city where nobody ever listened'
+).split()
+
+# Share of entries that exercise each hard case
+MIX = {
+    'numbered': 0.10,
+    'merged': 0.08,
+    'truncated': 0.10,
+    'duplicate': 0.05,
+}
+
+
+def headword(index):
+    """Return a unique pronounceable headword for an index."""
+    letters = []
+    index += len(SYLLABLES)
+    while index:
+        index, digit = divmod(index, len(SYLLABLES))
+        letters.append(SYLLABLES[digit])
+    return ''.join(reversed(letters))
+
+
+def _phrase(rng, vocabulary, low, high):
+    return ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(low, high)))
+
+
+def _sense(rng, truncated=False):
+    pos = rng.choice(POS_ABBREVIATIONS)
+    definition = _phrase(rng, DEFINITION_WORDS, 2, 10)
+    example = _phrase(rng, EXAMPLE_WORDS, 6, 20).capitalize()
+    if truncated:
+        return f'({pos}) {definition} ({example}'
+    return f'({pos}) {definition} ({example}.)'
+
+
+def iter_entries(count, seed=0, mix=MIX):
+    """Yield the raw text of count synthetic entries, one string each."""
+    rng = random.Random(seed)
+    for index in range(count):
+        roll = rng.random()
+        word = headword(index)
+
+        if roll < mix['duplicate'] and index:
+            word = headword(rng.randrange(index))
+            roll = 1.0
+        roll -= mix['duplicate']
+
+        if roll < mix['numbered']:
+            yield f'{word} 1. {_sense(rng)} 2. {_sense(rng)}'
+        elif roll < mix['numbered'] + mix['merged']:
+            other = headword(count + index)
+            yield f'{word} {_sense(rng)} {other} {_sense(rng)}'
+        elif roll < mix['numbered'] + mix['merged'] + mix['truncated']:
+            yield f'{word} {_sense(rng, truncated=True)}'
+        else:
+            yield f'{word} {_sense(rng)}'
+
+
+def write_corpus(path, count, seed=0, width=72):
+    """Write a synthetic corpus of count entries, wrapped at width columns."""
+    rng = random.Random(seed + 1)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('SAT Vocabulary\n\n')
+        for text in iter_entries(count, seed):
+            for line in textwrap.wrap(text, width, break_long_words=False, break_on_hyphens=False):
+                f.write(line)
+                f.write('\n')
+            if rng.random() < 0.2:
+                f.write('\n')
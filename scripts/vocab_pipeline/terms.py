@@ -0,0 +1,223 @@
+"""
+Inverted index from definition terms to headwords.
+
+Definitions are split into normalized terms (lowercase letters only, no
+stopwords or words under three letters, plurals folded to the singular).
+Each term maps to a posting list of the headwords whose definitions use it,
+and each headword keeps its own term list for related-word suggestions.
+
+Layout (all integers little-endian):
+
+    header    'SATI', version u16, reserved u16, word count u32,
+              term count u32, words offset u32, terms offset u32,
+              postings offset u32, strings offset u32, strings size u32
+    words     word count x (offset u32, length u32, start u32, count u32),
+              sorted by UTF-8 headword; start/count locate the word's
+              term numbers in the postings area
+    terms     term count x (offset u32, length u32, start u32, count u32),
+              sorted by UTF-8 term; start/count locate the term's word
+              numbers in the postings area
+    postings  u32 word numbers per term, then u32 term numbers per word,
+              each list ascending
+    strings   UTF-8 string table
+
+Queries are ranked by how many query terms a headword matches, then by the
+summed inverse document frequency of those terms. lib/vocab-terms.ts reads
+the same file and must tokenize queries the same way.
+"""
+
+import math
+import mmap
+import re
+import struct
+
+from .normalize import STOPWORDS
+
+MAGIC = b'SATI'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHIIIIIII')
+ROW = struct.Struct('<IIII')
+POSTING = struct.Struct('<I')
+
+MIN_TERM_LENGTH = 3
+TERM = re.compile(r'[a-z]+')
+# Keep in sync with lib/vocab-terms.ts
+INDEX_STOPWORDS = frozenset(STOPWORDS) | frozenset((
+    'about', 'any', 'been', 'being', 'by', 'etc', 'had', 'has', 'have', 'having',
+    'her', 'his', 'into', 'its', 'more', 'most', 'one', 'out', 'someone',
+    'something', 'than', 'their', 'them', 'this', 'very',
+))
+
+
+def normalize_term(token):
+    """Fold a lowercase token to its index form ('qualities' -> 'quality')."""
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+
+def definition_terms(text):
+    """Return the distinct index terms of a text in first-seen order."""
+    terms = {}
+    for token in TERM.findall((text or '').lower()):
+        if len(token) < MIN_TERM_LENGTH or token in INDEX_STOPWORDS:
+            continue
+        terms.setdefault(normalize_term(token), None)
+    return list(terms)
+
+
+def _entry_text(entry):
+    parts = [entry.get('definition') or '']
+    parts += [sense.get('definition') or '' for sense in entry.get('senses') or ()]
+    return ' '.join(parts)
+
+
+def write_index(path, entries):
+    """Build the term index for entries, write it to path and return (words, terms)."""
+    word_terms = {}
+    for entry in entries:
+        word = entry.get('word')
+        if not word:
+            continue
+        terms = word_terms.setdefault(word, {})
+        for term in definition_terms(_entry_text(entry)):
+            terms.setdefault(term, None)
+
+    words = sorted(word_terms, key=lambda w: w.encode('utf-8'))
+    term_postings = {}
+    for number, word in enumerate(words):
+        for term in word_terms[word]:
+            term_postings.setdefault(term, []).append(number)
+    terms = sorted(term_postings, key=lambda t: t.encode('utf-8'))
+    term_numbers = {term: number for number, term in enumerate(terms)}
+
+    strings = bytearray()
+    postings = []
+
+    def add_string(value):
+        data = value.encode('utf-8')
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    term_rows = bytearray()
+    for term in terms:
+        posting_list = term_postings[term]
+        term_rows += ROW.pack(*add_string(term), len(postings), len(posting_list))
+        postings += posting_list
+
+    word_rows = bytearray()
+    for word in words:
+        forward = sorted(term_numbers[term] for term in word_terms[word])
+        word_rows += ROW.pack(*add_string(word), len(postings), len(forward))
+        postings += forward
+
+    words_offset = HEADER.size
+    terms_offset = words_offset + len(word_rows)
+    postings_offset = terms_offset + len(term_rows)
+    strings_offset = postings_offset + len(postings) * POSTING.size
+    header = HEADER.pack(
+        MAGIC, VERSION, 0, len(words), len(terms),
+        words_offset, terms_offset, postings_offset, strings_offset, len(strings),
+    )
+
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.write(word_rows)
+        f.write(term_rows)
+        f.write(struct.pack(f'<{len(postings)}I', *postings))
+        f.write(strings)
+    return len(words), len(terms)
+
+
+class TermIndex:
+    """Memory-mapped reader for a definition term index."""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _, self.word_count, self.term_count, self._words,
+         self._terms, self._postings, self._strings, _) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f'{path} is not a version {VERSION} term index')
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _row(self, table, number):
+        return ROW.unpack_from(self._map, table + number * ROW.size)
+
+    def _string(self, offset, length):
+        start = self._strings + offset
+        return self._map[start:start + length]
+
+    def _list(self, start, count):
+        return struct.unpack_from(f'<{count}I', self._map, self._postings + start * POSTING.size)
+
+    def _find(self, table, count, key):
+        low, high = 0, count
+        while low < high:
+            mid = (low + high) // 2
+            offset, length, _, _ = self._row(table, mid)
+            value = self._string(offset, length)
+            if value < key:
+                low = mid + 1
+            elif value > key:
+                high = mid
+            else:
+                return mid
+        return None
+
+    def headword(self, number):
+        offset, length, _, _ = self._row(self._words, number)
+        return self._string(offset, length).decode('utf-8')
+
+    def postings(self, term):
+        """Return the word numbers whose definitions use an index term."""
+        number = self._find(self._terms, self.term_count, term.encode('utf-8'))
+        if number is None:
+            return ()
+        return self._list(*self._row(self._terms, number)[2:])
+
+    def _idf(self, document_count):
+        return math.log((self.word_count + 1) / document_count)
+
+    def _rank(self, term_numbers, limit, exclude=None):
+        matches = {}
+        for number in term_numbers:
+            posting_list = self._list(*self._row(self._terms, number)[2:])
+            idf = self._idf(len(posting_list))
+            for word_number in posting_list:
+                if word_number == exclude:
+                    continue
+                hits, score = matches.get(word_number, (0, 0.0))
+                matches[word_number] = (hits + 1, score + idf)
+        ranked = sorted(matches.items(), key=lambda item: (-item[1][0], -item[1][1], item[0]))
+        return [(self.headword(number), score) for number, (_, score) in ranked[:limit]]
+
+    def search(self, query, limit=20):
+        """Return [(headword, score)] for definitions matching a free-text query."""
+        term_numbers = []
+        for term in definition_terms(query):
+            number = self._find(self._terms, self.term_count, term.encode('utf-8'))
+            if number is not None:
+                term_numbers.append(number)
+        return self._rank(term_numbers, limit)
+
+    def related(self, word, limit=10):
+        """Return [(headword, score)] whose definitions share terms with word's."""
+        number = self._find(self._words, self.word_count, word.encode('utf-8'))
+        if number is None:
+            return []
+        return self._rank(self._list(*self._row(self._words, number)[2:]), limit, exclude=number)
@@ -0,0 +1,135 @@
+"""
+Single-pass tokenizer for entry boundaries.
+
+Each chunk of text is cut at entry boundaries (blank lines and entry heads
+at the start of a line) by one precompiled split pattern, so the regex
+engine hands back the heads and the text between them in a single C-level
+scan. Python code then runs once per entry rather than once per line or
+per match. The '(pos)' markers of merged entries ('word (pos)') and later
+numbered senses ('2. (n.)') inside a line are searched for only in the text
+of the entry that contains them.
+"""
+
+import re
+from collections import namedtuple
+from itertools import chain
+
+Token = namedtuple('Token', ['word', 'pos', 'body'])
+
+# Part-of-speech abbreviations accepted for entries found mid-line. Heads at
+# the start of a line accept any lowercase parenthetical, as before.
+POS = r'(?:adj|adv|n|v|prep|conj|pron|interj|noun|verb|adjective|adverb)\.?'
+
+# An entry head at the start of a line: word (pos) or word 1. (pos)
+HEAD = r'[ \t]*(?P<hword>[A-Za-z]+)[ \t]*(?:1\.[ \t]*)?\((?P<hpos>[a-z][^)\n]{0,15})\)'
+
+# Splits stripped lines at boundaries: blank lines (no groups) and entry
+# heads (headword and pos groups). Possessive quantifiers let a line that
+# is not a head fail without backtracking through its first word.
+BOUNDARY = re.compile(
+    r'\n(?:(?=\n|\Z)|([A-Za-z]++)[ \t]*+(?:1\.[ \t]*+)?\(([a-z][^)\n]{0,15})\))'
+)
+
+# A '(pos)' marker inside a line
+MARKER = re.compile(rf'\(({POS})\)(?!\S)')
+
+# A line the tokenizer always treats as an entry boundary (blank or head)
+BOUNDARY_LINE = re.compile(rf'[ \t]*(?:\n|\Z)|{HEAD}')
+
+
+def _split_marker_prefix(prefix):
+    """Classify the text before a mid-line '(pos)' marker.
+
+    Returns (kind, text, word): kind is 'sense' for '2.'..'9.', 'entry' for a
+    headword (optionally followed by '1.'), or None; text is the body text
+    that precedes the sense number or headword.
+    """
+    prefix = prefix.rstrip()
+    if len(prefix) >= 2 and prefix[-1] == '.' and prefix[-2].isdigit():
+        if len(prefix) > 2 and not prefix[-3].isspace():
+            return None, prefix, None
+        if prefix[-2] != '1':
+            return 'sense', prefix[:-2], None
+        prefix = prefix[:-2].rstrip()
+
+    cut = max(prefix.rfind(' '), prefix.rfind('\n')) + 1
+    word = prefix[cut:]
+    if word and word.isascii() and word.isalpha():
+        return 'entry', prefix[:cut], word
+    return None, prefix, None
+
+
+def tokenize(chunks):
+    """Yield a Token(word, pos, body) for each entry in the text chunks.
+
+    Each chunk holds one or more whole lines joined by newlines, without a
+    trailing newline, so both read_lines() and read_chunks() output work.
+    Only the first numbered sense of an entry is kept in its body. Text
+    before the first entry head (titles, page headers) is ignored.
+    """
+    word = pos = None
+    body = []
+    in_later_sense = False
+    # The text after a chunk's last boundary is held back and split again
+    # with the next chunk, so an entry is tokenized the same wherever the
+    # chunks are cut (a merged headword can end one line and its marker
+    # start the next)
+    carry = ''
+    has_marker = MARKER.search
+
+    for chunk in chain(chunks, (None,)):
+        if chunk is None:
+            parts = [carry]
+        else:
+            lines = '\n'.join(map(str.strip, chunk.split('\n')))
+            parts = BOUNDARY.split(carry + '\n' + lines)
+            # The last boundary opens its entry now; its text waits for
+            # the rest of the entry in the next chunk
+            carry = parts[-1]
+            parts[-1] = ''
+
+        # parts: text, then (headword, pos, text) for every boundary, with
+        # headword None at blank lines; the leading text continues the
+        # entry that was open at the end of the previous chunk
+        for index in range(0, len(parts), 3):
+            if index:
+                if word:
+                    yield Token(word, pos, ' '.join(body))
+                word = parts[index - 2]
+                if word is not None:
+                    word = word.lower()
+                    pos = parts[index - 1]
+                    body = []
+                    in_later_sense = False
+
+            text = parts[index]
+            if has_marker(text):
+                last = 0
+                for match in MARKER.finditer(text):
+                    kind, prefix, marker_word = _split_marker_prefix(text[last:match.start()])
+                    if kind is None:
+                        continue
+                    if word and not in_later_sense:
+                        prefix = prefix.strip().replace('\n', ' ')
+                        if prefix:
+                            body.append(prefix)
+                    last = match.end()
+
+                    if kind == 'sense':
+                        in_later_sense = True
+                        continue
+                    if word:
+                        yield Token(word, pos, ' '.join(body))
+                    word, pos = marker_word.lower(), match.group(1)
+                    body = []
+                    in_later_sense = False
+                text = text[last:]
+
+            if word and not in_later_sense:
+                # Lines are already stripped, so joining them is a replace
+                text = text.strip().replace('\n', ' ')
+                if text:
+                    body.append(text)
+
+    if word:
+        yield Token(word, pos, ' '.join(body))